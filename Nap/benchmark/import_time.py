@@ -0,0 +1,75 @@
+"""
+import src.game の起動時間を計測する
+
+Usage:
+    python benchmark/import_time.py --repeat 10
+
+Note:
+    毎回新しいプロセスで import するので、キャッシュのない状態の時間となる
+    python -X importtime の結果から、時間のかかっているモジュールも表示する
+"""
+import argparse
+from pathlib import Path
+import statistics
+import subprocess
+import sys
+
+PROJECT_DIR = Path(__file__).parents[1].absolute()
+
+# 起動時に読み込まれていないことを確認するパッケージ
+HEAVY_MODULES = ["pandas", "PIL", "numpy"]
+
+def import_once(module: str) -> tuple[float, list[tuple[int, str]], list[str]]:
+    """
+    新しいプロセスでモジュールを import する
+
+    Args:
+        module (str): import するモジュール
+
+    Returns:
+        float: import にかかった時間 (秒)
+        list[tuple[int, str]]: 各モジュールの import にかかった時間 (マイクロ秒, モジュール名)
+        list[str]: 読み込まれた重いパッケージ
+    """
+    code = (
+        "import sys, time\n"
+        "start = time.perf_counter()\n"
+        f"import {module}\n"
+        "print(time.perf_counter() - start)\n"
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))\n"
+    )
+    completed = subprocess.run([sys.executable, "-X", "importtime", "-c", code],
+                               cwd = PROJECT_DIR, capture_output = True, text = True, check = True)
+    elapsed, loaded = completed.stdout.splitlines()
+
+    # import time:  self [us] | cumulative | imported package
+    cumulative_times = []
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        cumulative_times.append((int(cumulative), name.strip()))
+
+    return float(elapsed), cumulative_times, [m for m in loaded.split(",") if m]
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description = "起動時間の計測")
+    parser.add_argument("--module", default = "src.game", help = "import するモジュール")
+    parser.add_argument("--repeat", type = int, default = 10, help = "計測の回数")
+    parser.add_argument("--top", type = int, default = 10, help = "表示するモジュールの数")
+    args = parser.parse_args()
+
+    elapsed_list = []
+    for _ in range(args.repeat):
+        elapsed, cumulative_times, loaded = import_once(args.module)
+        elapsed_list.append(elapsed)
+
+    print(f"import {args.module}: median {statistics.median(elapsed_list) * 1000:.1f} ms "
+          f"(min {min(elapsed_list) * 1000:.1f} ms, {args.repeat} runs)")
+    print(f"heavy modules loaded: {', '.join(loaded) if loaded else 'none'}")
+    print("slowest imports (cumulative):")
+    for cumulative, name in sorted(cumulative_times, reverse = True)[:args.top]:
+        print(f"  {cumulative / 1000:8.1f} ms  {name}")
+
+if __name__ == "__main__":
+    main()
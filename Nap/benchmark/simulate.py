@@ -0,0 +1,77 @@
+"""
+Simulator のスループットを計測する
+
+Usage:
+    python benchmark/simulate.py --game EasyNapGame --num 10000
+    python benchmark/simulate.py --game EasyNapGame --num 10000 --engine
+
+Note:
+    手元 (1 コア) の計測 (マシンの負荷で 2 割ほど変わる)
+        軽量な経路 (Simulator.play_lean)
+            SimpleNapGame 約 3.4 ~ 3.6 万、EasyNapGame 約 2.6 ~ 2.7 万、EasyNapVSShizuka 約 2.1 万ゲーム/秒
+        ゲームのクラスで実行 (--engine)
+            SimpleNapGame 約 6 ~ 9 千、EasyNapGame 約 5 千、EasyNapVSShizuka 約 4 千ゲーム/秒
+        ビッドがあるゲームは、常にゲームのクラスで実行するので、毎秒数万ゲームには届いていない
+            NapGame (ランダムに宣言) は約 4.4 千ゲーム/秒
+            NapVSShizuka は BidAdvisor の計算が支配的で、EquityTable がなければ約 7 ゲーム/秒
+"""
+import argparse
+from pathlib import Path
+import sys
+import time
+
+PROJECT_DIR = Path(__file__).parents[1].absolute()
+sys.path.append(str(PROJECT_DIR))
+
+import src.game
+from src.game import (
+    Simulator,
+    GameLogWriter,
+    GameLogReader,
+)
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description = "Simulator のスループットの計測")
+    parser.add_argument("--game", default = "EasyNapGame", help = "src.game のゲームクラス名")
+    parser.add_argument("--num", type = int, default = 10000, help = "実行するゲームの数")
+    parser.add_argument("--seed", type = int, default = None, help = "各ゲームのシードを作成するためのシード")
+    parser.add_argument("--log", default = None, help = "ゲームのログを追記するファイルのパス")
+    parser.add_argument("--export", default = None, help = "列ごとに書き出すディレクトリ (npz)")
+    parser.add_argument("--engine", action = "store_true", help = "軽量な経路を使わずに、ゲームのクラスで実行する")
+    args = parser.parse_args()
+
+    if args.log and args.export:
+        parser.error("--log と --export は同時に指定できません")
+
+    if args.export:
+        writer = src.game.ColumnarExporter(args.export)
+    else:
+        writer = GameLogWriter(args.log) if args.log else None
+    simulator = Simulator(getattr(src.game, args.game), seed = args.seed, log_writer = writer, lean = not args.engine)
+
+    start = time.perf_counter()
+    simulator.run(args.num)
+    elapsed = time.perf_counter() - start
+
+    path = "engine" if simulator.lean_rule is None else "lean"
+    print(f"{args.game} ({path}): {args.num} games in {elapsed:.3f} s ({args.num / elapsed:,.0f} games/s)")
+
+    if writer is None:
+        return
+    writer.close()
+
+    if args.export:
+        return
+
+    # ログの読み込み
+    with GameLogReader(args.log) as reader:
+        start = time.perf_counter()
+        game_num = sum(1 for _ in reader)
+        elapsed = time.perf_counter() - start
+
+    size = Path(args.log).stat().st_size
+    print(f"log: {game_num} games, {size / game_num:.1f} bytes/game, "
+          f"read {game_num / elapsed:,.0f} games/s")
+
+if __name__ == "__main__":
+    main()
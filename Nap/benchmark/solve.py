@@ -0,0 +1,59 @@
+"""
+DoubleDummySolver で大量の配り方を解き、1 つあたりの時間を表示する
+
+Usage:
+    python benchmark/solve.py --players 3 --hand 5 --num 10000 --repeat 5
+
+Note:
+    時間は、同じ配り方を repeat 回解いた中で最も速いもの (と中央値)
+        置換表は毎回空の solver から始めるので、前の回の結果は使わない
+    手元 (1 コア) では、3 人 x 5 枚で最速 0.65 ~ 0.72 ms/deal (中央値 0.66 ~ 0.77 ms/deal)
+        2 人 x 5 枚で最速 0.24 ms/deal
+        マシンの負荷で 1 割ほど変わるので、比較は同じ実行の中で行う
+"""
+import argparse
+from collections import Counter
+from pathlib import Path
+import random
+import statistics
+import sys
+import time
+
+PROJECT_DIR = Path(__file__).parents[1].absolute()
+sys.path.append(str(PROJECT_DIR))
+
+from src.utils import Bitboard
+from src.game import DoubleDummySolver
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description = "double dummy の解析の速度")
+    parser.add_argument("--players", type = int, default = 3, help = "プレイヤー数")
+    parser.add_argument("--hand", type = int, default = 5, help = "手札の枚数")
+    parser.add_argument("--num", type = int, default = 10000, help = "解く配り方の数")
+    parser.add_argument("--repeat", type = int, default = 5, help = "計測の回数")
+    parser.add_argument("--seed", type = int, default = 0, help = "配り方のシード")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    deals = []
+    for _ in range(args.num):
+        card_ids = rng.sample(range(52), args.players * args.hand)
+        deals.append([Bitboard.from_ids(card_ids[i * args.hand:(i + 1) * args.hand]).mask
+                      for i in range(args.players)])
+
+    # Nap と同じく、席 0 をディクレアラーとし、最初の台札を切り札とする
+    elapsed_list = []
+    for _ in range(args.repeat):
+        solver = DoubleDummySolver()
+        start = time.perf_counter()
+        tricks = Counter(solver.solve(hands, 0, team = (0,), trump_from_lead = True) for hands in deals)
+        elapsed_list.append(time.perf_counter() - start)
+
+    best = min(elapsed_list)
+    median = statistics.median(elapsed_list)
+    print(f"{args.num} deals x {args.repeat}: best {best:.3f} s ({best / args.num * 1000:.3f} ms/deal), "
+          f"median {median / args.num * 1000:.3f} ms/deal, {solver.node_num / args.num:.1f} nodes/deal")
+    print("declarer tricks:", dict(sorted(tricks.items())))
+
+if __name__ == "__main__":
+    main()
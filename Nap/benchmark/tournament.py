@@ -0,0 +1,46 @@
+"""
+Tournament で対戦を大量に実行し、集計とスループットを表示する
+
+Usage:
+    python benchmark/tournament.py --game NapVSShizuka --num 100000 --workers 4
+"""
+import argparse
+from pathlib import Path
+import sys
+import time
+
+PROJECT_DIR = Path(__file__).parents[1].absolute()
+sys.path.append(str(PROJECT_DIR))
+
+import src.game
+from src.game import Tournament
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description = "対戦の集計")
+    parser.add_argument("--game", default = "EasyNapVSShizuka", help = "src.game のゲームクラス名")
+    parser.add_argument("--num", type = int, default = 100000, help = "実行するゲームの数")
+    parser.add_argument("--workers", type = int, default = None, help = "利用するプロセスの数")
+    parser.add_argument("--chunk", type = int, default = 500, help = "1 単位で実行するゲームの数")
+    parser.add_argument("--seed", type = int, default = None, help = "各ゲームのシードを作成するためのシード")
+    args = parser.parse_args()
+
+    tournament = Tournament(getattr(src.game, args.game),
+                            seed = args.seed,
+                            chunk_size = args.chunk,
+                            max_workers = args.workers)
+
+    start = time.perf_counter()
+    stats = tournament.run(args.num)
+    elapsed = time.perf_counter() - start
+
+    print(f"{args.game}: {args.num} games in {elapsed:.3f} s "
+          f"({args.num / elapsed:,.0f} games/s, {tournament.max_workers} workers)")
+    print(f"invalid: {stats.invalid_num}")
+    for name in sorted(stats.points):
+        line = f"{name}: win rate {stats.win_rate(name):.3f}, mean point {stats.mean_point(name):.3f}"
+        if stats.declarations:
+            line += f", achievement rate {stats.achievement_rate(name):.3f}"
+        print(line)
+
+if __name__ == "__main__":
+    main()
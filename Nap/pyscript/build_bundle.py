@@ -0,0 +1,144 @@
+"""
+pyscript.toml の [files] のソースコードを 1 つの zip にまとめる
+
+pyscript.toml のままでは、pyodide はモジュールごとにファイルを取得するので、起動までに何十回も通信する
+zip にまとめておけば、1 回の取得で済み、worker は zipimport で import する
+
+Usage:
+    python3 ./pyscript/build_bundle.py
+
+Note:
+    以下を作成する
+        dist/nap-{内容のハッシュ}.zip: ソースコードをまとめた zip (内容が変われば名前も変わる)
+        pyscript.bundle.toml: zip を /home/work/nap.zip に配置する設定
+    index.html の config を pyscript.bundle.toml にすると、zip を利用する
+    ソースコードを変更したら、作成し直す
+"""
+import argparse
+import hashlib
+import os
+from pathlib import Path
+import tomllib
+import zipfile
+
+PYSCRIPT_DIR = Path(__file__).parent.absolute()
+CONFIG_PATH = PYSCRIPT_DIR / "pyscript.toml"
+DIST_DIR = PYSCRIPT_DIR / "dist"
+BUNDLE_CONFIG_PATH = PYSCRIPT_DIR / "pyscript.bundle.toml"
+
+# worker.py で sys.path に追加する zip の配置先
+BUNDLE_PATH = "/home/work/nap.zip"
+# zip の中のパスの基準 (pyodide のファイルシステム上のディレクトリ)
+#   /home/work/src/... は src/...、/pyscript/pyscript/src/utils/... は utils/... となる
+ROOTS = ("/home/work/", "/pyscript/pyscript/src/")
+# zip の中のファイルの日時 (同じ内容からは同じ zip を作成する)
+ZIP_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+
+def collect_files(config: dict) -> dict[str, Path]:
+    """
+    pyscript.toml の [files] から、zip に含めるファイルを集める
+
+    Args:
+        config (dict): pyscript.toml の内容
+
+    Returns:
+        dict[str, Path]: zip の中のパスごとの、ファイルのパス
+    """
+    files = dict(config.get("files", {}))
+    placeholders = {key: value for key, value in files.items() if key.startswith("{") and key.endswith("}")}
+
+    def expand(path: str) -> str:
+        for key, value in placeholders.items():
+            path = path.replace(key, value)
+        return path
+
+    collected = {}
+    for source, target in files.items():
+        if source in placeholders:
+            continue
+
+        target = expand(target)
+        root = next((root for root in ROOTS if target.startswith(root)), None)
+        if root is None:
+            raise ValueError(f"zip にまとめられない配置先: {target}")
+        collected[target[len(root):]] = (PYSCRIPT_DIR / expand(source)).resolve()
+
+    return collected
+
+def add_package_inits(files: dict[str, bytes]) -> None:
+    """
+    __init__.py のないディレクトリに、空の __init__.py を追加する
+
+    Args:
+        files (dict[str, bytes]): zip の中のパスごとの内容
+
+    Note:
+        zipimport で、相対 import (from .button import ...) できるようにする
+    """
+    for arcname in list(files):
+        parts = arcname.split("/")[:-1]
+        for depth in range(1, len(parts) + 1):
+            init_name = "/".join(parts[:depth] + ["__init__.py"])
+            files.setdefault(init_name, b"")
+
+def build_bundle(config_path: Path = CONFIG_PATH, dist_dir: Path = DIST_DIR, bundle_config_path: Path = BUNDLE_CONFIG_PATH) -> Path:
+    """
+    ソースコードの zip と、zip を利用する設定を作成する
+
+    Args:
+        config_path (Path): 元の設定 (pyscript.toml)
+        dist_dir (Path): zip を作成するディレクトリ
+        bundle_config_path (Path): 作成する設定
+
+    Returns:
+        Path: 作成した zip
+    """
+    with open(config_path, "rb") as f:
+        config = tomllib.load(f)
+
+    files = {arcname: path.read_bytes() for arcname, path in collect_files(config).items()}
+    add_package_inits(files)
+
+    digest = hashlib.sha256()
+    for arcname in sorted(files):
+        digest.update(arcname.encode() + b"\0" + files[arcname] + b"\0")
+    bundle_path = dist_dir / f"nap-{digest.hexdigest()[:10]}.zip"
+
+    dist_dir.mkdir(parents = True, exist_ok = True)
+    for old_path in dist_dir.glob("nap-*.zip"):
+        if old_path != bundle_path:
+            old_path.unlink()
+
+    with zipfile.ZipFile(bundle_path, "w", compression = zipfile.ZIP_DEFLATED, compresslevel = 9) as bundle:
+        for arcname in sorted(files):
+            info = zipfile.ZipInfo(arcname, date_time = ZIP_DATE_TIME)
+            info.compress_type = zipfile.ZIP_DEFLATED
+            bundle.writestr(info, files[arcname])
+
+    packages = ", ".join(f'"{package}"' for package in config.get("packages", []))
+    relative_path = Path(os.path.relpath(bundle_path, bundle_config_path.parent)).as_posix()
+    bundle_config_path.write_text(
+        "# build_bundle.py で作成した設定 (編集しない)\n"
+        f"packages = [{packages}]\n"
+        "\n"
+        "[files]\n"
+        f'"./{relative_path}" = "{BUNDLE_PATH}"\n',
+        encoding = "utf-8")
+
+    return bundle_path
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description = "pyscript のソースコードを 1 つの zip にまとめる")
+    parser.add_argument("--config", type = Path, default = CONFIG_PATH, help = "元の設定")
+    parser.add_argument("--dist", type = Path, default = DIST_DIR, help = "zip を作成するディレクトリ")
+    parser.add_argument("--output", type = Path, default = BUNDLE_CONFIG_PATH, help = "作成する設定")
+    args = parser.parse_args()
+
+    bundle_path = build_bundle(args.config, args.dist, args.output)
+    with zipfile.ZipFile(bundle_path) as bundle:
+        file_num = len(bundle.namelist())
+    print(f"saved {bundle_path} ({file_num} files, {bundle_path.stat().st_size / 1024:.1f} KiB)")
+    print(f"saved {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,8 @@
 OPTION=${1}
 
+# index.html は、ソースコードをまとめた zip を利用するので、サーバーを立てる前に作成し直す
+python3 ./pyscript/build_bundle.py || exit 1
+
 if [ $OPTION == "pyscript" ]; then
     # pyscript の worker 上で terminal を実行するには、以下の設定が必要だったので、server.py を実装
     #   Cross-Origin-Opener-Policy: same-origin
@@ -3,20 +3,331 @@ pyscript の worker 上で terminal を実行するには、以下の設定が
   Cross-Origin-Opener-Policy: same-origin
   Cross-Origin-Embedder-Policy: require-corp
   Cross-Origin-Resource-Policy: cross-origin
+
+pyodide は wheel, .py, カードの画像などを並列に取得するので、以下の対応をしている
+  1. リクエストごとにスレッドで処理する (ThreadingHTTPServer)
+  2. keep-alive (HTTP/1.1) で、同じ接続を使い回す
+  3. ファイルは全て読み込まずに、sendfile で送る
+  4. 拡張子から Content-Type を決める
+
+再読み込みで同じファイルを送り直さないように、以下の対応をしている
+  1. ETag (更新日時と大きさ) と Last-Modified をつけ、変更がなければ 304 を返す
+  2. バージョンのついたパス (v.0.0 など) は immutable として、ブラウザに再検証させない
+  3. 小さいファイルは、メモリにキャッシュする (LRU)
+
+送る大きさを減らすために、以下の対応をしている
+  1. --compress で、ソースコードなどの .gz / .br を作成しておく (brotli がなければ .gz のみ)
+  2. Accept-Encoding に合わせて、圧縮したファイルを送る
+  3. Range (bytes=start-end) で、ファイルの一部を送る (途中から再開できる)
+
+Usage:
+    python3 ./pyscript/server/server.py --compress --directory .
+    python3 ./pyscript/server/server.py --port 8000 --directory .
 """
 
-from http.server import BaseHTTPRequestHandler
-import socketserver
+import argparse
+from collections import OrderedDict
+import gzip
+from email.utils import formatdate, parsedate_to_datetime
+from functools import partial
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import mimetypes
 import os
+import posixpath
+import re
+import stat
+import threading
+from urllib.parse import unquote, urlsplit
 
 PORT = 8000
 # カレントディレクトリを取得
 CWD = os.getcwd()
 
+# mimetypes に登録されていない、または環境によって異なる拡張子
+MIME_TYPES = {
+    ".html": "text/html",
+    ".js": "text/javascript",
+    ".mjs": "text/javascript",
+    ".css": "text/css",
+    ".json": "application/json",
+    ".py": "text/x-python",
+    ".toml": "application/toml",
+    ".wasm": "application/wasm",
+    ".whl": "application/zip",
+    ".zip": "application/zip",
+    # 圧縮したファイルを直接リクエストされた場合は、中身の種類ではなく圧縮したファイルとして送る
+    ".gz": "application/gzip",
+    ".br": "application/octet-stream",
+    ".png": "image/png",
+    ".svg": "image/svg+xml",
+    ".ico": "image/x-icon",
+}
+
+# バージョンのついたパス (asset/image/charactor/*/v.0.0/ など)、内容のハッシュのついたファイル (dist/nap-*.zip など)
+#   か、?v= のついたリクエスト
+VERSIONED_PATTERN = re.compile(r"/v\.?\d+(\.\d+)*/|-[0-9a-f]{10,}\.\w+(\?|$)|[?&]v=")
+# バージョンのついたパスは、内容が変わらないものとする
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+# それ以外は、毎回 ETag で確認させる
+REVALIDATE_CACHE_CONTROL = "no-cache"
+
+# 圧縮したファイルを用意する拡張子
+COMPRESSIBLE_EXTENSIONS = (".py", ".toml", ".css", ".html", ".js", ".mjs", ".json", ".svg", ".md", ".txt")
+# 圧縮の形式と、圧縮したファイルの拡張子 (優先する順)
+ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+# 圧縮したファイルを作成しないディレクトリ
+SKIP_DIRS = {".git", "__pycache__", ".pytest_cache", "node_modules"}
+
+def make_etag(file_stat: os.stat_result, encoding: str | None = None) -> str:
+    """
+    ファイルの ETag を作成する
+
+    Args:
+        file_stat (os.stat_result): ファイルの情報
+        encoding (str | None): 圧縮の形式
+
+    Returns:
+        str: 更新日時 (ns) と大きさ (と圧縮の形式) から作成した ETag
+    """
+    suffix = "" if encoding is None else f"-{encoding}"
+    return f'"{file_stat.st_mtime_ns:x}-{file_stat.st_size:x}{suffix}"'
+
+def parse_accept_encoding(header: str | None) -> set[str]:
+    """
+    Accept-Encoding から、受け取れる圧縮の形式を取り出す
+
+    Args:
+        header (str | None): Accept-Encoding
+
+    Returns:
+        set[str]: 受け取れる圧縮の形式 (q=0 のものは除く)
+    """
+    if not header:
+        return set()
+
+    encodings = set()
+    for item in header.split(","):
+        name, *params = [part.strip() for part in item.split(";")]
+        quality = 1.0
+        for param in params:
+            if param.startswith("q="):
+                try:
+                    quality = float(param[2:])
+                except ValueError:
+                    quality = 0.0
+        if name and quality > 0:
+            encodings.add(name.lower())
+    return encodings
+
+def parse_range(header: str | None, size: int) -> tuple[int, int] | None:
+    """
+    Range から、送る範囲を取り出す
+
+    Args:
+        header (str | None): Range
+        size (int): ファイルの大きさ
+
+    Returns:
+        tuple[int, int] | None: 送る範囲 (最初と最後の位置、最後を含む)
+            Range がない、形式が違う、複数の範囲の場合は None (全体を送る)
+
+    Raises:
+        ValueError: 範囲がファイルの外、または空のファイルの場合 (416 を返す)
+    """
+    if not header or not header.startswith("bytes=") or "," in header:
+        return None
+
+    start, sep, end = header[len("bytes="):].strip().partition("-")
+    if not sep or not (start or end) or not all(part.isdigit() for part in [start, end] if part):
+        return None
+    if size == 0:
+        # 空のファイルには、送れる範囲がない
+        raise ValueError(f"空のファイル: {header}")
+
+    if not start:
+        # 最後の end バイト
+        length = int(end)
+        if length == 0:
+            raise ValueError(f"範囲が空: {header}")
+        return max(size - length, 0), size - 1
+
+    first = int(start)
+    last = size - 1 if not end else min(int(end), size - 1)
+    if end and int(end) < first:
+        return None
+    if first >= size:
+        raise ValueError(f"範囲がファイルの外: {header}")
+    return first, last
+
+def compress_assets(directory: str, min_size: int = 256) -> list[str]:
+    """
+    公開するディレクトリのファイルを圧縮して、.gz / .br を隣に作成する
+
+    Args:
+        directory (str): 公開するディレクトリ
+        min_size (int): 圧縮するファイルの大きさの下限
+
+    Returns:
+        list[str]: 作成したファイルのパス
+
+    Note:
+        元のファイルより新しい圧縮したファイルがあれば、作成しない
+        brotli がなければ、.br は作成しない
+        gzip は mtime を 0 として、同じ内容からは同じファイルを作成する
+    """
+    try:
+        import brotli
+    except ImportError:
+        brotli = None
+
+    compressors = {"gzip": lambda content: gzip.compress(content, compresslevel = 9, mtime = 0)}
+    if brotli is not None:
+        compressors["br"] = lambda content: brotli.compress(content, quality = 11)
+
+    created = []
+    for root, dirs, files in os.walk(directory):
+        dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
+        for name in files:
+            if not name.endswith(COMPRESSIBLE_EXTENSIONS):
+                continue
+
+            path = os.path.join(root, name)
+            file_stat = os.stat(path)
+            if file_stat.st_size < min_size:
+                continue
+
+            content = None
+            for encoding, suffix in ENCODINGS:
+                if encoding not in compressors:
+                    continue
+                try:
+                    if os.stat(path + suffix).st_mtime_ns >= file_stat.st_mtime_ns:
+                        continue
+                except OSError:
+                    pass
+
+                if content is None:
+                    with open(path, "rb") as f:
+                        content = f.read()
+                compressed = compressors[encoding](content)
+                # 小さくならなければ作成しない
+                if len(compressed) >= len(content):
+                    continue
+                with open(path + suffix, "wb") as f:
+                    f.write(compressed)
+                created.append(path + suffix)
+
+    return created
+
+class FileCache:
+    """
+    小さいファイルの内容をメモリに保存する LRU のキャッシュ
+
+    Attributes:
+        max_bytes (int): 保存する合計の大きさの上限
+        max_file_size (int): 保存するファイルの大きさの上限
+
+    Note:
+        ETag ごとに保存するので、ファイルが更新されたら読み込み直す
+        リクエストはスレッドごとに処理するので、ロックをとって操作する
+    """
+    def __init__(self, max_bytes: int = 32 * 1024 * 1024, max_file_size: int = 256 * 1024):
+        """
+        Args:
+            max_bytes (int): 保存する合計の大きさの上限
+            max_file_size (int): 保存するファイルの大きさの上限
+        """
+        self.max_bytes = max_bytes
+        self.max_file_size = max_file_size
+        self._data = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def get(self, path: str, etag: str) -> bytes | None:
+        """
+        ファイルの内容を取得する
+
+        Args:
+            path (str): ファイルのパス
+            etag (str): 現在のファイルの ETag
+
+        Returns:
+            bytes | None: ファイルの内容 (ないか、ETag が違えば None)
+        """
+        with self._lock:
+            item = self._data.get(path)
+            if item is None or item[0] != etag:
+                return None
+            self._data.move_to_end(path)
+            return item[1]
+
+    def put(self, path: str, etag: str, content: bytes) -> None:
+        """
+        ファイルの内容を保存する
+
+        Args:
+            path (str): ファイルのパス
+            etag (str): ファイルの ETag
+            content (bytes): ファイルの内容
+
+        Note:
+            合計の大きさが上限を超えたら、最も長く参照されていないものから削除する
+        """
+        if len(content) > self.max_file_size:
+            return
+
+        with self._lock:
+            old = self._data.pop(path, None)
+            if old is not None:
+                self._size -= len(old[1])
+            self._data[path] = (etag, content)
+            self._size += len(content)
+            while self._size > self.max_bytes:
+                _, (_, evicted) = self._data.popitem(last = False)
+                self._size -= len(evicted)
+
+def guess_type(path: str) -> str:
+    """
+    ファイルの Content-Type を決める
+
+    Args:
+        path (str): ファイルのパス
+
+    Returns:
+        str: Content-Type
+            テキストは utf-8 とする
+    """
+    _, ext = posixpath.splitext(path)
+    content_type = MIME_TYPES.get(ext.lower()) or mimetypes.guess_type(path)[0] or "application/octet-stream"
+    if content_type.startswith("text/") or content_type in ["application/json", "application/toml"]:
+        content_type += "; charset=utf-8"
+    return content_type
+
 class RequestHandler(BaseHTTPRequestHandler):
     """
     index.html へ接続するための、handler
+
+    Attributes:
+        directory (str): 公開するディレクトリ
+        file_cache (FileCache): 小さいファイルのキャッシュ (全てのリクエストで共有する)
+
+    Note:
+        HTTP/1.1 で keep-alive とするので、全ての応答に Content-Length をつける
+        何もしない接続は timeout 秒で閉じる
     """
+    protocol_version = "HTTP/1.1"
+    timeout = 30
+    file_cache = FileCache()
+
+    def __init__(self, *args, directory: str | None = None, **kwargs):
+        """
+        Args:
+            directory (str | None): 公開するディレクトリ (指定がなければカレントディレクトリ)
+        """
+        self.directory = os.path.abspath(CWD if directory is None else directory)
+        super().__init__(*args, **kwargs)
+
     def end_headers(self) -> None:
         """
         pyscript の worker 上で、terminal を動かすときに必要な設定
@@ -33,31 +344,283 @@ class RequestHandler(BaseHTTPRequestHandler):
         Note
             index.html 以外のファイルにもアクセスできるように調整
         """
-        # リクエストされたパスを取得
-        path = self.path
+        self.send_file(head_only = False)
 
-        # パスが空の場合は index.html を返す
-        if path == '/':
-            path = '/index.html'
+    def do_HEAD(self) -> None:
+        """
+        head でアクセスされた時の処理 (本文は送らない)
+        """
+        self.send_file(head_only = True)
+
+    def translate_path(self, path: str) -> str | None:
+        """
+        リクエストされたパスを、ファイルのパスにする
+
+        Args:
+            path (str): リクエストされたパス (クエリを含む)
+
+        Returns:
+            str | None: ファイルのパス
+                公開するディレクトリの外を指す、または NUL を含む場合は None
+
+        Note:
+            ディレクトリの場合は、その中の index.html
+        """
+        path = posixpath.normpath(unquote(urlsplit(path).path))
+        # NUL を含むパスは、os.stat などが ValueError になる
+        if "\0" in path:
+            return None
+        parts = [part for part in path.split("/") if part and part not in [".", ".."]]
+        file_path = os.path.join(self.directory, *parts)
+        if os.path.commonpath([self.directory, os.path.abspath(file_path)]) != self.directory:
+            return None
+
+        if os.path.isdir(file_path):
+            file_path = os.path.join(file_path, "index.html")
+        return file_path
+
+    def send_file(self, head_only: bool) -> None:
+        """
+        ファイルを送る
+
+        Args:
+            head_only (bool): ヘッダーのみ送るかどうか
+
+        Note:
+            ブラウザのキャッシュと同じ (If-None-Match, If-Modified-Since) であれば、304 のみ返す
+            Range があれば、その範囲のみ 206 で返す (If-Range が違えば全体を返す)
+                Range は元のファイルに対するものとし、圧縮したファイルは送らない
+        """
+        file_path = self.translate_path(self.path)
+        try:
+            file_stat = None if file_path is None else os.stat(file_path)
+        except (OSError, ValueError):
+            file_stat = None
+
+        # ファイルが存在しない場合
+        if file_stat is None or not stat.S_ISREG(file_stat.st_mode):
+            self.send_error(HTTPStatus.NOT_FOUND, 'File not found')
+            return
 
-        # リクエストされたファイルのパスを作成
-        file_path = os.path.join(CWD, path[1:])
+        content_type = guess_type(file_path)
+        is_compressible = file_path.endswith(COMPRESSIBLE_EXTENSIONS)
+        file_path, file_stat, encoding = self.select_variant(file_path, file_stat)
+        etag = make_etag(file_stat, encoding)
+        if self.is_not_modified(etag, file_stat):
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            self.send_cache_headers(etag, file_stat, is_compressible)
+            self.end_headers()
+            return
 
-        # ファイルが存在する場合
-        if os.path.exists(file_path):
-            self.send_response(200)
-            self.send_header('Content-type', 'text/html')
+        size = file_stat.st_size
+        try:
+            byte_range = parse_range(self.headers.get('Range'), size) if self.is_range_valid(etag, file_stat) else None
+        except ValueError:
+            self.send_response(HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE)
+            self.send_header('Content-Range', f'bytes */{size}')
+            self.send_header('Content-Length', '0')
             self.end_headers()
+            return
+
+        content = self.file_cache.get(file_path, etag)
+        if content is None and size <= self.file_cache.max_file_size:
+            content = self.read_small_file(file_path, etag, size)
+
+        start, end = (0, size - 1) if byte_range is None else byte_range
+        if byte_range is None:
+            self.send_response(HTTPStatus.OK)
+        else:
+            self.send_response(HTTPStatus.PARTIAL_CONTENT)
+            self.send_header('Content-Range', f'bytes {start}-{end}/{size}')
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(end - start + 1))
+        if encoding is not None:
+            self.send_header('Content-Encoding', encoding)
+        self.send_header('Accept-Ranges', 'bytes')
+        self.send_cache_headers(etag, file_stat, is_compressible)
+        self.end_headers()
+
+        if head_only or end < start:
+            return
 
-            # ファイルの内容を読み込んで返す
+        if content is not None:
+            self.wfile.write(content[start:end + 1])
+            return
+
+        try:
+            f = open(file_path, 'rb')
+        except OSError:
+            self.close_connection = True
+            return
+
+        with f:
+            self.copy_file(f, start, end - start + 1)
+
+    def select_variant(self, file_path: str, file_stat: os.stat_result) -> tuple[str, os.stat_result, str | None]:
+        """
+        Accept-Encoding に合わせて、送るファイル (元のファイルか、圧縮したファイル) を選ぶ
+
+        Args:
+            file_path (str): 元のファイルのパス
+            file_stat (os.stat_result): 元のファイルの情報
+
+        Returns:
+            tuple[str, os.stat_result, str | None]: 送るファイルのパス, その情報, 圧縮の形式 (元のファイルは None)
+
+        Note:
+            圧縮したファイルが元のファイルより古い場合は、元のファイルを送る
+        """
+        if not file_path.endswith(COMPRESSIBLE_EXTENSIONS) or self.headers.get('Range') is not None:
+            return file_path, file_stat, None
+
+        accepted = parse_accept_encoding(self.headers.get('Accept-Encoding'))
+        for encoding, suffix in ENCODINGS:
+            if encoding not in accepted:
+                continue
+            try:
+                compressed_stat = os.stat(file_path + suffix)
+            except OSError:
+                continue
+            if compressed_stat.st_mtime_ns >= file_stat.st_mtime_ns:
+                return file_path + suffix, compressed_stat, encoding
+
+        return file_path, file_stat, None
+
+    def is_range_valid(self, etag: str, file_stat: os.stat_result) -> bool:
+        """
+        If-Range があれば、Range がまだ有効かどうか
+
+        Args:
+            etag (str): ファイルの ETag
+            file_stat (os.stat_result): ファイルの情報
+
+        Returns:
+            bool: Range の通りに送ってよければ True
+        """
+        if_range = self.headers.get('If-Range')
+        if if_range is None:
+            return True
+        if if_range.startswith('"') or if_range.startswith('W/'):
+            return if_range == etag
+
+        try:
+            since = parsedate_to_datetime(if_range)
+        except (TypeError, ValueError):
+            return False
+        return since is not None and since.tzinfo is not None and int(file_stat.st_mtime) <= since.timestamp()
+
+    def read_small_file(self, file_path: str, etag: str, size: int) -> bytes | None:
+        """
+        小さいファイルを読み込んで、キャッシュに保存する
+
+        Args:
+            file_path (str): ファイルのパス
+            etag (str): ファイルの ETag
+            size (int): ファイルの大きさ
+
+        Returns:
+            bytes | None: ファイルの内容
+                読み込めない、または読み込む間に大きさが変わった場合は None
+        """
+        try:
             with open(file_path, 'rb') as f:
                 content = f.read()
-                self.wfile.write(content)
+        except OSError:
+            return None
 
-        # ファイルが存在しない場合
-        else:
-            self.send_error(404, 'File not found')
+        if len(content) != size:
+            return None
+
+        self.file_cache.put(file_path, etag, content)
+        return content
+
+    def send_cache_headers(self, etag: str, file_stat: os.stat_result, is_compressible: bool = False) -> None:
+        """
+        キャッシュのためのヘッダーを送る
+
+        Args:
+            etag (str): ファイルの ETag
+            file_stat (os.stat_result): ファイルの情報
+            is_compressible (bool): 圧縮したファイルを送ることがあるかどうか
+                その場合は、Accept-Encoding ごとにキャッシュさせる (Vary)
+        """
+        is_versioned = VERSIONED_PATTERN.search(self.path) is not None
+        self.send_header('ETag', etag)
+        if is_compressible:
+            self.send_header('Vary', 'Accept-Encoding')
+        self.send_header('Last-Modified', formatdate(file_stat.st_mtime, usegmt = True))
+        self.send_header('Cache-Control', IMMUTABLE_CACHE_CONTROL if is_versioned else REVALIDATE_CACHE_CONTROL)
+
+    def is_not_modified(self, etag: str, file_stat: os.stat_result) -> bool:
+        """
+        ブラウザのキャッシュが最新かどうか
+
+        Args:
+            etag (str): ファイルの ETag
+            file_stat (os.stat_result): ファイルの情報
+
+        Returns:
+            bool: 最新であれば True
+
+        Note:
+            If-None-Match があれば、If-Modified-Since は見ない (RFC 9110)
+        """
+        if_none_match = self.headers.get('If-None-Match')
+        if if_none_match is not None:
+            tags = [tag.strip().removeprefix('W/') for tag in if_none_match.split(',')]
+            return '*' in tags or etag in tags
+
+        if_modified_since = self.headers.get('If-Modified-Since')
+        if if_modified_since is None:
+            return False
+
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if since is None or since.tzinfo is None:
+            return False
+
+        return int(file_stat.st_mtime) <= since.timestamp()
+
+    def copy_file(self, f, offset: int, size: int) -> None:
+        """
+        ファイルの内容を、読み込みながら送る
+
+        Args:
+            f (BinaryIO): 送るファイル
+            offset (int): 送り始める位置
+            size (int): 送る大きさ
+
+        Note:
+            socket.sendfile は、os.sendfile が使えなければ、内部でチャンクごとに読み込んで送る
+            ブラウザが途中で接続を閉じた場合は、そのまま接続を終える
+        """
+        try:
+            self.connection.sendfile(f, offset = offset, count = size)
+        except (BrokenPipeError, ConnectionResetError):
+            self.close_connection = True
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description = "pyscript の確認用のサーバー")
+    parser.add_argument("--port", type = int, default = PORT, help = "ポート番号")
+    parser.add_argument("--bind", default = "", help = "待ち受けるアドレス")
+    parser.add_argument("--directory", default = CWD, help = "公開するディレクトリ")
+    parser.add_argument("--compress", action = "store_true", help = "圧縮したファイル (.gz / .br) を作成して終了する")
+    args = parser.parse_args()
+
+    if args.compress:
+        created = compress_assets(args.directory)
+        print(f"{len(created)} compressed files")
+        return
+
+    handler = partial(RequestHandler, directory = args.directory)
+    with ThreadingHTTPServer((args.bind, args.port), handler) as httpd:
+        print(f"Serving at port {args.port}")
+        try:
+            httpd.serve_forever()
+        except KeyboardInterrupt:
+            pass
 
-with socketserver.TCPServer(("", PORT), RequestHandler) as httpd:
-    print(f"Serving at port {PORT}")
-    httpd.serve_forever()
\ No newline at end of file
+if __name__ == "__main__":
+    main()
@@ -3,11 +3,30 @@ pyscript の main thread で動作する処理
 main() を実行しているため、他の python file からの参照は非推奨
 """
 
-import pandas as pd
+from importlib.metadata import version, PackageNotFoundError
 from pyscript import document
 import pydantic
 import sys
 
+def package_version(name: str) -> str:
+    """
+    読み込んでいないパッケージも含めて、version を取得する
+
+    Args:
+        name (str): パッケージ名
+
+    Returns:
+        str: version
+            インストールされていなければ、"not installed"
+
+    Note:
+        起動を速くするため、pandas などの重いパッケージは import しない
+    """
+    try:
+        return version(name)
+    except PackageNotFoundError:
+        return "not installed"
+
 def display_version() -> None:
     """
     python の version を表示する
@@ -15,7 +34,7 @@ def display_version() -> None:
     versions = {
         "#python-version": sys.version,
         "#pydantic-version": f"pydantic: {pydantic.__version__}",
-        "#pandas-version": f"pandas: {pd.__version__}",
+        "#pandas-version": f"pandas: {package_version('pandas')}",
     }
     for tag_id, version_text in versions.items():
         info_version = document.querySelector(tag_id)
@@ -1,8 +1,8 @@
 """
 html 上にボタンを作成したり、削除したりする処理
 """
-from pyodide.ffi import JsProxy
-from pyscript import document
+from html import escape
+from itertools import count
 import sys
 
 sys.path.append("/home/work")
@@ -11,12 +11,16 @@ from src.utils import (
     Card,
 )
 
+from .render import renderer
 
-def make_button(value: str, 
+# Buttons ごとの領域の名前に利用する
+_region_ids = count()
+
+def button_html(value: str, 
                 func_name: str = "game.run", 
-                text: str = None) -> JsProxy:
+                text: str = None) -> str:
     """
-    ボタンを作成する
+    ボタンの HTML を作成する
     
     Args:
         value (str): ボタンに表示する文字列 / 選択するカードの番号
@@ -24,41 +28,62 @@ def make_button(value: str,
         text (str): 表示させる文字列
 
     Returns:
-        JsProxy: ボタンのインスタンス
+        str: ボタンの HTML
     """
-    button = document.createElement('button')
-
     if text is None:
         text = value
 
-    if type(text) is str:
-        button.textContent = text
-    else:
-        button.appendChild(text)
+    value = escape(str(value))
+    return (f'<button value="{value}" id="{value}" style="width:100px;height:50px" '
+            f'py-click="{escape(func_name)}" type="button" class="button">{escape(str(text))}</button>')
+
+def card_button_html(cnt: int, 
+                     card: Card, 
+                     func_name: str = "game.run", 
+                     disable: bool = False) -> str:
+    """
+    カードの画像のボタンの HTML を作成する
 
-    button.value = value
-    button.id = value
-    button.style = "width:100px;height:50px"
-    button.setAttribute("py-click", func_name)
-    button.setAttribute("type", "button")
-    button.setAttribute("class", "button")
+    Args:
+        cnt (int): 選択するカードの番号
+        card (Card): カード
+        func_name (str): 実行させる関数の名前
+        disable (bool): クリックできないようにするかどうか
 
-    return button
+    Returns:
+        str: ボタンの HTML
+    """
+    style = ' style="pointer-events: none;"' if disable else ""
+    return (f'<input type="image" py-click="{escape(func_name)}" value="{cnt}" '
+            f'src="{escape(str(card.image_path))}" class="card_button"{style}>')
 
 class Buttons:
     """
     ボタンを作成したり、削除したりする
+
+    Note:
+        ボタンは HTML の文字列として組み立て、renderer でまとめて反映する
+        同じ場所を複数の Buttons で共有するので、Buttons ごとに renderer の領域を分けている
     """
     def __init__(self, id_name: str = "#buttons"):
         """
         Attributes:
-            buttons_area (JsProxy): ボタンを表示させるエリア
+            id_name (str): ボタンを表示させるエリア
+            region (str): renderer の領域の名前
+            buttons (list[str]): ボタンの HTML
             
         Args:
             id_name (str): HTML 上のボタンを設置するための場所の情報
         """
-        self.buttons_area = document.querySelector(id_name)
+        self.id_name = id_name
+        self.region = f"buttons-{next(_region_ids)}"
         self.buttons = []
+
+    def render(self) -> None:
+        """
+        ボタンを表示に反映する (次のフレームでまとめて反映される)
+        """
+        renderer.set_html(self.id_name, "".join(self.buttons), region = self.region)
         
     def make_card(
             self, 
@@ -85,31 +110,17 @@ class Buttons:
             src は、image_url が無効になっていたため image_path に変更
         """
         for cnt, card in enumerate(cards):
-            input_tag = document.createElement('input')
-
-            input_tag.setAttribute("type", "image")
-            input_tag.setAttribute("py-click", func_name)
-            input_tag.value = str(cnt)
-            input_tag.setAttribute("src", str(card.image_path))
-            input_tag.setAttribute("class", "card_button")
-
-            if disable is not None:
-                if disable[cnt]:
-                    input_tag.setAttribute("style", "pointer-events: none;")
-
-            self.buttons_area.appendChild(input_tag)
-            self.buttons.append(input_tag)
+            is_disable = disable is not None and disable[cnt]
+            self.buttons.append(card_button_html(cnt, card, func_name = func_name, disable = is_disable))
+        self.render()
 
     def make_declarations(self, declarations: list):
         """
         宣言をボタンとして作成する
         """
         for d_cnt, declaration in enumerate(declarations):
-            value = d_cnt
-            text = str(declaration)
-            button = make_button(value, text = text, func_name = "game.run")
-            self.buttons_area.appendChild(button)
-            self.buttons.append(button)
+            self.buttons.append(button_html(d_cnt, text = str(declaration), func_name = "game.run"))
+        self.render()
 
     def make(self, 
              card_num: int = 1,
@@ -135,14 +146,12 @@ class Buttons:
             if is_text_none:
                 text = str(i)
 
-            button = make_button(value, text = text, func_name = func_name)
-            self.buttons_area.appendChild(button)
-            self.buttons.append(button)
+            self.buttons.append(button_html(value, text = text, func_name = func_name))
+        self.render()
 
     def delete(self) -> None:
         """
         ボタンの削除
         """
-        for b in self.buttons:
-            self.buttons_area.removeChild(b)
-        self.buttons = []
\ No newline at end of file
+        self.buttons = []
+        self.render()
@@ -4,7 +4,6 @@ worker.py の GameMaster が利用するゲームを実行するクラス
 
 import random
 from pyodide.ffi import JsProxy
-from pyscript import document
 import sys
 
 sys.path.append("/home/work")
@@ -13,6 +12,7 @@ sys.path.append("/pyscript/pyscript/src")
 from .button import (
     Buttons,
 )
+from .render import renderer
 
 from src.player import (
     Player,
@@ -36,16 +36,13 @@ def say(content: str, charactor_name: str = "takeshi") -> None:
     Args:
         content (str): しゃべる内容
     """
-    fukidasi_area = document.querySelector("#fukidasi")
-    fukidasi_area.textContent = content
-
-    charactor_area = document.querySelector("#charactor")
+    renderer.set_text("#fukidasi", content)
 
     if charactor_name == "takeshi":
         charactor = Takeshi()
     elif charactor_name == "shizuka":
         charactor = Shizuka()
-    charactor_area.src = charactor.image_path()
+    renderer.set_attribute("#charactor", "src", charactor.image_path())
 
 class BrowserGameBase:
     """
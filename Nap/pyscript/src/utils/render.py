@@ -0,0 +1,145 @@
+"""
+DOM の更新をまとめて反映する処理
+
+pyodide から DOM を操作するたびに、python と JS の境界 (FFI) をまたぐので、以下の対応をしている
+  1. 更新はすぐに反映せず、まとめて 1 回だけ反映する
+       イベントの処理の中では、処理の最後に flush() で反映する
+       それ以外の更新は、次のアニメーションフレームで反映する
+  2. 前回反映した内容と同じであれば、反映しない
+  3. 複数の要素は HTML の文字列として組み立て、innerHTML で 1 回で反映する
+"""
+from pyodide.ffi import JsProxy, create_proxy
+from pyscript import document, window
+
+class Renderer:
+    """
+    DOM の更新をまとめて反映するクラス
+
+    Note:
+        要素は CSS のセレクターで指定する (最初に参照した時の要素を使い回す)
+        HTML は、1 つの要素の中を複数の領域 (region) に分けて更新できる
+            要素の中身は、領域の HTML を最初に追加した順に並べたもの
+            空にした領域は削除するので、次に追加すると最後に並ぶ (appendChild と同じ)
+        py-click などの属性は、pyscript が追加された要素を監視して設定するので、innerHTML でも動作する
+    """
+    def __init__(self):
+        """
+        Attributes:
+            _elements (dict[str, JsProxy]): セレクターごとの要素
+            _regions (dict[str, dict[str, str]]): セレクターごとの、領域ごとの HTML
+            _pending (dict[tuple, str]): まだ反映していない内容
+            _rendered (dict[tuple, str]): 前回反映した内容
+        """
+        self._elements = {}
+        self._regions = {}
+        self._pending = {}
+        self._rendered = {}
+        self._is_scheduled = False
+        self._on_frame_proxy = create_proxy(self._on_frame)
+
+    def element(self, selector: str) -> JsProxy:
+        """
+        要素を取得する
+
+        Args:
+            selector (str): CSS のセレクター
+
+        Returns:
+            JsProxy: 要素
+        """
+        element = self._elements.get(selector)
+        if element is None:
+            element = document.querySelector(selector)
+            self._elements[selector] = element
+        return element
+
+    def set_text(self, selector: str, text: str) -> None:
+        """
+        要素の文字列を更新する
+
+        Args:
+            selector (str): CSS のセレクター
+            text (str): 表示する文字列
+        """
+        self._pending[("text", selector, None)] = str(text)
+        self._schedule()
+
+    def set_attribute(self, selector: str, name: str, value: str) -> None:
+        """
+        要素の属性を更新する
+
+        Args:
+            selector (str): CSS のセレクター
+            name (str): 属性の名前
+            value (str): 属性の値
+        """
+        self._pending[("attribute", selector, name)] = str(value)
+        self._schedule()
+
+    def set_html(self, selector: str, html: str, region: str = "") -> None:
+        """
+        要素の中身 (の 1 つの領域) を HTML で更新する
+
+        Args:
+            selector (str): CSS のセレクター
+            html (str): HTML (空の場合は、領域を削除する)
+            region (str): 更新する領域の名前
+        """
+        regions = self._regions.setdefault(selector, {})
+        if html:
+            regions[region] = html
+        else:
+            regions.pop(region, None)
+
+        self._pending[("html", selector, None)] = "".join(regions.values())
+        self._schedule()
+
+    def flush(self) -> None:
+        """
+        まだ反映していない更新を、すぐに反映する
+
+        Note:
+            前回反映した内容と同じものは、DOM を操作しない
+        """
+        pending = self._pending
+        self._pending = {}
+        self._is_scheduled = False
+
+        for key, value in pending.items():
+            if self._rendered.get(key) == value:
+                continue
+
+            kind, selector, name = key
+            element = self.element(selector)
+            if kind == "text":
+                element.textContent = value
+            elif kind == "html":
+                element.innerHTML = value
+            else:
+                element.setAttribute(name, value)
+            self._rendered[key] = value
+
+    def _schedule(self) -> None:
+        """
+        次のアニメーションフレームで、反映するように予約する
+
+        Note:
+            requestAnimationFrame がなければ、setTimeout で予約する
+        """
+        if self._is_scheduled:
+            return
+
+        self._is_scheduled = True
+        if hasattr(window, "requestAnimationFrame"):
+            window.requestAnimationFrame(self._on_frame_proxy)
+        else:
+            window.setTimeout(self._on_frame_proxy, 0)
+
+    def _on_frame(self, *args) -> None:
+        """
+        アニメーションフレームで呼ばれる処理
+        """
+        self.flush()
+
+# 全ての画面で共有する
+renderer = Renderer()
@@ -3,13 +3,18 @@ pyscript における worker に動いてもらう処理
 main() を直接実行しているため、他の python file から参照は非推奨
 """
 
-from pyscript import document
 from pyodide.ffi import JsProxy
 
+from html import escape
+import os
 import sys
 
 sys.path.append("/home/work")
 sys.path.append("/pyscript/pyscript/src")
+# ソースコードをまとめた zip があれば、zip から import する (build_bundle.py 参照)
+BUNDLE_PATH = "/home/work/nap.zip"
+if os.path.exists(BUNDLE_PATH):
+    sys.path.insert(0, BUNDLE_PATH)
 
 from utils.games import (
     VSTakeshiBrowserGame,
@@ -17,7 +22,8 @@ from utils.games import (
     VSShizukaBrowserGame,
     VSShizukaLv2BrowserGame,
 )
-from utils.button import make_button
+from utils.button import button_html
+from utils.render import renderer
 
 class GameMaster:
     """
@@ -28,6 +34,8 @@ class GameMaster:
 
     Note:
         ゲームの選択などを行う
+        表示の更新は renderer にまとめ、各イベントの処理の最後に 1 回だけ反映する
+            (クリックの直後に表示が変わるように、次のフレームまで待たない)
     """
     games = {
         "VS Takeshi Lv.1": VSTakeshiBrowserGame,
@@ -37,16 +45,8 @@ class GameMaster:
     }
 
     def __init__(self):
-        """
-        
-        Attributes:
-            titile_area (JsProxy): タイトルの情報
-            feild_area (JsProxy): フィールドの情報
-        """
-        self.title_area = document.querySelector("#title")
-        self.feild_area = document.querySelector("#feild")
-
         self.start()
+        renderer.flush()
 
     def start(self) -> None:
         """
@@ -56,20 +56,17 @@ class GameMaster:
             選択するボタンを作成する
         """
         print("ゲームを選択してください")
-        self.select_area = document.querySelector("#select")
-        self.buttons = []
-        for game_name in self.games.keys():
-            button = make_button(value = game_name, func_name="game.select")
-            self.select_area.appendChild(button)
-            self.buttons.append(button)
+        buttons = [button_html(value = game_name, func_name="game.select") for game_name in self.games.keys()]
+        renderer.set_html("#select", "".join(buttons))
 
     def restart(self) -> None:
         """
         ゲームを選択する画面を整え、再度ゲームを選択させる
         """
-        self.title_area.textContent = "Nap CLI"
+        renderer.set_text("#title", "Nap CLI")
         self.start()
-        self.describe_area.removeChild(self.ul_tag)
+        renderer.set_html("#describe", "")
+        renderer.flush()
 
     def describe(self, game_name: str, text: str):
         """
@@ -79,30 +76,15 @@ class GameMaster:
             game_name: ゲーム名
             text(str): ゲームの説明
             
-        Attributes:
-            describe_area (JsProxy): 説明を挿入するエリア
-            
         Note:
             処理の流れ
                 タイトルを変更
-                ルールの説明を表示
+                ルールの説明を表示 (1 つの ul としてまとめて反映する)
         """
-        self.title_area.textContent = game_name
-
-        self.describe_area = document.querySelector("#describe")
-
-        self.ul_tag = document.createElement('ul')
-        self.ul_tag.setAttribute("class", "note")
+        renderer.set_text("#title", game_name)
 
-        self.li_list = []
-        for text_line in text.split("\n"):
-            if text_line == "":
-                continue
-            li = document.createElement('li')
-            li.textContent = text_line
-            self.ul_tag.appendChild(li)
-            self.li_list.append(li)
-        self.describe_area.appendChild(self.ul_tag)
+        li_list = [f"<li>{escape(text_line)}</li>" for text_line in text.split("\n") if text_line != ""]
+        renderer.set_html("#describe", f'<ul class="note">{"".join(li_list)}</ul>')
 
     def select(self, event) -> None:
         """
@@ -122,15 +104,14 @@ class GameMaster:
 
         # ゲーム決定
         self.game = game_class()
-        self.feild_area.textContent = str(self.game.field)
+        renderer.set_text("#feild", str(self.game.field))
 
         # ゲームのタイトルと説明を表示
         self.describe(game_name, game_class.describe)
 
         # button を削除
-        for b in self.buttons:
-            self.select_area.removeChild(b)
-        self.select_area = []
+        renderer.set_html("#select", "")
+        renderer.flush()
 
     def go(self, event: JsProxy) -> None:
         """
@@ -140,10 +121,11 @@ class GameMaster:
             event (JsProxy): メッセージの確認後のイベントのため、情報としては何もない
         """
         self.game.go(event)
-        self.feild_area.textContent = str(self.game.field)
+        renderer.set_text("#feild", str(self.game.field))
 
         if self.game.is_finish:
             self.restart()
+        renderer.flush()
 
     def run(self, event: JsProxy) -> None:
         """
@@ -153,9 +135,10 @@ class GameMaster:
            event (JsProxy): ゲームを動かすための情報を含んでいる 
         """
         self.game.run(event)
-        self.feild_area.textContent = str(self.game.field)
+        renderer.set_text("#feild", str(self.game.field))
 
         if self.game.is_finish:
             self.restart()
+        renderer.flush()
 
 game = GameMaster()
\ No newline at end of file
@@ -2,13 +2,18 @@ from http.server import (
     HTTPServer as SuperHTTPServer,
     SimpleHTTPRequestHandler
 )
+from pathlib import Path
 import pytest
+import sys
 from selenium import webdriver
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.by import By
 import threading
 
+sys.path.append(str(Path(__file__).parent.parent.absolute()))
+from build_bundle import build_bundle
+
 class HTTPServer(SuperHTTPServer):
     """
     ThreadでSimpleHTTPServerを動かすためのラッパー用Class.
@@ -30,6 +35,8 @@ def http_server():
     """
     host, port = '127.0.0.1', 8888
     url = f'http://{host}:{port}/index.html'
+    # index.html が利用する、ソースコードをまとめた zip を作成する
+    build_bundle()
     # serve_forever をスレッド下で実行
     server = HTTPServer((host, port), SimpleHTTPRequestHandler)
     thread = threading.Thread(None, server.run)
@@ -0,0 +1,95 @@
+from pathlib import Path
+import subprocess
+import sys
+import tomllib
+import zipfile
+
+import pytest
+
+FILE_DIR = Path(__file__).parent.absolute()
+PYSCRIPT_DIR = FILE_DIR.parent
+sys.path.append(str(PYSCRIPT_DIR))
+
+from build_bundle import (
+    BUNDLE_PATH,
+    add_package_inits,
+    build_bundle,
+    collect_files,
+)
+
+class TestBuildBundle:
+    """
+    build_bundle.py のテスト
+    """
+    def test_collect_files(self):
+        """
+        配置先から、zip の中のパスを決めることのテスト
+        """
+        config = {"files": {
+            "{FROM}": "..",
+            "{TO}": "/home/work",
+            "{FROM}/src/field.py": "{TO}/src/field.py",
+            "./src/utils/button.py": "/pyscript/pyscript/src/utils/button.py",
+        }}
+        files = collect_files(config)
+        assert files == {
+            "src/field.py": (PYSCRIPT_DIR / "../src/field.py").resolve(),
+            "utils/button.py": (PYSCRIPT_DIR / "src/utils/button.py").resolve(),
+        }
+
+        with pytest.raises(ValueError):
+            collect_files({"files": {"./a.py": "/tmp/a.py"}})
+
+    def test_add_package_inits(self):
+        """
+        __init__.py のないディレクトリにだけ、空の __init__.py を追加することのテスト
+        """
+        files = {"src/game/game.py": b"a", "src/__init__.py": b"b", "main.py": b"c"}
+        add_package_inits(files)
+        assert files == {
+            "src/game/game.py": b"a",
+            "src/__init__.py": b"b",
+            "src/game/__init__.py": b"",
+            "main.py": b"c",
+        }
+
+    def test_build_bundle(self, tmp_path: Path):
+        """
+        作成した zip から import できることのテスト
+        """
+        dist_dir = tmp_path / "dist"
+        bundle_config_path = tmp_path / "pyscript.bundle.toml"
+        bundle_path = build_bundle(dist_dir = dist_dir, bundle_config_path = bundle_config_path)
+
+        # 同じ内容からは、同じ zip を作成する
+        content = bundle_path.read_bytes()
+        assert build_bundle(dist_dir = dist_dir, bundle_config_path = bundle_config_path) == bundle_path
+        assert bundle_path.read_bytes() == content
+        assert list(dist_dir.glob("nap-*.zip")) == [bundle_path]
+
+        with zipfile.ZipFile(bundle_path) as bundle:
+            names = set(bundle.namelist())
+        assert {"src/__init__.py", "src/game/__init__.py", "src/game/game.py", "utils/__init__.py", "utils/render.py"} <= names
+
+        with open(bundle_config_path, "rb") as f:
+            bundle_config = tomllib.load(f)
+        assert bundle_config["files"] == {f"./dist/{bundle_path.name}": BUNDLE_PATH}
+
+        # リポジトリを参照しないように、別のプロセスで zip のみから import する
+        #   utils の各モジュールは pyodide が必要なので、見つかることのみ確認する
+        code = "\n".join([
+            "import importlib.util, sys",
+            f"sys.path.insert(0, {str(bundle_path)!r})",
+            "import src.game",
+            "from src.game import NapVSShizuka",
+            "import utils",
+            "print(src.game.__file__)",
+            "print(utils.__file__)",
+            "print(importlib.util.find_spec('utils.games').origin)",
+        ])
+        result = subprocess.run([sys.executable, "-c", code], cwd = tmp_path, capture_output = True, text = True)
+        assert result.returncode == 0, result.stderr
+        origins = result.stdout.splitlines()
+        assert len(origins) == 3
+        for origin in origins:
+            assert origin.startswith(str(bundle_path)), origin
@@ -0,0 +1,261 @@
+"""
+pyscript/src/utils/render.py と、worker.py の表示の更新のテスト
+
+Note:
+    ブラウザは使わずに、pyscript と pyodide を差し替えて確認する
+    (selenium を使う conftest.py の fixture は利用しない)
+"""
+import importlib
+from pathlib import Path
+import sys
+from types import ModuleType, SimpleNamespace
+
+import pytest
+
+FILE_DIR = Path(__file__).parent.absolute()
+PYSCRIPT_DIR = FILE_DIR.parent
+PROJECT_DIR = PYSCRIPT_DIR.parent
+
+class FakeElement:
+    """
+    DOM の要素の代わり
+
+    Attributes:
+        writes (list[tuple]): 要素への書き込みの記録
+    """
+    def __init__(self):
+        object.__setattr__(self, "writes", [])
+
+    def __setattr__(self, name: str, value: str) -> None:
+        self.writes.append((name, value))
+        object.__setattr__(self, name, value)
+
+    def setAttribute(self, name: str, value: str) -> None:
+        self.writes.append(("setAttribute", name, value))
+
+class FakeDocument:
+    """
+    document の代わり
+    """
+    def __init__(self):
+        self.elements = {}
+        self.query_cnt = 0
+
+    def querySelector(self, selector: str) -> FakeElement:
+        self.query_cnt += 1
+        return self.elements.setdefault(selector, FakeElement())
+
+    def writes(self) -> int:
+        """
+        全ての要素への書き込みの回数
+        """
+        return sum(len(element.writes) for element in self.elements.values())
+
+class FakeWindow:
+    """
+    requestAnimationFrame がある window の代わり
+    """
+    def __init__(self):
+        self.callbacks = []
+
+    def requestAnimationFrame(self, callback) -> None:
+        self.callbacks.append(callback)
+
+    def run_frame(self) -> None:
+        """
+        予約された処理を実行する
+        """
+        callbacks, self.callbacks = self.callbacks, []
+        for callback in callbacks:
+            callback(0)
+
+class FakeTimeoutWindow:
+    """
+    requestAnimationFrame がない window の代わり
+    """
+    def __init__(self):
+        self.callbacks = []
+
+    def setTimeout(self, callback, delay: int) -> None:
+        self.callbacks.append(callback)
+
+@pytest.fixture()
+def browser(monkeypatch: pytest.MonkeyPatch) -> SimpleNamespace:
+    """
+    pyscript と pyodide を差し替えて、pyscript/src のモジュールを import し直す
+    """
+    document = FakeDocument()
+    window = FakeWindow()
+
+    pyscript = ModuleType("pyscript")
+    pyscript.document = document
+    pyscript.window = window
+    ffi = ModuleType("pyodide.ffi")
+    ffi.JsProxy = object
+    ffi.create_proxy = lambda func: func
+    pyodide = ModuleType("pyodide")
+    pyodide.ffi = ffi
+
+    monkeypatch.setitem(sys.modules, "pyscript", pyscript)
+    monkeypatch.setitem(sys.modules, "pyodide", pyodide)
+    monkeypatch.setitem(sys.modules, "pyodide.ffi", ffi)
+    monkeypatch.syspath_prepend(str(PYSCRIPT_DIR / "src"))
+    monkeypatch.syspath_prepend(str(PROJECT_DIR))
+
+    # 差し替えた document, window を参照するように、毎回 import し直す
+    def clear_modules():
+        for name in list(sys.modules):
+            if name in ("utils", "worker") or name.startswith("utils."):
+                del sys.modules[name]
+
+    clear_modules()
+    yield SimpleNamespace(
+        document = document,
+        window = window,
+        render = importlib.import_module("utils.render"),
+    )
+    clear_modules()
+
+def click(value: str) -> SimpleNamespace:
+    """
+    ボタンをクリックした時のイベントを作成する
+    """
+    return SimpleNamespace(target = SimpleNamespace(getAttribute = lambda name: value))
+
+class TestRenderer:
+    """
+    Renderer class のテスト
+    """
+    def test_flush(self, browser: SimpleNamespace):
+        """
+        まとめて反映することと、前回と同じ内容は反映しないことのテスト
+        """
+        renderer = browser.render.Renderer()
+        renderer.set_text("#title", "a")
+        renderer.set_text("#title", "b")
+        renderer.set_attribute("#charactor", "src", "takeshi.png")
+        # flush するまでは、DOM を操作しない
+        assert browser.document.query_cnt == 0
+        assert len(browser.window.callbacks) == 1
+
+        renderer.flush()
+        title = browser.document.elements["#title"]
+        charactor = browser.document.elements["#charactor"]
+        assert title.writes == [("textContent", "b")]
+        assert charactor.writes == [("setAttribute", "src", "takeshi.png")]
+
+        # 同じ内容は反映しない
+        renderer.set_text("#title", "b")
+        renderer.set_attribute("#charactor", "src", "takeshi.png")
+        renderer.flush()
+        assert browser.document.writes() == 2
+
+        renderer.set_text("#title", "c")
+        renderer.set_attribute("#charactor", "alt", "takeshi.png")
+        renderer.flush()
+        assert title.writes[-1] == ("textContent", "c")
+        assert charactor.writes[-1] == ("setAttribute", "alt", "takeshi.png")
+        # 要素は最初に参照したものを使い回す
+        assert browser.document.query_cnt == 2
+
+    def test_schedule(self, browser: SimpleNamespace):
+        """
+        flush しなかった更新は、次のフレームで反映することのテスト
+        """
+        renderer = browser.render.Renderer()
+        renderer.set_text("#title", "a")
+        renderer.set_text("#feild", "b")
+        assert len(browser.window.callbacks) == 1
+
+        browser.window.run_frame()
+        assert browser.document.elements["#title"].writes == [("textContent", "a")]
+        assert browser.document.elements["#feild"].writes == [("textContent", "b")]
+
+        # flush 済みの予約は、何もしない
+        renderer.set_text("#title", "c")
+        renderer.flush()
+        browser.window.run_frame()
+        assert browser.document.writes() == 3
+
+        # requestAnimationFrame がなければ、setTimeout で予約する
+        window = FakeTimeoutWindow()
+        browser.render.window = window
+        renderer.set_text("#title", "d")
+        assert len(window.callbacks) == 1
+
+    def test_set_html(self, browser: SimpleNamespace):
+        """
+        領域を最初に追加した順に並べて反映することのテスト
+        """
+        renderer = browser.render.Renderer()
+        renderer.set_html("#buttons", "<a>", region = "first")
+        renderer.set_html("#buttons", "<b>", region = "second")
+        renderer.set_html("#buttons", "<A>", region = "first")
+        renderer.flush()
+        buttons = browser.document.elements["#buttons"]
+        assert buttons.writes == [("innerHTML", "<A><b>")]
+
+        # 空にした領域は削除し、次に追加すると最後に並ぶ
+        renderer.set_html("#buttons", "", region = "first")
+        renderer.flush()
+        assert buttons.writes[-1] == ("innerHTML", "<b>")
+        renderer.set_html("#buttons", "<a>", region = "first")
+        renderer.flush()
+        assert buttons.writes[-1] == ("innerHTML", "<b><a>")
+
+        # 削除して同じ内容に戻した場合は、反映しない
+        renderer.set_html("#buttons", "", region = "first")
+        renderer.set_html("#buttons", "<a>", region = "first")
+        renderer.flush()
+        assert len(buttons.writes) == 3
+
+class TestGameMaster:
+    """
+    worker.py の GameMaster class の表示の更新のテスト
+    """
+    def test_flush(self, browser: SimpleNamespace, monkeypatch: pytest.MonkeyPatch):
+        """
+        各イベントの処理の最後に、全ての更新を反映することのテスト
+        """
+        worker = importlib.import_module("worker")
+        renderer = worker.renderer
+        assert renderer is browser.render.renderer
+        # import 時に、ゲームを選択するボタンを反映している
+        assert renderer._pending == {}
+        assert "VS Takeshi Lv.1" in browser.document.elements["#select"].innerHTML
+
+        flush = renderer.flush
+        flush_cnt = 0
+        def count_flush():
+            nonlocal flush_cnt
+            flush_cnt += 1
+            flush()
+        monkeypatch.setattr(renderer, "flush", count_flush)
+
+        game = worker.game
+        game.select(click("VS Takeshi Lv.1"))
+        assert flush_cnt == 1
+        assert renderer._pending == {}
+        assert browser.document.elements["#title"].textContent == "VS Takeshi Lv.1"
+        assert browser.document.elements["#select"].innerHTML == ""
+        assert 'value="talk"' in browser.document.elements["#buttons"].innerHTML
+
+        game.go(click("talk"))
+        assert flush_cnt == 2
+        assert renderer._pending == {}
+
+        # 予約していたフレームでは、何もしない
+        writes = browser.document.writes()
+        browser.window.run_frame()
+        assert browser.document.writes() == writes
+        flush_cnt = 0
+
+        # ゲームが終了した場合は、選択する画面に戻す (2 回目の flush は何もしない)
+        monkeypatch.setattr(game, "game", SimpleNamespace(go = lambda event: None, field = "end", is_finish = True))
+        game.go(click("play_cpu"))
+        assert flush_cnt == 2
+        assert renderer._pending == {}
+        assert browser.document.elements["#title"].textContent == "Nap CLI"
+        assert browser.document.elements["#describe"].innerHTML == ""
+        assert browser.document.elements["#feild"].textContent == "end"
+        assert "VS Takeshi Lv.1" in browser.document.elements["#select"].innerHTML
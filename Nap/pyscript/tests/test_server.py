@@ -0,0 +1,283 @@
+from email.utils import formatdate
+from functools import partial
+import gzip
+from http.client import HTTPConnection, HTTPResponse
+from http.server import ThreadingHTTPServer
+import os
+from pathlib import Path
+import sys
+import threading
+
+import pytest
+
+FILE_DIR = Path(__file__).parent.absolute()
+SERVER_DIR = FILE_DIR.parent / "server"
+sys.path.append(str(SERVER_DIR))
+
+from server import (
+    RequestHandler,
+    compress_assets,
+    parse_accept_encoding,
+    parse_range,
+)
+
+PY_CONTENT = b"".join(f"print('line {i}')\n".encode() for i in range(100))
+BIN_CONTENT = bytes(range(256)) * 4
+
+@pytest.fixture()
+def public_dir(tmp_path: Path) -> Path:
+    """
+    公開するディレクトリを作成する
+
+    Note:
+        公開するディレクトリの外に secret.txt を置く
+    """
+    directory = tmp_path / "public"
+    (directory / "image" / "v.0.0").mkdir(parents = True)
+    (directory / "index.html").write_bytes(b"<html><body>Nap</body></html>")
+    (directory / "a.py").write_bytes(PY_CONTENT)
+    (directory / "data.bin").write_bytes(BIN_CONTENT)
+    (directory / "empty.txt").write_bytes(b"")
+    (directory / "image" / "v.0.0" / "main.png").write_bytes(b"\x89PNG")
+    (tmp_path / "secret.txt").write_bytes(b"secret")
+    return directory
+
+@pytest.fixture()
+def connection(public_dir: Path) -> HTTPConnection:
+    """
+    サーバーをスレッドで立てて、接続を返す
+    """
+    handler = partial(RequestHandler, directory = str(public_dir))
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target = server.serve_forever, daemon = True)
+    thread.start()
+
+    connection = HTTPConnection("127.0.0.1", server.server_address[1], timeout = 10)
+    yield connection
+
+    connection.close()
+    server.shutdown()
+    server.server_close()
+    thread.join()
+
+def request(connection: HTTPConnection, path: str, headers: dict | None = None, method: str = "GET") -> tuple[HTTPResponse, bytes]:
+    """
+    リクエストを送り、応答と本文を返す
+    """
+    connection.request(method, path, headers = headers or {})
+    response = connection.getresponse()
+    body = response.read()
+    return response, body
+
+class TestParse:
+    """
+    ヘッダーを解釈する処理のテスト
+    """
+    def test_parse_accept_encoding(self):
+        """
+        Accept-Encoding のテスト
+        """
+        assert parse_accept_encoding(None) == set()
+        assert parse_accept_encoding("gzip, deflate, br") == {"gzip", "deflate", "br"}
+        assert parse_accept_encoding("br;q=0, GZIP;q=0.5") == {"gzip"}
+
+    def test_parse_range(self):
+        """
+        Range のテスト
+        """
+        assert parse_range(None, 100) is None
+        assert parse_range("bytes=0-9", 100) == (0, 9)
+        assert parse_range("bytes=90-", 100) == (90, 99)
+        assert parse_range("bytes=-10", 100) == (90, 99)
+        assert parse_range("bytes=-500", 100) == (0, 99)
+        assert parse_range("bytes=50-500", 100) == (50, 99)
+        # 解釈できない Range は、全体を送る
+        assert parse_range("bytes=0-1,5-6", 100) is None
+        assert parse_range("bytes=9-0", 100) is None
+        assert parse_range("items=0-9", 100) is None
+
+        with pytest.raises(ValueError):
+            parse_range("bytes=100-", 100)
+        with pytest.raises(ValueError):
+            parse_range("bytes=-0", 100)
+        with pytest.raises(ValueError):
+            parse_range("bytes=-5", 0)
+
+class TestRequestHandler:
+    """
+    RequestHandler class のテスト
+    """
+    def test_content_type(self, connection: HTTPConnection, public_dir: Path):
+        """
+        Content-Type のテスト
+        """
+        compress_assets(str(public_dir))
+        targets = {
+            "/": "text/html; charset=utf-8",
+            "/index.html": "text/html; charset=utf-8",
+            "/a.py": "text/x-python; charset=utf-8",
+            "/a.py.gz": "application/gzip",
+            "/data.bin": "application/octet-stream",
+            "/image/v.0.0/main.png": "image/png",
+        }
+        for path, content_type in targets.items():
+            response, _ = request(connection, path)
+            assert response.status == 200
+            assert response.getheader("Content-Type") == content_type
+
+        # 圧縮したファイルを直接リクエストした場合は、そのまま送る
+        response, body = request(connection, "/a.py.gz", headers = {"Accept-Encoding": "gzip"})
+        assert response.getheader("Content-Encoding") is None
+        assert gzip.decompress(body) == PY_CONTENT
+
+    def test_keep_alive(self, connection: HTTPConnection):
+        """
+        同じ接続を使い回すことのテスト
+
+        Note:
+            エラー (send_error) の場合は、http.server が接続を閉じる
+        """
+        response, body = request(connection, "/a.py")
+        assert body == PY_CONTENT
+        sock = connection.sock
+
+        response, body = request(connection, "/a.py", method = "HEAD")
+        assert response.status == 200
+        assert response.getheader("Content-Length") == str(len(PY_CONTENT))
+        assert body == b""
+
+        response, body = request(connection, "/a.py", headers = {"If-None-Match": response.getheader("ETag")})
+        assert response.status == 304
+
+        response, body = request(connection, "/data.bin", headers = {"Range": "bytes=0-9"})
+        assert response.status == 206
+
+        response, body = request(connection, "/data.bin")
+        assert body == BIN_CONTENT
+        assert connection.sock is sock
+
+    def test_not_found(self, connection: HTTPConnection):
+        """
+        ファイルがない、または公開するディレクトリの外の場合は 404 となることのテスト
+        """
+        for path in ["/missing.txt", "/image", "/../secret.txt", "/%2e%2e/secret.txt", "/image/../../secret.txt", "/%00", "/a.py%00"]:
+            response, body = request(connection, path)
+            assert response.status == 404, path
+            assert b"secret" not in body
+
+    def test_not_modified(self, connection: HTTPConnection, public_dir: Path):
+        """
+        ブラウザのキャッシュが最新であれば 304 となることのテスト
+        """
+        response, _ = request(connection, "/index.html")
+        etag = response.getheader("ETag")
+        last_modified = response.getheader("Last-Modified")
+        assert etag
+        assert last_modified == formatdate(os.stat(public_dir / "index.html").st_mtime, usegmt = True)
+
+        response, body = request(connection, "/index.html", headers = {"If-None-Match": etag})
+        assert response.status == 304
+        assert body == b""
+        assert response.getheader("ETag") == etag
+
+        response, body = request(connection, "/index.html", headers = {"If-None-Match": f'"other", W/{etag}'})
+        assert response.status == 304
+
+        response, body = request(connection, "/index.html", headers = {"If-Modified-Since": last_modified})
+        assert response.status == 304
+
+        # If-None-Match があれば、If-Modified-Since は見ない
+        response, body = request(connection, "/index.html", headers = {"If-None-Match": '"other"', "If-Modified-Since": last_modified})
+        assert response.status == 200
+        assert body == b"<html><body>Nap</body></html>"
+
+        response, body = request(connection, "/index.html", headers = {"If-Modified-Since": formatdate(0, usegmt = True)})
+        assert response.status == 200
+
+        # ファイルが更新されたら、送り直す
+        (public_dir / "index.html").write_bytes(b"<html><body>Nap 2</body></html>")
+        response, body = request(connection, "/index.html", headers = {"If-None-Match": etag})
+        assert response.status == 200
+        assert body == b"<html><body>Nap 2</body></html>"
+
+    def test_cache_control(self, connection: HTTPConnection):
+        """
+        バージョンのついたパスは immutable となることのテスト
+        """
+        targets = {
+            "/image/v.0.0/main.png": "public, max-age=31536000, immutable",
+            "/index.html?v=3": "public, max-age=31536000, immutable",
+            "/index.html": "no-cache",
+        }
+        for path, cache_control in targets.items():
+            response, _ = request(connection, path)
+            assert response.getheader("Cache-Control") == cache_control
+
+    def test_compressed(self, connection: HTTPConnection, public_dir: Path):
+        """
+        Accept-Encoding に合わせて、圧縮したファイルを送ることのテスト
+        """
+        created = compress_assets(str(public_dir))
+        assert str(public_dir / "a.py.gz") in created
+        # 小さいファイル、圧縮しない拡張子は作成しない
+        assert not (public_dir / "index.html.gz").exists()
+        assert not (public_dir / "data.bin.gz").exists()
+
+        response, body = request(connection, "/a.py", headers = {"Accept-Encoding": "gzip"})
+        assert response.status == 200
+        assert response.getheader("Content-Encoding") == "gzip"
+        assert response.getheader("Vary") == "Accept-Encoding"
+        assert response.getheader("Content-Type") == "text/x-python; charset=utf-8"
+        assert gzip.decompress(body) == PY_CONTENT
+        gzip_etag = response.getheader("ETag")
+
+        for headers in [{}, {"Accept-Encoding": "gzip;q=0"}, {"Accept-Encoding": "identity"}]:
+            response, body = request(connection, "/a.py", headers = headers)
+            assert response.getheader("Content-Encoding") is None
+            assert response.getheader("ETag") != gzip_etag
+            assert body == PY_CONTENT
+
+        # 圧縮したファイルが古い場合は、元のファイルを送る
+        os.utime(public_dir / "a.py.gz", ns = (0, 0))
+        response, body = request(connection, "/a.py", headers = {"Accept-Encoding": "gzip"})
+        assert response.getheader("Content-Encoding") is None
+        assert body == PY_CONTENT
+
+    def test_range(self, connection: HTTPConnection):
+        """
+        Range で、ファイルの一部を送ることのテスト
+        """
+        response, body = request(connection, "/data.bin", headers = {"Range": "bytes=0-9"})
+        assert response.status == 206
+        assert response.getheader("Content-Range") == "bytes 0-9/1024"
+        assert response.getheader("Accept-Ranges") == "bytes"
+        assert body == BIN_CONTENT[:10]
+        etag = response.getheader("ETag")
+
+        response, body = request(connection, "/data.bin", headers = {"Range": "bytes=-10"})
+        assert response.status == 206
+        assert response.getheader("Content-Range") == "bytes 1014-1023/1024"
+        assert body == BIN_CONTENT[-10:]
+
+        response, body = request(connection, "/data.bin", headers = {"Range": "bytes=1000-"})
+        assert response.status == 206
+        assert body == BIN_CONTENT[1000:]
+
+        for path, header in [("/data.bin", "bytes=2000-"), ("/empty.txt", "bytes=-5"), ("/empty.txt", "bytes=0-")]:
+            response, body = request(connection, path, headers = {"Range": header})
+            assert response.status == 416
+            assert response.getheader("Content-Range").startswith("bytes */")
+            assert body == b""
+
+        # If-Range が一致すれば一部を、一致しなければ全体を送る
+        response, body = request(connection, "/data.bin", headers = {"Range": "bytes=0-9", "If-Range": etag})
+        assert response.status == 206
+        assert body == BIN_CONTENT[:10]
+
+        response, body = request(connection, "/data.bin", headers = {"Range": "bytes=0-9", "If-Range": '"other"'})
+        assert response.status == 200
+        assert body == BIN_CONTENT
+
+        response, body = request(connection, "/data.bin", headers = {"Range": "bytes=0-9", "If-Range": formatdate(0, usegmt = True)})
+        assert response.status == 200
+        assert body == BIN_CONTENT
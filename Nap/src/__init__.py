@@ -0,0 +1,10 @@
+"""
+トランプゲーム Nap
+
+Note:
+    このパッケージ、およびサブパッケージの import では、重い依存パッケージを読み込まない
+        pandas: NapDeclaration.table を参照した時
+        PIL: Field.make_image を実行した時
+        numpy: src.utils.Dealer, src.game.ColumnarExporter を参照した時
+    短時間で終了するワーカーのプロセスや、pyscript の起動を速くするため
+"""
@@ -1,4 +1,6 @@
 from .bid import (
     NapBid,
     NapDeclaration,
+    DeclarationRecord,
+    NAP_DECLARATION_RECORDS,
 )
\ No newline at end of file
@@ -1,6 +1,6 @@
 from enum import IntEnum
-import pandas as pd
 import random
+from typing import NamedTuple
 
 from ..player import (
     Player,
@@ -10,6 +10,10 @@ from ..field import (
     Field,
 )
 
+from ..utils import (
+    BidMade,
+)
+
 class BaseDeclaration:
     def __eq__(self, other) -> bool:
         """Equal.
@@ -42,28 +46,84 @@ class BaseDeclaration:
         """
         return self.d_value <= other.d_value
 
+class DeclarationRecord(NamedTuple):
+    """
+    宣言の情報
+
+    Attributes:
+        name (str): 宣言の名称
+        d_value (int): 宣言の強さ
+        description (str): 宣言の説明
+        success_point (int): 宣言を達成した時の点数
+        failure_point (int): 宣言を達成できなかった時の点数
+    """
+    name: str
+    d_value: int
+    description: str
+    success_point: int
+    failure_point: int
+
+# ナップのゲームにおける宣言の一覧 (宣言の強さの順)
+NAP_DECLARATION_RECORDS: tuple[DeclarationRecord, ...] = (
+    DeclarationRecord("pass", -1, "宣言なし", 0, 0),
+    DeclarationRecord("no_declare", 0, "未宣言", 0, 0),
+    DeclarationRecord("two", 1, "2トリック以上勝つ", 2, -2),
+    DeclarationRecord("three", 2, "3トリック以上勝つ", 3, -3),
+    DeclarationRecord("misere", 3, "全トリック負ける", 3, -3),
+    DeclarationRecord("four", 4, "4トリック以上勝つ", 4, -4),
+    DeclarationRecord("nap", 5, "全トリック勝つ", 10, -6),
+    DeclarationRecord("wellington", 6, "全トリック勝つ", 20, -12),
+)
+_NAP_RECORD_BY_NAME: dict[str, DeclarationRecord] = {r.name: r for r in NAP_DECLARATION_RECORDS}
+
+# 宣言ごとの、コールできる宣言の名称 (パスは除く)
+_NAP_DECLARABLE_NAMES: dict[str, tuple[str, ...]] = {
+    r.name: tuple(o.name for o in NAP_DECLARATION_RECORDS if o.d_value > r.d_value)
+    for r in NAP_DECLARATION_RECORDS
+}
+
+class DeclarationTable:
+    """
+    宣言の一覧を DataFrame として参照するためのディスクリプタ
+
+    Note:
+        pandas は、table を参照した時に初めて import する
+        宣言の処理は NAP_DECLARATION_RECORDS を利用し、DataFrame は利用しない
+    """
+    def __init__(self, records: tuple[DeclarationRecord, ...]):
+        """
+        Args:
+            records (tuple[DeclarationRecord, ...]): 宣言の一覧
+        """
+        self.records = records
+        self._table = None
+
+    def __get__(self, instance, owner):
+        if self._table is None:
+            import pandas as pd
+            self._table = pd.DataFrame.from_records(self.records, columns = DeclarationRecord._fields)
+        return self._table
+
 class NapDeclaration(BaseDeclaration):
     """
     ナップのゲームにおける宣言
+
+    Attributes:
+        table (pd.DataFrame): 宣言の一覧
+            参照した時に作成する (DeclarationTable 参照)
+
+    Note:
+        宣言の情報は、import 時に作成した NAP_DECLARATION_RECORDS から辞書で引く
     """
-    table = pd.DataFrame.from_records([
-        ["pass", -1, "宣言なし", 0, 0],
-        ["no_declare", 0, "未宣言", 0, 0],
-        ["two", 1, "2トリック以上勝つ", 2, -2],
-        ["three", 2, "3トリック以上勝つ", 3, -3],
-        ["misere", 3, "全トリック負ける", 3, -3],
-        ["four", 4, "4トリック以上勝つ", 4, -4],
-        ["nap", 5, "全トリック勝つ", 10, -6],
-        ["wellington", 6, "全トリック勝つ", 20, -12]
-    ], 
-    columns=["name", "d_value", "description", "success_point", "failure_point"])
+    table = DeclarationTable(NAP_DECLARATION_RECORDS)
 
     def __init__(self, name: str = "no_declare"):
-        if name not in self.table["name"].values:
+        record = _NAP_RECORD_BY_NAME.get(name)
+        if record is None:
             raise ValueError(f"NapDeclaration において、異常なビッド: {name}")
         
         self.name = name
-        self.d_value = self.table.query(f"name == '{name}'")["d_value"].values[0]
+        self.d_value = record.d_value
 
     def __repr__(self):
         return f"NapDeclaration(name={self.name})"
@@ -88,7 +148,7 @@ class NapDeclaration(BaseDeclaration):
         自身のディクレアに対してコールできるディクレアの一覧を返す
         """
         declarable_list = [NapDeclaration("pass")]
-        declarable_list += [NapDeclaration(d) for d in self.table.query(f"d_value > {self.d_value}")["name"].values]
+        declarable_list += [NapDeclaration(d) for d in _NAP_DECLARABLE_NAMES[self.name]]
 
         return declarable_list
     
@@ -117,11 +177,12 @@ class NapDeclaration(BaseDeclaration):
         return False
     
     def get_point(self, is_achieved: bool) -> int:
+        record = _NAP_RECORD_BY_NAME[self.name]
         if is_achieved:
-            point = int(self.table.query(f"name == '{self.name}'")["success_point"].values[0])
+            point = record.success_point
 
         else:
-            point = int(self.table.query(f"name == '{self.name}'")["failure_point"].values[0])
+            point = record.failure_point
 
         return point
 
@@ -129,18 +190,30 @@ class NapBid:
     """
     ナップのゲームにおけるビッドの進行を管理する
     """
-    def __init__(self, field: Field):
+    def __init__(self, field: Field, is_headless: bool = False, rng: random.Random | None = None, advisor = None):
         """
         ビッドの準備
 
+        Args:
+            field (Field): フィールド
+            is_headless (bool): 表示を行わないかどうか
+                True の場合、メッセージの作成を行わない
+            rng (random.Random | None): 最初に宣言するプレイヤーの決定に利用する乱数生成器
+                指定がなければ、random モジュールの乱数を利用する
+            advisor (BidAdvisor | None): CPU の宣言を選ぶアドバイザー
+                指定がなければ、CPU は Player.declare の通りランダムに宣言する
+
         Note:
             最初に宣言するプレイヤーはランダム            
         """
         self.field = field
+        self.is_headless = is_headless
+        self.advisor = advisor
         self.declarations = {p: NapDeclaration("no_declare") for p in self.field.players}
         self.best_declaration = NapDeclaration("no_declare")
 
-        self.start_bit_player_id = random.randint(0, len(self.field.players)-1)
+        rng = random if rng is None else rng
+        self.start_bit_player_id = rng.randint(0, len(self.field.players)-1)
         self.is_finish_flag = False
         self.bid_cnt = 0
         self.declarer = None
@@ -158,6 +231,7 @@ class NapBid:
                 1. ビッドを行うプレイヤーを決定
                 2. 宣言
                 3. 宣言を格納
+                    購読者がいれば、BidMade を発生させる
                 4. bid_cnt をインクリメント
         """
         if self.is_finish_flag:
@@ -174,7 +248,8 @@ class NapBid:
             """
             前の宣言がパスであれば、宣言できない
             """
-            self.field.message = f"{player} はすでにパスを宣言しているので、これ以上の宣言はできない"
+            if not self.is_headless:
+                self.field.message = f"{player} はすでにパスを宣言しているので、これ以上の宣言はできない"
 
             # closing
             self.bid_cnt += 1
@@ -188,13 +263,17 @@ class NapBid:
             選択できる宣言がなければ、パス扱いとなる
             """
             new_declaration = NapDeclaration(name = "pass")
-            self.field.message = f"{player} は {str(new_declaration)} しか宣言できない"
+            if not self.is_headless:
+                self.field.message = f"{player} は {str(new_declaration)} しか宣言できない"
 
         else:
             new_declaration = self.bid(player, declarable_list)
-            self.field.message = f"{player} が {str(new_declaration)} を宣言した"
+            if not self.is_headless:
+                self.field.message = f"{player} が {str(new_declaration)} を宣言した"
 
         self.declarations[player] = new_declaration
+        if self.field.events:
+            self.field.events.emit(BidMade(player.name, str(new_declaration)))
 
         if not new_declaration.is_pass():
             self.best_declaration = new_declaration
@@ -254,7 +333,13 @@ class NapBid:
             declarable_list: list[NapDeclaration]) -> NapDeclaration:
         """
         プレイヤーの宣言の処理
+
+        Note:
+            アドバイザーがあれば、CPU は手札から期待値が最も高い宣言を選ぶ
         """
+        if self.advisor is not None and player.cpu:
+            return self.advisor.choose(player.hand_board.mask, declarable_list)
+
         declaration = player.declare(declarable_list)
         return declaration
     
@@ -1,14 +1,187 @@
-from PIL import Image
-
 from .player import Player
 
 from .utils import (
     Card,
     Suit,
+    SUIT_INDEX,
+    SUIT_POWER_TABLE,
+    STRENGTH_TABLE,
     Deck,
+    Bitboard,
+    EventStream,
 )
 from .utils.base import BasePicture
 
+class FieldRenderer:
+    """
+    フィールドを文字列で表現するクラス
+
+    Attributes:
+        width (int): 文字列で表現するときの幅
+        pad_str (str): 文字列で表現するときに埋める文字列
+
+    Note:
+        フィールドの文字列を区画に分け、区画ごとに作成した文字列をキャッシュする
+            1. 枚数 (ウィドー、山札、捨て札)
+            2. 場に出されたカード
+            3. 切り札、台札
+            4. 各プレイヤー (手札、ポイント、宣言)
+            5. メッセージ (毎回作成する)
+
+        各区画は、その区画の状態を表すキーと一緒に保存する
+            キーが変わった区画のみ作り直し、最後に 1 度だけ結合する
+
+        プレイヤーの区画は、手札 (card_id の並び)、ポイント、CPU かどうか、宣言から作り直しを判断する
+            そのため、show_hand はこれらの状態のみで決まることを前提とする
+    """
+    def __init__(self, width: int = 50, pad_str: str = "#"):
+        """
+        Args:
+            width (int): 文字列で表現するときの幅
+            pad_str (str): 文字列で表現するときに埋める文字列
+        """
+        self.width = width
+        self.pad_str = pad_str
+
+        # tab の文字列の準備
+        self.token_tab1 = f"{pad_str}\t"
+        self.token_tab2 = f"{pad_str}\t\t"
+        self.token_tab3 = f"{pad_str}\t\t\t"
+        self.token_tab4 = f"{pad_str}\t\t\t\t"
+
+        # 変化しない区画
+        self.header = f"\n{pad_str * width}\n{pad_str}\n"
+        self.players_header = f"{pad_str}\n{self.token_tab1}Players\n"
+        self.footer = f"{pad_str}\n{pad_str * width}"
+
+        self._cache = {}
+
+    def render(self, field: "Field") -> str:
+        """
+        フィールドを文字列で表現する
+
+        Args:
+            field (Field): フィールド
+
+        Returns:
+            str: フィールドの状況
+
+        Note:
+            メッセージは、表示し終えたら message_log に移して削除する
+        """
+        fragments = [self.header]
+
+        # 枚数の区画
+        key = (len(field.widow), len(field.deck), len(field.trash))
+        fragments.append(self._fragment("count", key, self._make_count, *key))
+
+        # 場に出されたカードの区画
+        key = tuple((name, card.card_id) for name, card in field.cards.items())
+        fragments.append(self._fragment("cards", key, self._make_cards, field.cards))
+
+        # 切り札、台札の区画
+        lead = field.lead if field.is_use_lead else None
+        key = (field.trump, lead)
+        fragments.append(self._fragment("suit", key, self._make_suit, *key))
+
+        # プレイヤーの区画
+        fragments.append(self.players_header)
+        for index, player in enumerate(field.players):
+            declaration = None
+            if field.declaration != "" and (str(field.declarer) == str(player)):
+                declaration = field.declaration
+
+            key = (str(player), player.cpu, tuple(card.card_id for card in player.cards), player.point, declaration)
+            fragments.append(self._fragment(("player", index), key, self._make_player, player, declaration))
+
+        # メッセージの区画
+        if field.message != "":
+            fragments.append(self._make_message(field.message))
+            # 表示し終えたら削除する
+            field.message_log.append(field.message)
+            field.message = ""
+
+        fragments.append(self.footer)
+
+        return "".join(fragments)
+
+    def _fragment(self, section, key, make, *args) -> str:
+        """
+        区画の文字列を取得する
+
+        Args:
+            section: 区画
+            key: 区画の状態
+            make (Callable[..., str]): 区画の文字列を作成する関数
+            args: make に渡す引数
+
+        Returns:
+            str: 区画の文字列
+
+        Note:
+            状態が前回と同じであれば、キャッシュした文字列を返す
+            変わっていれば、作り直してキャッシュする
+        """
+        cached = self._cache.get(section)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        text = make(*args)
+        self._cache[section] = (key, text)
+        return text
+
+    def _make_count(self, widow_num: int, deck_num: int, trash_num: int) -> str:
+        """
+        枚数の区画 (ウィドー、山札、捨て札)
+        """
+        text = ""
+        if widow_num != 0:
+            text += f"{self.token_tab3}ウィドー: {widow_num}\n"
+        text += f"{self.token_tab3}山札: {deck_num}\n"
+        text += f"{self.token_tab3}捨て札: {trash_num}\n"
+        return text
+
+    def _make_cards(self, cards: dict[str, Card]) -> str:
+        """
+        場に出されたカードの区画
+        """
+        if len(cards) == 0:
+            return f"{self.token_tab3}場: 0\n"
+
+        text = f"{self.token_tab3}場:\n"
+        for name, card in cards.items():
+            text += f"{self.token_tab4}{name}: {str(card)}\n"
+        return text
+
+    def _make_suit(self, trump: Suit | None, lead: Suit | None) -> str:
+        """
+        切り札、台札の区画
+        """
+        text = ""
+        if trump:
+            text += f"{self.token_tab3}切り札: {trump.mark}\n"
+        if lead is not None:
+            text += f"{self.token_tab3}台札: {lead.mark}\n"
+        return text
+
+    def _make_player(self, player: Player, declaration: str | None) -> str:
+        """
+        プレイヤーの区画
+
+        Note:
+            表示するカードの情報は、プレイヤーに見せてもらう
+        """
+        hand = [str(card) for card in player.show_hand()]
+        if declaration is not None:
+            return f"{self.token_tab2}{player} [{declaration}] ({player.point}): {hand}\n"
+        return f"{self.token_tab2}{player} ({player.point}): {hand}\n"
+
+    def _make_message(self, message: str) -> str:
+        """
+        メッセージの区画
+        """
+        return f"{self.pad_str}\n{self.token_tab1}Message\n{self.token_tab2}{message}\n{self.pad_str}\n"
+
 class Field(BasePicture):
     """A field of Nap.
     
@@ -41,14 +214,22 @@ class Field(BasePicture):
         Attributes:
             cards (dict{Player: Card}): プレイヤーが出したカード
             trash (list[Card]): 捨て札
+            trash_board (Bitboard): 捨て札のマスク
+            events (EventStream): このフィールドで行われるゲームのイベント
+                Track, NapBid, Game がイベントを発生させる
+            _renderers (dict{tuple[int, str]: FieldRenderer}): 表示の幅と埋める文字列ごとの描画
+            _lead (Suit | None): 台札のスート (カードを出した時に決める)
 
         Note:
             カードとプレイヤーがいなければ、そこはフィールドではない
         """
         super().__init__()
-        self.cards = {}
+        self._cards = {}
+        self._lead = None
         self.trash = []
+        self.trash_board = Bitboard()
         self.message_log = []
+        self.events = EventStream()
 
         self.deck = deck
         self.players = players
@@ -59,6 +240,7 @@ class Field(BasePicture):
         self._declarer = ""
         self._message = ""
         self._is_use_lead = False
+        self._renderers = {}
 
     def __str__(self, width: int = 50, pad_str: str = "#") -> str:
         """
@@ -84,70 +266,15 @@ class Field(BasePicture):
             2. プレイヤーの情報
                 a. 手札の情報
                     プレイヤーにカードを見せてもらう
-        """
 
-        # tab の文字列の準備
-        token_tab1 = f"{pad_str}\t"
-        token_tab2 = f"{pad_str}\t\t"
-        token_tab3 = f"{pad_str}\t\t\t"
-        token_tab4 = f"{pad_str}\t\t\t\t"
-
-        # フィールドを表現する文字列の準備
-        field_str = "\n"
-        field_str += pad_str * width
-        field_str += f"\n{pad_str}\n"
-
-        # widow の表示
-        if len(self.widow) != 0:
-            field_str += f"{token_tab3}ウィドー: {len(self.widow)}\n"
-        
-        # 山札、捨て札の表示
-        field_str += f"{token_tab3}山札: {len(self.deck)}\n"
-        field_str += f"{token_tab3}捨て札: {len(self.trash)}\n"
-
-        # 出されているカードの件数の表示
-        if len(self.cards) == 0:
-            field_str += f"{token_tab3}場: {len(self.cards)}\n"
-        else:
-            field_str += f"{token_tab3}場:\n"
-
-            # 場に出されてカードの情報
-            for n, c in self.cards.items():
-                field_str += f"{token_tab4}{n}: {str(c)}\n"
-
-        # 切り札の表示
-        if self.trump:
-            field_str += f"{token_tab3}切り札: {self.trump.mark}\n"
-
-        # 台札の表示
-        if self.is_use_lead and self.lead is not None:
-            field_str += f"{token_tab3}台札: {self.lead.mark}\n"
-
-        # プレイヤーの情報の表示
-        field_str += f"{pad_str}\n"
-        field_str += f"{token_tab1}Players\n"
-        for player in self.players:
-
-            # 表示するカードの情報を取得する
-            hand = player.show_hand()
-            if self.declaration != "" and (str(self.declarer) == str(player)):
-                field_str += f"{token_tab2}{player} [{self.declaration}] ({player.point}): {[str(card) for card in hand]}\n"
-            else:
-                field_str += f"{token_tab2}{player} ({player.point}): {[str(card) for card in hand]}\n"
-            
-        if self.message != "":
-            field_str += f"{pad_str}\n"
-            field_str += f"{token_tab1}Message\n"
-            field_str += f"{token_tab2}{self.message}\n"
-            field_str += f"{pad_str}\n"
-            # 表示し終えたら削除する
-            self.message_log.append(self.message)
-            self.message = ""
-
-        field_str += f"{pad_str}\n"
-        field_str += pad_str * width
+            各区画の文字列は FieldRenderer でキャッシュし、変更があった区画のみ作り直す
+        """
+        renderer = self._renderers.get((width, pad_str))
+        if renderer is None:
+            renderer = FieldRenderer(width, pad_str)
+            self._renderers[(width, pad_str)] = renderer
 
-        return field_str
+        return renderer.render(self)
 
     @property
     def trump(self) -> Suit:
@@ -224,15 +351,31 @@ class Field(BasePicture):
         """
         self._message = message
 
+    @property
+    def cards(self) -> dict[str, Card]:
+        """場に出されたカードの getter
+        """
+        return self._cards
+
+    @cards.setter
+    def cards(self, cards: dict[str, Card]) -> None:
+        """場に出されたカードの setter
+
+        Attributes:
+            cards (dict[str, Card]): プレイヤーの名前と出したカード (出した順)
+        """
+        self._cards = cards
+        self._lead = next(iter(cards.values())).suit if cards else None
+
     @property
     def lead(self) -> Suit | None:
         """
         台札 (あるトラックで、一番最初に出されたカード)のスート
+
+        Note:
+            put_card で最初のカードを受け取った時に決める
         """
-        if len(self.cards) == 0:
-            return None
-        else:
-            return list(self.cards.values())[0].suit
+        return self._lead
     
     @property
     def is_use_lead(self) -> bool:
@@ -257,7 +400,22 @@ class Field(BasePicture):
             name (str): Name of a player.
             card (Card): A card.
         """
-        self.cards[name] = card
+        if not self._cards:
+            self._lead = card.suit
+        self._cards[name] = card
+
+    def strength_row(self, use_lead: bool = True) -> tuple[int, ...]:
+        """
+        現在の切り札と台札における、各カードの強さ
+
+        Args:
+            use_lead (bool): 台札を考慮するかどうか
+
+        Returns:
+            tuple[int, ...]: カードの id ごとの強さ (STRENGTH_TABLE 参照)
+        """
+        lead = self._lead if use_lead else None
+        return STRENGTH_TABLE[SUIT_INDEX[self._trump]][SUIT_INDEX[lead]]
     
     def suit_strength(self, suit: Suit) -> int:
         """Suit strength.
@@ -281,34 +439,22 @@ class Field(BasePicture):
             6. club
             
             ゲームによっては変わるので、コールバックするメソッドをもらって、実行するでもいいかも
+
+            Joker (スートなし) の場合は 0
+            強さは SUIT_POWER_TABLE から引く
         """
-        
-        if suit == self.trump:
-            return 6
-        elif suit == self.lead:
-            return 5
-        elif suit == Suit.spade:
-            return 4
-        elif suit == Suit.heart:
-            return 3
-        elif suit == Suit.diamond:
-            return 2
-        elif suit == Suit.club:
-            return 1
-        else:
-            """
-            Note:
-                Joker の場合
-            """
-            return 0
+        return SUIT_POWER_TABLE[SUIT_INDEX[self._trump]][SUIT_INDEX[self._lead]][SUIT_INDEX[suit]]
 
     def clear(self) -> None:
         """Reset a field.
         
         場のカードをリセットする
         """
-        self.trash.extend(self.cards.values())
-        self.cards = {}
+        self.trash.extend(self._cards.values())
+        for card in self._cards.values():
+            self.trash_board.add(card)
+        self._cards = {}
+        self._lead = None
         
     def make_image(self, save_path: str = None) -> None:
         """
@@ -316,7 +462,12 @@ class Field(BasePicture):
         
         Args:
             save_path (str): 画像ファイルとして出力するパス
+
+        Note:
+            PIL は画像を作成する時に初めて import する
         """
+        from PIL import Image
+
         image = Image.new("RGB", self.image_size, self.color)
         
         if save_path:
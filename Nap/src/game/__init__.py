@@ -17,4 +17,40 @@ from .vs_series import (
     EasyNapVSTakeshi,
     EasyNapVSShizuka,
     NapVSShizuka,
-)
\ No newline at end of file
+)
+from .game_log import (
+    GameRecord,
+    GameRecorder,
+    GameLogWriter,
+    GameLogReader,
+)
+from .simulator import (
+    GameResult,
+    Simulator,
+)
+from .tournament import (
+    TournamentStats,
+    Tournament,
+)
+from .solver import DoubleDummySolver
+from .equity import (
+    EquityTable,
+    build_equity_table,
+)
+from .advisor import (
+    BidEstimate,
+    BidAdvisor,
+)
+
+def __getattr__(name: str):
+    """
+    numpy を利用するクラスは、参照した時に初めて import する
+
+    Args:
+        name (str): 属性の名前
+    """
+    if name == "ColumnarExporter":
+        from .exporter import ColumnarExporter
+        return ColumnarExporter
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
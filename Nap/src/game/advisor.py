@@ -0,0 +1,196 @@
+from typing import NamedTuple
+
+from ..utils import (
+    Card,
+    Deck,
+    SimpleDeck,
+    Bitboard,
+    LRUCache,
+    canonical_hand,
+)
+
+from ..bid import (
+    NapDeclaration,
+    NAP_DECLARATION_RECORDS,
+)
+
+from .solver import DoubleDummySolver
+from .equity import (
+    FROM_LEAD_COLUMN,
+    EquityTable,
+    sample_trick_counts,
+)
+
+# 評価する宣言の名称 (パスと未宣言は除く)
+_DECLARATION_NAMES: tuple[str, ...] = tuple(r.name for r in NAP_DECLARATION_RECORDS if r.d_value > 0)
+
+class BidEstimate(NamedTuple):
+    """
+    1 つの宣言の評価
+
+    Attributes:
+        name (str): 宣言の名称
+        success_rate (float): 宣言を達成する確率の推定値
+        expected_point (float): 獲得する点数の期待値
+            success_point * success_rate + failure_point * (1 - success_rate)
+    """
+    name: str
+    success_rate: float
+    expected_point: float
+
+class BidAdvisor:
+    """
+    手札から、ナップの宣言ごとの達成する確率と点数の期待値を推定するクラス
+
+    Attributes:
+        player_num (int): プレイヤー数
+        hand_num (int): 手札の枚数
+        sample_num (int): 1 つの手札について、他のプレイヤーの手札を配り直す回数
+        seed (int): 配り直しに利用する乱数のシード
+        solver (DoubleDummySolver): 配り直した局面を解くソルバー
+        cache (LRUCache): 標準形の手札のマスクごとの評価
+        equity_table (EquityTable | None): 事前に作成した手札ごとの獲得トリック数の表
+
+    Note:
+        推定の方法
+            1. 見えていないカードを、他のプレイヤーに配り直す
+            2. 自分がディクレアラーとして最初のトラックを始め、台札のスートを切り札として解く
+                ミゼールは、他のプレイヤーの獲得トリック数を最大化する問題として別に解く
+            3. 1, 2 を sample_num 回繰り返し、NapDeclaration.is_achieved で達成した割合を数える
+        点数は NAP_DECLARATION_RECORDS (NapDeclaration.table と同じ) の success_point, failure_point
+        equity_table があれば、表にある手札は解かずに、表の回数から求める
+
+        全員の手札が見えている場合の最善の結果なので、実際より楽観的な推定となる
+        ビッドの時点では切り札が決まっていないので、スートを入れ替えた手札は同じ評価となる
+            そのため、評価は標準形 (canonical_hand) の手札ごとに求めて、キャッシュする
+            配り直しの乱数は (seed, 標準形の手札のマスク) から作るので、同じ手札は常に同じ評価となる
+    """
+    def __init__(self,
+                 player_num: int = 3,
+                 hand_num: int = 5,
+                 deck_class: type[Deck] = SimpleDeck,
+                 sample_num: int = 16,
+                 seed: int = 0,
+                 max_cache_size: int = 65536,
+                 equity_table: EquityTable | None = None):
+        """
+        Args:
+            player_num (int): プレイヤー数
+            hand_num (int): 手札の枚数
+            deck_class (type[Deck]): ゲームに利用するデッキ
+            sample_num (int): 1 つの手札について、他のプレイヤーの手札を配り直す回数
+            seed (int): 配り直しに利用する乱数のシード
+            max_cache_size (int): キャッシュする手札の数の上限
+            equity_table (EquityTable | None): 事前に作成した表 (build_equity_table 参照)
+        """
+        if sample_num < 1:
+            raise ValueError(f"sample_num は 1 以上: {sample_num}")
+
+        self.player_num = player_num
+        self.hand_num = hand_num
+        self.sample_num = sample_num
+        self.seed = seed
+        self.solver = DoubleDummySolver(use_lead = True)
+        self.cache = LRUCache(max_cache_size)
+        self.equity_table = None
+        self.set_equity_table(equity_table)
+
+        self._deck_mask = Bitboard.from_cards(deck_class.model_fields["cards"].default_factory()).mask
+
+    def set_equity_table(self, equity_table: EquityTable | None) -> None:
+        """
+        事前に作成した表を設定する
+
+        Args:
+            equity_table (EquityTable | None): 事前に作成した表 (None の場合は、全ての手札を解く)
+
+        Raises:
+            ValueError: 表のプレイヤー数、手札の枚数が違う場合
+
+        Note:
+            表は解いた結果を速く求めるためのもので、評価はどちらでもほぼ同じなので、キャッシュはそのまま使う
+        """
+        if equity_table is not None and (equity_table.player_num, equity_table.hand_num) != (self.player_num, self.hand_num):
+            raise ValueError(f"表のプレイヤー数、手札の枚数が違う: {equity_table}")
+        self.equity_table = equity_table
+
+    def evaluate(self, cards: list[Card] | int) -> dict[str, BidEstimate]:
+        """
+        手札の宣言ごとの評価を取得する
+
+        Args:
+            cards (list[Card] | int): 手札 (カードか、カードのマスク)
+
+        Returns:
+            dict[str, BidEstimate]: 宣言の名称ごとの評価 (パスと未宣言は除く)
+        """
+        hand = canonical_hand(cards if isinstance(cards, int) else Bitboard.from_cards(cards).mask)
+        return self.cache.get_or_compute(hand, lambda: self._estimate(hand))
+
+    def choose(self,
+               cards: list[Card] | int,
+               declarable_list: list[NapDeclaration]) -> NapDeclaration:
+        """
+        宣言できる一覧から、点数の期待値が最も高い宣言を選ぶ
+
+        Args:
+            cards (list[Card] | int): 手札
+            declarable_list (list[NapDeclaration]): 宣言できる一覧
+
+        Returns:
+            NapDeclaration: 選んだ宣言
+                期待値が 0 より高い宣言がなければ、パス
+        """
+        estimates = self.evaluate(cards)
+        best_declaration = NapDeclaration("pass")
+        best_point = 0.0
+        for declaration in declarable_list:
+            estimate = estimates.get(declaration.name)
+            if estimate is not None and estimate.expected_point > best_point:
+                best_declaration = declaration
+                best_point = estimate.expected_point
+
+        return best_declaration
+
+    def _estimate(self, hand: int) -> dict[str, BidEstimate]:
+        """
+        他のプレイヤーの手札を配り直して解き (表があれば表から)、宣言ごとの評価を求める
+
+        Args:
+            hand (int): 手札のマスク
+
+        Returns:
+            dict[str, BidEstimate]: 宣言の名称ごとの評価
+        """
+        if hand.bit_count() != self.hand_num or hand & ~self._deck_mask:
+            raise ValueError(f"手札が異常: {Bitboard(hand)}")
+
+        if self.equity_table is not None and hand in self.equity_table:
+            trick_cnts = self.equity_table.trick_counts(hand)
+            misere_cnt = self.equity_table.misere_count(hand)
+            sample_num = self.equity_table.sample_num
+        else:
+            column_cnts, misere_cnt = sample_trick_counts(hand,
+                                                          self.player_num,
+                                                          self.hand_num,
+                                                          self.sample_num,
+                                                          self.seed,
+                                                          columns = (FROM_LEAD_COLUMN,),
+                                                          deck_mask = self._deck_mask,
+                                                          solver = self.solver)
+            trick_cnts = column_cnts[FROM_LEAD_COLUMN]
+            sample_num = self.sample_num
+
+        estimates = {}
+        for name in _DECLARATION_NAMES:
+            declaration = NapDeclaration(name)
+            if name == "misere":
+                success_cnt = misere_cnt
+            else:
+                success_cnt = sum(cnt for point, cnt in enumerate(trick_cnts) if declaration.is_achieved(point))
+
+            success_rate = success_cnt / sample_num
+            expected_point = declaration.get_point(True) * success_rate + declaration.get_point(False) * (1 - success_rate)
+            estimates[name] = BidEstimate(name, success_rate, expected_point)
+
+        return estimates
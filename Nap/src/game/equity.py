@@ -0,0 +1,390 @@
+from array import array
+from collections.abc import Callable, Iterable, Sequence
+from itertools import combinations
+from math import comb
+from pathlib import Path
+import random
+import struct
+import sys
+
+from ..utils import (
+    Suit,
+    Bitboard,
+    SUIT_MASKS,
+    iter_card_ids,
+    suit_permutation,
+    permute_suits,
+    canonical_hand,
+)
+
+from ..utils.card import (
+    SUIT_CARD_NUM,
+)
+
+from .solver import DoubleDummySolver
+
+# 表を保存するディレクトリ (build_equity_table の既定の保存先)
+EQUITY_DIR = Path(__file__).parents[2] / "asset" / "equity"
+
+# 切り札の列 (0 は最初の台札のスートを切り札とする Nap のルール、1 - 4 は Suit の値)
+COLUMN_NUM = 1 + len(Suit)
+FROM_LEAD_COLUMN = 0
+
+# ジョーカーのないデッキ (SimpleDeck) のカード
+_DECK_MASK = SUIT_MASKS[1] | SUIT_MASKS[2] | SUIT_MASKS[3] | SUIT_MASKS[4]
+_CARD_NUM = len(Suit) * SUIT_CARD_NUM
+
+# ファイルの形式
+#   ヘッダー: マジック, プレイヤー数, 手札の枚数, 配り直す回数, カードの数, 行の数, 予備
+#   索引: 手札の colex 順位ごとの行の番号 (uint32, 標準形でない手札は _NO_ROW)
+#   行: 列ごとの獲得トリック数 0 - 手札の枚数 の回数 (uint8), ミゼールを達成した回数 (uint8)
+_MAGIC = b"NAPEQTB1"
+_HEADER = struct.Struct("<8sHHHHII")
+_INDEX = struct.Struct("<I")
+_NO_ROW = 0xFFFFFFFF
+
+# colex 順位の計算に利用する二項係数 [n][k]
+_BINOMIALS: tuple[tuple[int, ...], ...] = tuple(
+    tuple(comb(n, k) for k in range(SUIT_CARD_NUM + 1)) for n in range(_CARD_NUM + 1))
+
+def colex_rank(hand: int) -> int:
+    """
+    手札の colex 順位 (同じ枚数の手札の中での番号) を求める
+
+    Args:
+        hand (int): 手札のマスク
+
+    Returns:
+        int: 0 から comb(カードの数, 手札の枚数) - 1 の番号
+
+    Note:
+        小さい順の i 番目 (1 始まり) のカードの id を c_i として、comb(c_i, i) の和
+    """
+    rank = 0
+    for position, card_id in enumerate(iter_card_ids(hand), 1):
+        rank += _BINOMIALS[card_id][position]
+    return rank
+
+def sample_trick_counts(hand: int,
+                        player_num: int,
+                        hand_num: int,
+                        sample_num: int,
+                        seed: int,
+                        columns: Sequence[int] = tuple(range(COLUMN_NUM)),
+                        deck_mask: int = _DECK_MASK,
+                        solver: DoubleDummySolver | None = None) -> tuple[list[list[int]], int]:
+    """
+    他のプレイヤーの手札を配り直して解き、ディクレアラーの獲得トリック数を数える
+
+    Args:
+        hand (int): ディクレアラーの手札のマスク
+        player_num (int): プレイヤー数
+        hand_num (int): 手札の枚数
+        sample_num (int): 配り直す回数
+        seed (int): 配り直しに利用する乱数のシード
+        columns (Sequence[int]): 解く切り札の列
+        deck_mask (int): デッキのカードのマスク
+        solver (DoubleDummySolver | None): 利用するソルバー
+
+    Returns:
+        tuple[list[list[int]], int]: 列ごとの獲得トリック数 (0 - hand_num) の回数, ミゼールを達成した回数
+            解かない列の回数は全て 0
+            ミゼールは、最初の台札のスートを切り札とするルールで解く
+
+    Note:
+        ディクレアラーが最初のトラックを始める
+        全ての列で同じ配り直しを利用する
+        乱数は (seed, hand) から作るので、同じ手札は常に同じ結果となる
+    """
+    solver = DoubleDummySolver(use_lead = True) if solver is None else solver
+    solver.clear()
+    rng = random.Random(hash((seed, hand)))
+    unseen = list(iter_card_ids(deck_mask & ~hand))
+    trick_cnts = [[0] * (hand_num + 1) for _ in range(COLUMN_NUM)]
+    misere_cnt = 0
+
+    for _ in range(sample_num):
+        rng.shuffle(unseen)
+        hands = [hand]
+        for seat in range(1, player_num):
+            mask = 0
+            for card_id in unseen[(seat - 1) * hand_num:seat * hand_num]:
+                mask |= 1 << card_id
+            hands.append(mask)
+
+        for column in columns:
+            if column == FROM_LEAD_COLUMN:
+                point = solver.solve(hands, 0, team = (0,), trump_from_lead = True)
+            else:
+                point = solver.solve(hands, 0, trump = column, team = (0,))
+            trick_cnts[column][point] += 1
+
+        if hand_num == solver.solve(hands, 0, team = (0,), trump_from_lead = True, misere = True):
+            misere_cnt += 1
+
+    return trick_cnts, misere_cnt
+
+def _build_row(args: tuple[int, int, int, int, int]) -> bytes:
+    """
+    1 つの標準形の手札の行を作成する
+
+    Args:
+        args (tuple[int, int, int, int, int]): 手札のマスク, プレイヤー数, 手札の枚数, 配り直す回数, シード
+
+    Returns:
+        bytes: 行
+
+    Note:
+        ワーカーのプロセスでも実行するので、モジュールの関数とする
+    """
+    hand, player_num, hand_num, sample_num, seed = args
+    trick_cnts, misere_cnt = sample_trick_counts(hand, player_num, hand_num, sample_num, seed)
+    return bytes([cnt for column_cnts in trick_cnts for cnt in column_cnts] + [misere_cnt])
+
+def iter_canonical_hands(hand_num: int) -> Iterable[int]:
+    """
+    ジョーカーのないデッキの、標準形の手札を colex 順に列挙する
+
+    Args:
+        hand_num (int): 手札の枚数
+
+    Yields:
+        int: 標準形の手札のマスク
+    """
+    for card_ids in combinations(range(_CARD_NUM), hand_num):
+        mask = 0
+        for card_id in card_ids:
+            mask |= 1 << card_id
+        if canonical_hand(mask) == mask:
+            yield mask
+
+def build_equity_table(path: str | Path | None = None,
+                       player_num: int = 3,
+                       hand_num: int = 5,
+                       sample_num: int = 16,
+                       seed: int = 0,
+                       hands: Iterable[int] | None = None,
+                       max_workers: int = 1,
+                       progress: Callable[[int, int], None] | None = None) -> Path:
+    """
+    標準形の手札ごとの獲得トリック数の表を作成して、ファイルに保存する
+
+    Args:
+        path (str | Path | None): 保存先
+            指定がなければ、EQUITY_DIR の equity_p{プレイヤー数}_h{手札の枚数}.bin
+        player_num (int): プレイヤー数
+        hand_num (int): 手札の枚数
+        sample_num (int): 1 つの手札について、他のプレイヤーの手札を配り直す回数 (255 以下)
+        seed (int): 配り直しに利用する乱数のシード
+        hands (Iterable[int] | None): 表に含める手札のマスク
+            指定がなければ、全ての標準形の手札
+        max_workers (int): 利用するプロセスの数
+        progress (Callable[[int, int], None] | None): (作成した行の数, 行の数) で呼ばれる関数
+
+    Returns:
+        Path: 保存先
+
+    Note:
+        1 つの手札について、列の数 + 1 (ミゼール) の問題を sample_num 回ずつ解くので、時間がかかる
+            5 枚、3 人の全ての手札 (134,459 通り) は、オフラインで max_workers を増やして作成する
+        BidAdvisor と同じシードと配り直す回数であれば、同じ回数となる
+    """
+    if not 1 <= sample_num <= 255:
+        raise ValueError(f"sample_num は 1 以上 255 以下: {sample_num}")
+    if player_num * hand_num > _CARD_NUM:
+        raise ValueError(f"カードが足りない: {player_num} 人 x {hand_num} 枚")
+
+    path = EQUITY_DIR / f"equity_p{player_num}_h{hand_num}.bin" if path is None else Path(path)
+    if hands is None:
+        hands = list(iter_canonical_hands(hand_num))
+    else:
+        hands = sorted(set(canonical_hand(hand) for hand in hands), key = colex_rank)
+    for hand in hands:
+        if hand.bit_count() != hand_num or hand & ~_DECK_MASK:
+            raise ValueError(f"手札が異常: {Bitboard(hand)}")
+
+    tasks = [(hand, player_num, hand_num, sample_num, seed) for hand in hands]
+    rows = []
+    if max_workers == 1:
+        for row in map(_build_row, tasks):
+            rows.append(row)
+            if progress is not None:
+                progress(len(rows), len(tasks))
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers = max_workers) as executor:
+            for row in executor.map(_build_row, tasks, chunksize = 64):
+                rows.append(row)
+                if progress is not None:
+                    progress(len(rows), len(tasks))
+
+    index = array("I", [_NO_ROW]) * comb(_CARD_NUM, hand_num)
+    for row_cnt, hand in enumerate(hands):
+        index[colex_rank(hand)] = row_cnt
+    if sys.byteorder == "big":
+        index.byteswap()
+
+    path.parent.mkdir(parents = True, exist_ok = True)
+    with open(path, "wb") as f:
+        f.write(_HEADER.pack(_MAGIC, player_num, hand_num, sample_num, _CARD_NUM, len(rows), 0))
+        f.write(index.tobytes())
+        f.write(b"".join(rows))
+
+    return path
+
+class EquityTable:
+    """
+    build_equity_table で作成した表を、mmap で参照するクラス
+
+    Attributes:
+        path (Path): 表のファイル
+        player_num (int): プレイヤー数
+        hand_num (int): 手札の枚数
+        sample_num (int): 1 つの手札について、配り直した回数
+        row_num (int): 表にある標準形の手札の数
+
+    Note:
+        開く時はヘッダーのみ読み込み、参照する時に必要な部分のみ読み込まれる
+            1 回の参照は、手札の標準形と colex 順位を求めて、索引と行を 1 回ずつ読むのみ
+        切り札は、Suit か None (最初の台札のスートを切り札とする Nap のルール)
+            標準形にする時のスートの入れ替えで、切り札の列も入れ替える
+    """
+    def __init__(self, path: str | Path):
+        """
+        Args:
+            path (str | Path): 表のファイル
+        """
+        import mmap
+
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access = mmap.ACCESS_READ)
+
+        magic, self.player_num, self.hand_num, self.sample_num, card_num, self.row_num, _ = \
+            _HEADER.unpack_from(self._mm, 0)
+        if magic != _MAGIC or card_num != _CARD_NUM:
+            self.close()
+            raise ValueError(f"表のファイルではない: {self.path}")
+
+        self._row_size = COLUMN_NUM * (self.hand_num + 1) + 1
+        self._row_offset = _HEADER.size + _INDEX.size * comb(_CARD_NUM, self.hand_num)
+        if len(self._mm) != self._row_offset + self._row_size * self.row_num:
+            self.close()
+            raise ValueError(f"表のファイルの大きさが異常: {self.path}")
+
+    @classmethod
+    def find(cls, player_num: int, hand_num: int, directory: str | Path = EQUITY_DIR) -> "EquityTable | None":
+        """
+        既定の保存先にある表を開く
+
+        Args:
+            player_num (int): プレイヤー数
+            hand_num (int): 手札の枚数
+            directory (str | Path): 表を保存したディレクトリ
+
+        Returns:
+            EquityTable | None: 表
+                ファイルがない、または mmap を利用できない環境の場合は None
+        """
+        path = Path(directory) / f"equity_p{player_num}_h{hand_num}.bin"
+        if not path.exists():
+            return None
+        try:
+            return cls(path)
+        except (ImportError, OSError):
+            return None
+
+    def __enter__(self) -> "EquityTable":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"EquityTable(path={self.path}, player_num={self.player_num}, hand_num={self.hand_num}, row_num={self.row_num})"
+
+    def __contains__(self, hand: int) -> bool:
+        return self._find_row(canonical_hand(hand)) is not None
+
+    def close(self) -> None:
+        """
+        ファイルを閉じる
+        """
+        self._mm.close()
+
+    def trick_counts(self, hand: int, trump: Suit | None = None) -> tuple[int, ...]:
+        """
+        獲得トリック数ごとの回数を取得する
+
+        Args:
+            hand (int): 手札のマスク
+            trump (Suit | None): 切り札 (None は最初の台札のスート)
+
+        Returns:
+            tuple[int, ...]: 獲得トリック数 0 - hand_num の回数 (合計は sample_num)
+        """
+        offset, permutation = self._lookup(hand)
+        column = FROM_LEAD_COLUMN if trump is None else permutation.index(int(trump)) + 1
+        start = offset + column * (self.hand_num + 1)
+        return tuple(self._mm[start:start + self.hand_num + 1])
+
+    def expected_tricks(self, hand: int, trump: Suit | None = None) -> float:
+        """
+        獲得トリック数の期待値を取得する
+
+        Args:
+            hand (int): 手札のマスク
+            trump (Suit | None): 切り札 (None は最初の台札のスート)
+
+        Returns:
+            float: 獲得トリック数の期待値
+        """
+        trick_cnts = self.trick_counts(hand, trump)
+        return sum(point * cnt for point, cnt in enumerate(trick_cnts)) / self.sample_num
+
+    def misere_count(self, hand: int) -> int:
+        """
+        ミゼールを達成した回数を取得する
+
+        Args:
+            hand (int): 手札のマスク
+
+        Returns:
+            int: ミゼールを達成した回数 (最初の台札のスートを切り札とするルール)
+        """
+        offset, _ = self._lookup(hand)
+        return self._mm[offset + self._row_size - 1]
+
+    def _find_row(self, canonical: int) -> int | None:
+        """
+        標準形の手札の行の番号を取得する
+
+        Args:
+            canonical (int): 標準形の手札のマスク
+
+        Returns:
+            int | None: 行の番号 (表になければ None)
+        """
+        if canonical.bit_count() != self.hand_num or canonical & ~_DECK_MASK:
+            return None
+        row, = _INDEX.unpack_from(self._mm, _HEADER.size + _INDEX.size * colex_rank(canonical))
+        return None if row == _NO_ROW else row
+
+    def _lookup(self, hand: int) -> tuple[int, tuple[int, ...]]:
+        """
+        手札の行の位置を取得する
+
+        Args:
+            hand (int): 手札のマスク
+
+        Returns:
+            tuple[int, tuple[int, ...]]: 行の位置, 標準形にするためのスートの並び
+
+        Raises:
+            KeyError: 表にない手札
+        """
+        permutation = suit_permutation((hand,))
+        row = self._find_row(permute_suits(hand, permutation))
+        if row is None:
+            raise KeyError(f"表にない手札: {Bitboard(hand)}")
+        return self._row_offset + row * self._row_size, permutation
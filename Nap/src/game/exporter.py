@@ -0,0 +1,256 @@
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+
+import numpy as np
+
+from .game import Game
+from .game_log import (
+    GAME_NAMES,
+    GameRecord,
+    GameRecorder,
+)
+from ..bid import (
+    NAP_DECLARATION_RECORDS,
+)
+
+# 書き出す列 (列名: 型)
+#   hands と tricks は (ゲーム数, プレイヤー数, ...) の 2 次元以上の列
+#   値のない場合は -1 とする
+COLUMNS: dict[str, np.dtype] = {
+    "seed": np.dtype(np.uint64),
+    "game": np.dtype(np.uint8),
+    "hands": np.dtype(np.int8),
+    "trump": np.dtype(np.int8),
+    "declarer": np.dtype(np.int8),
+    "declaration": np.dtype(np.int8),
+    "invalid": np.dtype(np.bool_),
+    "is_achieved": np.dtype(np.int8),
+    "game_point": np.dtype(np.int16),
+    "tricks": np.dtype(np.int8),
+}
+
+_GAME_CODES = {name: code for code, name in enumerate(GAME_NAMES)}
+_PART_PATTERN = "part-*.npz"
+_DECLARATION_CODES = {record.name: code for code, record in enumerate(NAP_DECLARATION_RECORDS)}
+
+class ColumnarExporter:
+    """
+    ゲームの結果を列ごとにまとめて、チャンク単位で書き出すクラス
+
+    Attributes:
+        path (Path): 書き出す先
+            npz: ディレクトリ (チャンクごとに part-00000.npz のファイルを作成する)
+                既にチャンクがあれば、その後の番号から作成する (追記する)
+            parquet: ファイル (チャンクごとに row group を追加する)
+        chunk_size (int): 1 チャンクのゲームの数
+        file_format (str): npz か parquet
+        game_num (int): 書き出したゲームの数 (バッファの分を含む)
+
+    Note:
+        列は COLUMNS の通り
+            hands: (ゲーム数, プレイヤー数, 手札の枚数) の配られたカードの id
+            tricks: (ゲーム数, プレイヤー数) の獲得トリック数
+            declaration: NAP_DECLARATION_RECORDS の番号
+            game: GAME_NAMES の番号
+
+        メモリは 1 チャンク分のみ利用する
+            チャンクの配列は最初のゲームでプレイヤー数と手札の枚数を決めて確保する
+            そのため、プレイヤー数や手札の枚数が違うゲームは混ぜられない
+
+        GameLogWriter と同じく attach / write を持つので、Simulator の log_writer に渡せる
+        parquet は pyarrow を利用する (書き出す時に import する)
+    """
+    def __init__(self,
+                 path: str | Path,
+                 chunk_size: int = 65536,
+                 file_format: str = "npz"):
+        """
+        Args:
+            path (str | Path): 書き出す先
+            chunk_size (int): 1 チャンクのゲームの数
+            file_format (str): npz か parquet
+        """
+        if file_format not in ["npz", "parquet"]:
+            raise ValueError(f"対応していない形式: {file_format}")
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size は 1 以上: {chunk_size}")
+
+        self.path = Path(path)
+        self.chunk_size = chunk_size
+        self.file_format = file_format
+        self.game_num = 0
+
+        self._chunk_cnt = 0
+        self._row = 0
+        self._columns = None
+        self._parquet_writer = None
+
+        if file_format == "npz":
+            self.path.mkdir(parents = True, exist_ok = True)
+            # 既存のチャンクを上書きしないように、続きの番号から書き出す
+            self._chunk_cnt = max((_part_index(part) + 1 for part in self.path.glob(_PART_PATTERN)), default = 0)
+
+    def __enter__(self) -> "ColumnarExporter":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def attach(self, game: Game) -> GameRecorder:
+        """
+        ゲームのイベントを購読し、終了したら書き出す
+
+        Args:
+            game (Game): 書き出すゲーム (カードを配り終えた状態)
+
+        Returns:
+            GameRecorder: 1 ゲーム分の記録
+        """
+        return GameRecorder(game, self)
+
+    def write(self, record: GameRecord) -> None:
+        """
+        1 ゲーム分の結果をバッファに追加する
+
+        Args:
+            record (GameRecord): ゲームのログ
+
+        Note:
+            バッファがいっぱいになったら、チャンクとして書き出す
+        """
+        player_num = len(record.hands)
+        if self._columns is None:
+            self._columns = self._allocate(player_num, len(record.hands[0]))
+
+        columns = self._columns
+        if columns["tricks"].shape[1] != player_num or columns["hands"].shape[2] != len(record.hands[0]):
+            raise ValueError(f"プレイヤー数、手札の枚数が違うゲームは書き出せない: {record.game_name}")
+
+        row = self._row
+        columns["seed"][row] = record.seed or 0
+        columns["game"][row] = _GAME_CODES[record.game_name]
+        columns["hands"][row] = record.hands
+        columns["trump"][row] = -1 if record.trump is None else int(record.trump)
+        columns["declarer"][row] = -1 if record.declarer is None else record.declarer
+        columns["declaration"][row] = -1 if record.declaration is None else _DECLARATION_CODES[record.declaration]
+        columns["invalid"][row] = record.invalid
+        columns["is_achieved"][row] = -1 if record.is_achieved is None else int(record.is_achieved)
+        columns["game_point"][row] = record.game_point or 0
+        columns["tricks"][row] = record.points
+
+        self._row += 1
+        self.game_num += 1
+        if self._row == self.chunk_size:
+            self.flush()
+
+    def write_all(self, records: Iterable[GameRecord]) -> None:
+        """
+        複数のゲームの結果を書き出す
+
+        Args:
+            records (Iterable[GameRecord]): ゲームのログ
+                GameLogReader など
+        """
+        for record in records:
+            self.write(record)
+
+    def flush(self) -> None:
+        """
+        バッファにあるゲームをチャンクとして書き出す
+        """
+        if self._row == 0:
+            return
+
+        chunk = {name: column[:self._row] for name, column in self._columns.items()}
+        if self.file_format == "npz":
+            np.savez(self.path / f"part-{self._chunk_cnt:05d}.npz", **chunk)
+        else:
+            self._write_parquet(chunk)
+
+        self._chunk_cnt += 1
+        self._row = 0
+
+    def close(self) -> None:
+        """
+        残りのゲームを書き出して終了する
+        """
+        self.flush()
+        if self._parquet_writer is not None:
+            self._parquet_writer.close()
+            self._parquet_writer = None
+
+    def _allocate(self, player_num: int, hand_num: int) -> dict[str, np.ndarray]:
+        """
+        1 チャンク分の配列を確保する
+
+        Args:
+            player_num (int): プレイヤー数
+            hand_num (int): 手札の枚数
+        """
+        shapes = {"hands": (self.chunk_size, player_num, hand_num), "tricks": (self.chunk_size, player_num)}
+        return {name: np.empty(shapes.get(name, (self.chunk_size,)), dtype = dtype)
+                for name, dtype in COLUMNS.items()}
+
+    def _write_parquet(self, chunk: dict[str, np.ndarray]) -> None:
+        """
+        チャンクを parquet の row group として書き出す
+
+        Args:
+            chunk (dict[str, np.ndarray]): チャンクの列
+
+        Note:
+            2 次元以上の列は、固定長のリストの列とする
+        """
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        arrays = {}
+        for name, column in chunk.items():
+            if column.ndim == 1:
+                arrays[name] = pa.array(column)
+                continue
+
+            array = pa.array(column.reshape(-1))
+            for size in reversed(column.shape[1:]):
+                array = pa.FixedSizeListArray.from_arrays(array, size)
+            arrays[name] = array
+
+        table = pa.table(arrays)
+        if self._parquet_writer is None:
+            self._parquet_writer = pq.ParquetWriter(self.path, table.schema)
+        self._parquet_writer.write_table(table)
+
+def _part_index(part: Path) -> int:
+    """
+    チャンクのファイル名 (part-00000.npz) から番号を取り出す
+    """
+    return int(part.stem.removeprefix("part-"))
+
+def iter_npz_chunks(path: str | Path) -> Iterator[dict[str, np.ndarray]]:
+    """
+    ColumnarExporter で書き出したチャンクを順に読み込む
+
+    Args:
+        path (str | Path): 書き出したディレクトリ
+
+    Yields:
+        dict[str, np.ndarray]: チャンクの列 (書き出した順)
+    """
+    for part in sorted(Path(path).glob(_PART_PATTERN), key = _part_index):
+        with np.load(part) as data:
+            yield {name: data[name] for name in data.files}
+
+def load_npz_columns(path: str | Path) -> dict[str, np.ndarray]:
+    """
+    ColumnarExporter で書き出した全てのチャンクを結合して読み込む
+
+    Args:
+        path (str | Path): 書き出したディレクトリ
+
+    Returns:
+        dict[str, np.ndarray]: 列
+    """
+    chunks = list(iter_npz_chunks(path))
+    if not chunks:
+        return {}
+    return {name: np.concatenate([chunk[name] for chunk in chunks]) for name in chunks[0]}
@@ -1,11 +1,16 @@
+from collections.abc import Sequence
 from time import sleep
 import random
+from typing import TYPE_CHECKING
 
 from ..utils import (
     Suit,
     Card,
     Deck,
     SimpleDeck,
+    SUIT_POWER_UNIT,
+    TrickWon,
+    GameOver,
 )
 
 from ..field import (
@@ -27,6 +32,9 @@ from .track import (
     NapTrack,
 )
 
+if TYPE_CHECKING:
+    from .advisor import BidAdvisor
+
 class Game:
     """A game of Nap.
     
@@ -42,15 +50,28 @@ class Game:
 
     def __init__(self, 
                  player_how_to_choose: str = "input", 
-                 first_message: str = None):
+                 first_message: str = None,
+                 is_headless: bool = False,
+                 seed: int | None = None,
+                 deal_order: Sequence[int] | None = None):
         """
         Args:
             player_how_to_choose (str): CPU でないプレイヤーがどのようにカードを選択するか
                 Player class 参照
             first_message (str): フィールドに最初に表示させるメッセージ
+            is_headless (bool): 表示を行わずにゲームを進行させるかどうか
+                True の場合、フィールドの表示、メッセージの作成、時間の停止を行わない
+            seed (int | None): このゲームの乱数のシード
+                同じシードであれば、同じゲームが再現される
+            deal_order (Sequence[int] | None): 山札の並び (カードの id)
+                指定した場合、シャッフルせずにこの順番で配る (Dealer 参照)
 
         Attributes:
             field (Field): ゲームを行うためのフィールド
+            is_headless (bool): 表示を行わずにゲームを進行させるかどうか
+            seed (int | None): このゲームの乱数のシード
+            rng (random.Random): このゲームの乱数生成器
+                シャッフル、切り札、先行、CPU の選択は全てこれを利用する
 
         Note:
             ゲームのための準備
@@ -62,8 +83,11 @@ class Game:
                 4. 切り札の決定
                 5. Track を準備
         """
+        self.is_headless = is_headless
+        self._set_rng(seed, deal_order)
         deck = self.set_deck()
         players = self._set_player(player_how_to_choose)
+        self._share_rng(players)
         self.field = Field(deck, players)
 
         self.shuffle()
@@ -72,16 +96,17 @@ class Game:
         self.track_cnt = 0
         self.set_track(start_player_id = 0)
 
-        if first_message:
-            self.field.message = first_message
-        print(self.field)
-        sleep(self.time_lag)
+        if not self.is_headless:
+            if first_message:
+                self.field.message = first_message
+            print(self.field)
+            sleep(self.time_lag)
         
     def set_deck(self) -> Deck:
         """
         ゲームに利用するカードを準備する
         """
-        deck = Deck()
+        deck = Deck(display = not self.is_headless)
         return deck
 
     def _set_player(self, how_to_choose: str = "input") -> list[Player]:
@@ -97,12 +122,40 @@ class Game:
         """
         return [Player("Boss", cpu=True), Player("You", cpu=False)]
 
+    def _set_rng(self, seed: int | None = None, deal_order: Sequence[int] | None = None) -> None:
+        """
+        このゲームの乱数生成器を準備する
+
+        Args:
+            seed (int | None): 乱数のシード
+            deal_order (Sequence[int] | None): 山札の並び
+        """
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self.deal_order = deal_order
+
+    def _share_rng(self, players: list[Player]) -> None:
+        """
+        プレイヤーにこのゲームの乱数生成器を渡す
+
+        Args:
+            players (list[Player]): ゲームに参加するプレイヤー
+        """
+        for player in players:
+            player.rng = self.rng
+
     def shuffle(self) -> None:
         """Shuffle a deck.
         
         そのゲームにおけるシャッフル方法でシャッフルする
+
+        Note:
+            山札の並びが指定されていれば、その順番に並べる
         """
-        self.field.deck.shuffle()
+        if self.deal_order is None:
+            self.field.deck.shuffle(rng = self.rng)
+        else:
+            self.field.deck.arrange(self.deal_order)
 
     def deal(self) -> None:
         """Deal cards.
@@ -141,7 +194,8 @@ class Game:
         self.track = SimpleTrack(
                         field = self.field, 
                         start_player_id = start_player_id, 
-                        time_lag = self.time_lag)
+                        time_lag = self.time_lag,
+                        is_headless = self.is_headless)
 
     def decide_winner_in_track(self) -> Player:
         """
@@ -161,9 +215,11 @@ class Game:
         """
         winner = self.decide_winner_in_track()
         self.add_point(winner)
+        self.emit_trick_won(winner)
 
-        self.field.message = f"Track {self.track_cnt+1} を {winner} がとりました"
-        print(self.field)
+        if not self.is_headless:
+            self.field.message = f"Track {self.track_cnt+1} を {winner} がとりました"
+            print(self.field)
 
     def next_track(self) -> None:
         """
@@ -176,16 +232,43 @@ class Game:
         start_player_id = self.get_start_player_id()
         self.set_track(start_player_id = start_player_id)
 
-        self.field.message = "次の Track です"
-        print(self.field)
+        if not self.is_headless:
+            self.field.message = "次の Track です"
+            print(self.field)
 
     def close_game(self) -> None:
         """
         ゲームを終了させる
+
+        Attributes:
+            winner (Player): このゲームの勝者
         """
-        winner = self.decide_winner_in_game()
-        self.field.message = f"このゲームの勝者は、{winner} です"
-        print(self.field)
+        self.winner = self.decide_winner_in_game()
+        if self.field.events:
+            self.field.events.emit(GameOver(self.winner.name, self.get_points()))
+
+        if not self.is_headless:
+            self.field.message = f"このゲームの勝者は、{self.winner} です"
+            print(self.field)
+
+    def emit_trick_won(self, winner: Player) -> None:
+        """
+        購読者がいれば、TrickWon を発生させる
+
+        Args:
+            winner (Player): トラックの勝者
+        """
+        if self.field.events:
+            self.field.events.emit(TrickWon(winner.name, self.track_cnt, tuple(self.field.cards.items())))
+
+    def get_points(self) -> tuple[tuple[str, int], ...]:
+        """
+        各プレイヤーの獲得トリック数
+
+        Returns:
+            tuple[tuple[str, int], ...]: プレイヤーの名前と獲得トリック数 (着席順)
+        """
+        return tuple((player.name, player.point) for player in self.field.players)
 
     def play(self) -> None:
         """
@@ -205,7 +288,8 @@ class Game:
         """
         for track_cnt in range(self.hand_num):
             for field in self.track:
-                print(field)
+                if not self.is_headless:
+                    print(field)
 
             self.field = field
 
@@ -223,8 +307,10 @@ class SimpleNapGame(Game):
 
     Attributes:
         hand_num (int): このゲームでは、手札は 3 or 5
+        is_use_lead (bool): カードの強さに台札を考慮するかどうか
     """
     hand_num = 3
+    is_use_lead = False
 
     def set_deck(self) -> Deck:
         """
@@ -233,7 +319,7 @@ class SimpleNapGame(Game):
         Note:
             ジョーカーのない Deck を利用する
         """
-        deck = SimpleDeck()
+        deck = SimpleDeck(display = not self.is_headless)
         return deck
 
     def _set_trump(self):
@@ -259,19 +345,14 @@ class SimpleNapGame(Game):
         Note:
             切り札のスートの強さ優先
                 trump (切り札, 6) > spade (4) > heart (3) > diamond (2) > club (1)
-                台札のルールはなし
+                台札のルールはなし (is_use_lead が True の場合は、台札 (5) が切り札の次に強い)
             次に、数字の強さ
                 A > K > Q > J > 10 > ... > 2
-        """
-        if card.num == 1:
-            num_power = 14
-        else:
-            num_power = card.num
 
-        if card.suit == self.field.trump:
-            suit_power = 6
-        else:
-            suit_power = int(card.suit)
+            強さは Field.strength_row の表から引く
+        """
+        strength = self.field.strength_row(self.is_use_lead)[card.card_id]
+        suit_power, num_power = divmod(strength, SUIT_POWER_UNIT)
 
         return (num_power, suit_power)
     
@@ -282,8 +363,9 @@ class SimpleNapGame(Game):
         Returns:
             ある Track における勝者
         """
-        cards_power = {name: self.calculate_strongness(card) for name, card in self.field.cards.items()}
-        winner_name, card_power = max(cards_power.items(), key=lambda x: (x[1][1], x[1][0]))
+        strengths = self.field.strength_row(self.is_use_lead)
+        cards = self.field.cards
+        winner_name = max(cards, key = lambda name: strengths[cards[name].card_id])
         winner_id = [player.name for player in self.field.players].index(winner_name)
         self.winner_id_in_track = winner_id
 
@@ -316,17 +398,24 @@ class EasyNapGame(SimpleNapGame):
 - ジョーカーなしの 52 枚のカード
 """
     hand_num = 5
+    is_use_lead = True
 
     def __init__(self, 
                  player_how_to_choose: str = "input", 
-                 first_message: str = None):
+                 first_message: str = None,
+                 is_headless: bool = False,
+                 seed: int | None = None,
+                 deal_order: Sequence[int] | None = None):
         """
         Args:
             player_how_to_choose (str): CPU でないプレイヤーがどのようにカードを選択するか
                 Player class 参照
             first_message (str): フィールに最初に表示させるメッセージ
+            is_headless (bool): 表示を行わずにゲームを進行させるかどうか
+            seed (int | None): このゲームの乱数のシード
+            deal_order (Sequence[int] | None): 山札の並び (カードの id)
         """
-        super().__init__(player_how_to_choose, first_message)
+        super().__init__(player_how_to_choose, first_message, is_headless, seed, deal_order)
         self.field.is_use_lead = True
 
     def _set_trump(self):
@@ -337,7 +426,7 @@ class EasyNapGame(SimpleNapGame):
             切り札は、ランダム
 
         """
-        self.field.trump = [Suit.spade, Suit.heart, Suit.diamond, Suit.club][random.randint(0, 3)]
+        self.field.trump = [Suit.spade, Suit.heart, Suit.diamond, Suit.club][self.rng.randint(0, 3)]
 
     def get_start_player_id(self) -> int:
         """
@@ -350,7 +439,7 @@ class EasyNapGame(SimpleNapGame):
             最初のトリックの先行は、ランダム / その後は前のトリックの勝者
         """
         if self.track_cnt == 0:
-            start_player_id = random.randint(0, len(self.field.players)-1)
+            start_player_id = self.rng.randint(0, len(self.field.players)-1)
 
         else:
             start_player_id = self.winner_id_in_track
@@ -372,37 +461,8 @@ class EasyNapGame(SimpleNapGame):
         self.track = Track(
                         field = self.field, 
                         start_player_id = start_player_id, 
-                        time_lag = self.time_lag)
-
-    def calculate_strongness(self, card: Card) -> tuple[int, int]:
-        """
-        このゲームにおけるそのカードの強さを計算する
-        
-        Args:
-            card (Card): 強さを計算するカード
-            
-        Returns:
-            Tuple[int, int]: 数字の強さ, スートの強さ
-
-        Note:
-            切り札のスートの強さ優先
-                trump (切り札) > 台札 > spade > heart > diamond > club
-            次に、数字の強さ
-                A > K > Q > J > 10 > ... > 2
-        """
-        if card.num == 1:
-            num_power = 14
-        else:
-            num_power = card.num
-
-        if card.suit == self.field.trump:
-            suit_power = 6
-        elif card.suit == self.field.lead:
-            suit_power = 5
-        else:
-            suit_power = int(card.suit)
-
-        return (num_power, suit_power)
+                        time_lag = self.time_lag,
+                        is_headless = self.is_headless)
 
 class NapGame(EasyNapGame):
     """
@@ -411,6 +471,8 @@ class NapGame(EasyNapGame):
     Attributes:
         decribe (str): ゲームの説明
         hand (int): 手札の枚数
+        bid_advisor (BidAdvisor | None): CPU の宣言を選ぶアドバイザー
+            指定がなければ、CPU はランダムに宣言する
     """
     describe = \
 """
@@ -422,15 +484,25 @@ class NapGame(EasyNapGame):
 - ジョーカーなしの 52 枚のカード
 """
     hand_num = 5
+    bid_advisor = None
 
     def __init__(self, 
                  player_how_to_choose: str = "input", 
-                 first_message: str = None):
+                 first_message: str = None,
+                 is_headless: bool = False,
+                 seed: int | None = None,
+                 deal_order: Sequence[int] | None = None,
+                 bid_advisor: "BidAdvisor | None" = None):
         """
         Args:
             player_how_to_choose (str): CPU でないプレイヤーがどのようにカードを選択するか
                 Player class 参照
             first_message (str): フィールドに最初に表示させるメッセージ
+            is_headless (bool): 表示を行わずにゲームを進行させるかどうか
+            seed (int | None): このゲームの乱数のシード
+            deal_order (Sequence[int] | None): 山札の並び (カードの id)
+            bid_advisor (BidAdvisor | None): CPU の宣言を選ぶアドバイザー
+                指定がなければ、クラスの bid_advisor を利用する
 
         Attributes:
             field (Field): ゲームを行うためのフィールド
@@ -444,18 +516,24 @@ class NapGame(EasyNapGame):
                 3. カードを配る
                 4. Bid の準備
         """
+        self.is_headless = is_headless
+        self._set_rng(seed, deal_order)
         deck = self.set_deck()
         players = self._set_player(player_how_to_choose)
+        self._share_rng(players)
         self.field = Field(deck, players)
         self.shuffle()
         self.deal()
-        self.bid_manager = NapBid(self.field)
+        if bid_advisor is not None:
+            self.bid_advisor = bid_advisor
+        self.bid_manager = NapBid(self.field, is_headless = self.is_headless, rng = self.rng, advisor = self.bid_advisor)
         self.track_cnt = 0
 
-        if first_message:
-            self.field.message = first_message
-        print(self.field)
-        sleep(self.time_lag)
+        if not self.is_headless:
+            if first_message:
+                self.field.message = first_message
+            print(self.field)
+            sleep(self.time_lag)
         # super().__init__(player_how_to_choose, first_message)
         self.field.is_use_lead = True
 
@@ -490,6 +568,10 @@ class NapGame(EasyNapGame):
         """
         各プレイヤーのポイントから勝者を決定する
 
+        Attributes:
+            is_achieved (bool): ディクレアラーが宣言を達成できたかどうか
+            game_point (int): ディクレアラーが獲得した点数
+
         Note:
             ディクレアラーが宣言を達成できたかどうか
         """
@@ -497,6 +579,17 @@ class NapGame(EasyNapGame):
         declarer_point = self.field.players[declarer_id].point
         is_achived = self.bid_manager.best_declaration.is_achieved(declarer_point)
         game_point = self.bid_manager.best_declaration.get_point(is_achieved=is_achived)
+        self.is_achieved = is_achived
+        self.game_point = game_point
+        if self.field.events:
+            self.field.events.emit(GameOver(None, self.get_points(),
+                                            declarer = self.bid_manager.declarer.name,
+                                            declaration = str(self.bid_manager.best_declaration),
+                                            is_achieved = is_achived,
+                                            game_point = game_point))
+
+        if self.is_headless:
+            return
 
         if is_achived:
             result_text = "成功"
@@ -511,7 +604,8 @@ class NapGame(EasyNapGame):
         ビッドを実行し、完了したら、track を始める準備を行う
         """
         for field in self.bid_manager:
-            print(field)
+            if not self.is_headless:
+                print(field)
 
         self.field = field
         self.close_bid()
@@ -526,8 +620,10 @@ class NapGame(EasyNapGame):
 
         self.field.declaration = str(self.bid_manager.best_declaration)
         self.field.declarer = str(self.bid_manager.declarer)
-        self.field.message = f"{self.bid_manager.declarer} の {str(self.bid_manager.best_declaration)} が有効です"
-        print(self.field)
+
+        if not self.is_headless:
+            self.field.message = f"{self.bid_manager.declarer} の {str(self.bid_manager.best_declaration)} が有効です"
+            print(self.field)
 
         # start_player_id = self.field.players.index(self.bid_manager.declarer)
         start_player_id = self.get_start_player_id()
@@ -553,23 +649,26 @@ class NapGame(EasyNapGame):
         for track_cnt in range(self.hand_num):
             for take_cnt, field in enumerate(self.track):
                 if take_cnt == 0 and track_cnt == 0:
-                    card = self.field.cards[self.bid_manager.declarer]
+                    card = self.field.cards[str(self.bid_manager.declarer)]
                     #切り札は、最初のトラックのリードのスート
                     self._set_trump(card.suit)
 
-                print(field)
+                if not self.is_headless:
+                    print(field)
 
             winner = self.decide_winner_in_track()
             self.add_point(winner)
+            self.emit_trick_won(winner)
 
             self.field.clear()
-            print(field)
+            if not self.is_headless:
+                print(field)
 
             self.track_cnt += 1
             start_player_id = self.get_start_player_id()
             self.set_track(start_player_id = start_player_id)
 
-        self.decide_winner_in_game(field)
+        self.decide_winner_in_game()
 
 class NapoleonGame(Game):
     """
@@ -598,6 +697,7 @@ class NapoleonGame(Game):
                 5. プレイヤーの勝敗を決める
         """
         self.field = field
+        self._set_rng()
         
     def deal(self):
         """Deal cards.
@@ -0,0 +1,507 @@
+from collections.abc import Iterator
+import mmap
+from pathlib import Path
+import struct
+from typing import NamedTuple
+
+from ..utils import (
+    Card,
+    Suit,
+    CardPlayed,
+    TrickWon,
+    BidMade,
+    GameOver,
+    GameEvent,
+)
+
+from ..bid import (
+    NAP_DECLARATION_RECORDS,
+)
+
+from .game import (
+    Game,
+)
+
+# ファイルの先頭
+LOG_MAGIC = b"NAPLOG"
+LOG_VERSION = 1
+_FILE_HEADER = struct.Struct("<6sBx")
+
+# 各ゲームの固定長の部分
+#   記録の長さ (この 2 byte を除く), ゲームの種類, フラグ, シード,
+#   プレイヤー数, 手札の枚数, 切り札, 点数, ディクレアラー, 宣言, ビッドの数, トラックの数
+_RECORD_HEADER = struct.Struct("<HBBQBBBbBBBB")
+
+# 記録するゲームの種類 (追加する場合は末尾に追加する)
+GAME_NAMES: tuple[str, ...] = (
+    "SimpleNapGame",
+    "EasyNapGame",
+    "NapGame",
+    "SimpleNapVSTakeshi",
+    "EasyNapVSTakeshi",
+    "EasyNapVSShizuka",
+    "NapVSShizuka",
+)
+_GAME_CODES = {name: code for code, name in enumerate(GAME_NAMES)}
+
+# 宣言の番号
+_DECLARATION_NAMES = tuple(record.name for record in NAP_DECLARATION_RECORDS)
+_DECLARATION_CODES = {name: code for code, name in enumerate(_DECLARATION_NAMES)}
+
+# 記録できるシード (random.Random は負の値や大きな値も受け付けるが、ログには 8 byte で記録する)
+MAX_SEED = (1 << 64) - 1
+
+_FLAG_SEED = 1
+_FLAG_INVALID = 2
+_FLAG_ACHIEVED = 4
+_NONE = 0xFF
+
+class GameRecord(NamedTuple):
+    """
+    ゲームのログの 1 件分
+
+    Attributes:
+        game_name (str): ゲームのクラス名
+        seed (int | None): ゲームの乱数のシード
+        hands (tuple[tuple[int, ...], ...]): 配られた手札のカードの id (着席順)
+        trump (Suit | None): 切り札
+        bids (tuple[tuple[int, str], ...]): ビッド (プレイヤーの席, 宣言)
+        declarer (int | None): ディクレアラーの席
+        declaration (str | None): 有効となった宣言
+        plays (tuple[tuple[int, int], ...]): 出されたカード (プレイヤーの席, カードの id)
+        trick_winners (tuple[int, ...]): 各トラックの勝者の席
+        invalid (bool): 全員がパスをして、ゲームが無効になったかどうか
+        is_achieved (bool | None): ディクレアラーが宣言を達成できたかどうか
+        game_point (int | None): ディクレアラーが獲得した点数
+
+    Note:
+        プレイヤーは、名前ではなく席 (Game の field.players の順番) で記録する
+    """
+    game_name: str
+    seed: int | None
+    hands: tuple[tuple[int, ...], ...]
+    trump: Suit | None
+    bids: tuple[tuple[int, str], ...]
+    declarer: int | None
+    declaration: str | None
+    plays: tuple[tuple[int, int], ...]
+    trick_winners: tuple[int, ...]
+    invalid: bool = False
+    is_achieved: bool | None = None
+    game_point: int | None = None
+
+    @property
+    def points(self) -> tuple[int, ...]:
+        """
+        各プレイヤーの獲得トリック数 (着席順)
+        """
+        return tuple(self.trick_winners.count(seat) for seat in range(len(self.hands)))
+
+    def events(self, players: list[str] | None = None) -> Iterator[GameEvent]:
+        """
+        記録からゲームのイベントを再現する
+
+        Args:
+            players (list[str] | None): プレイヤーの名前 (着席順)
+                指定がなければ、席の番号を名前とする
+
+        Yields:
+            GameEvent: ゲームのイベント (GameOver の winner と points 以外は発生した順)
+        """
+        names = players if players is not None else [str(seat) for seat in range(len(self.hands))]
+
+        for seat, declaration in self.bids:
+            yield BidMade(names[seat], declaration)
+
+        if self.invalid:
+            return
+
+        player_num = len(self.hands)
+        for track_cnt, winner in enumerate(self.trick_winners):
+            trick = self.plays[track_cnt * player_num:(track_cnt + 1) * player_num]
+            cards = tuple((names[seat], Card.from_id(card_id)) for seat, card_id in trick)
+            for play_cnt, (name, card) in enumerate(cards):
+                yield CardPlayed(name, card, play_cnt)
+            yield TrickWon(names[winner], track_cnt, cards)
+
+        points = tuple(zip(names, self.points))
+        if self.declarer is None:
+            winner = max(range(player_num), key = lambda seat: self.points[seat])
+            yield GameOver(names[winner], points)
+        else:
+            yield GameOver(None, points,
+                           declarer = names[self.declarer],
+                           declaration = self.declaration,
+                           is_achieved = self.is_achieved,
+                           game_point = self.game_point)
+
+def check_seed(seed: int | None) -> None:
+    """
+    シードをログに記録できるかどうか確認する
+
+    Args:
+        seed (int | None): ゲームの乱数のシード
+
+    Raises:
+        ValueError: 0 以上 MAX_SEED 以下の整数ではない場合
+
+    Note:
+        負の値は絶対値と同じ乱数になり、大きな値は切り詰めると別の乱数になるので、変換せずにエラーとする
+    """
+    if seed is not None and not 0 <= seed <= MAX_SEED:
+        raise ValueError(f"ログに記録できないシード (0 以上 2**64 未満): {seed}")
+
+def encode_record(record: GameRecord) -> bytes:
+    """
+    ゲームのログを 1 件分のバイト列にする
+
+    Args:
+        record (GameRecord): ゲームのログ
+
+    Returns:
+        bytes: 記録の長さを先頭に持つバイト列
+
+    Raises:
+        ValueError: シードを記録できない場合
+
+    Note:
+        カードの id は 54 未満、席は 4 未満なので、出されたカードは 1 byte にまとめる
+            (席 << 6) | カードの id
+        ビッドも 1 byte にまとめる
+            (席 << 4) | 宣言の番号
+    """
+    check_seed(record.seed)
+    flags = 0
+    if record.seed is not None:
+        flags |= _FLAG_SEED
+    if record.invalid:
+        flags |= _FLAG_INVALID
+    if record.is_achieved:
+        flags |= _FLAG_ACHIEVED
+
+    body = bytearray()
+    for hand in record.hands:
+        body.extend(hand)
+    body.extend((seat << 4) | _DECLARATION_CODES[declaration] for seat, declaration in record.bids)
+    body.extend((seat << 6) | card_id for seat, card_id in record.plays)
+    body.extend(record.trick_winners)
+
+    hand_num = len(record.hands[0]) if record.hands else 0
+    header = _RECORD_HEADER.pack(
+        _RECORD_HEADER.size - 2 + len(body),
+        _GAME_CODES[record.game_name],
+        flags,
+        record.seed or 0,
+        len(record.hands),
+        hand_num,
+        _NONE if record.trump is None else int(record.trump),
+        record.game_point or 0,
+        _NONE if record.declarer is None else record.declarer,
+        _NONE if record.declaration is None else _DECLARATION_CODES[record.declaration],
+        len(record.bids),
+        len(record.trick_winners),
+    )
+    return header + bytes(body)
+
+def decode_record(buffer, offset: int = 0) -> GameRecord:
+    """
+    バイト列からゲームのログを 1 件分取り出す
+
+    Args:
+        buffer (bytes | mmap.mmap): ログのバイト列
+        offset (int): 記録の先頭の位置
+
+    Returns:
+        GameRecord: ゲームのログ
+    """
+    (_, game_code, flags, seed, player_num, hand_num, trump, game_point,
+     declarer, declaration, bid_num, trick_num) = _RECORD_HEADER.unpack_from(buffer, offset)
+
+    position = offset + _RECORD_HEADER.size
+    hands = tuple(tuple(buffer[position + seat * hand_num:position + (seat + 1) * hand_num])
+                  for seat in range(player_num))
+    position += player_num * hand_num
+
+    bids = tuple((code >> 4, _DECLARATION_NAMES[code & 0x0F]) for code in buffer[position:position + bid_num])
+    position += bid_num
+
+    play_num = trick_num * player_num
+    plays = tuple((code >> 6, code & 0x3F) for code in buffer[position:position + play_num])
+    position += play_num
+
+    trick_winners = tuple(buffer[position:position + trick_num])
+
+    is_nap = declarer != _NONE
+    invalid = bool(flags & _FLAG_INVALID)
+    return GameRecord(
+        game_name = GAME_NAMES[game_code],
+        seed = seed if flags & _FLAG_SEED else None,
+        hands = hands,
+        trump = None if trump == _NONE else Suit(trump),
+        bids = bids,
+        declarer = declarer if is_nap else None,
+        declaration = _DECLARATION_NAMES[declaration] if declaration != _NONE else None,
+        plays = plays,
+        trick_winners = trick_winners,
+        invalid = invalid,
+        is_achieved = bool(flags & _FLAG_ACHIEVED) if is_nap and not invalid else None,
+        game_point = game_point if is_nap and not invalid else None,
+    )
+
+class GameRecorder:
+    """
+    1 ゲーム分のイベントを購読し、ログを作成するクラス
+
+    Attributes:
+        game (Game): 記録するゲーム
+        writer (GameLogWriter): ログを書き込む先
+        is_written (bool): 書き込みが終わったかどうか
+
+    Note:
+        GameLogWriter.attach で作成する
+            配られた手札は、作成した時点のプレイヤーの手札とする
+            GameOver を受け取ったら、書き込む
+
+        ビッドで全員がパスをした場合、GameOver は発生しないので finish を呼ぶ
+    """
+    def __init__(self, game: Game, writer: "GameLogWriter"):
+        """
+        Args:
+            game (Game): 記録するゲーム (カードを配り終えた状態)
+            writer (GameLogWriter): ログを書き込む先
+        """
+        if type(game).__name__ not in _GAME_CODES:
+            raise ValueError(f"ログに記録できないゲーム: {type(game).__name__}")
+        # ゲームの途中で書き込めなくならないように、先に確認する
+        check_seed(game.seed)
+
+        self.game = game
+        self.writer = writer
+        self.is_written = False
+
+        players = game.field.players
+        self._seats = {player.name: seat for seat, player in enumerate(players)}
+        self._hands = tuple(tuple(card.card_id for card in player.cards) for player in players)
+        self._bids = []
+        self._plays = []
+        self._trick_winners = []
+
+        game.field.events.subscribe(self)
+
+    def __call__(self, event: GameEvent) -> None:
+        """
+        イベントを受け取る
+
+        Args:
+            event (GameEvent): ゲームのイベント
+        """
+        if isinstance(event, CardPlayed):
+            self._plays.append((self._seats[event.player], event.card.card_id))
+        elif isinstance(event, TrickWon):
+            self._trick_winners.append(self._seats[event.player])
+        elif isinstance(event, BidMade):
+            self._bids.append((self._seats[event.player], event.declaration))
+        elif isinstance(event, GameOver):
+            self._write(event)
+
+    def finish(self) -> None:
+        """
+        ゲームの記録を終える
+
+        Note:
+            GameOver を受け取っていなければ (ビッドで無効になったゲーム)、無効なゲームとして書き込む
+        """
+        if not self.is_written:
+            self._write(None)
+
+    def _write(self, game_over: GameOver | None) -> None:
+        """
+        ログを書き込み、購読をやめる
+
+        Args:
+            game_over (GameOver | None): ゲームの終了のイベント
+                None の場合、無効なゲームとして書き込む
+        """
+        invalid = game_over is None
+        is_nap = game_over is not None and game_over.declarer is not None
+        record = GameRecord(
+            game_name = type(self.game).__name__,
+            seed = self.game.seed,
+            hands = self._hands,
+            trump = self.game.field.trump,
+            bids = tuple(self._bids),
+            declarer = self._seats[game_over.declarer] if is_nap else None,
+            declaration = game_over.declaration if is_nap else None,
+            plays = tuple(self._plays) if not invalid else (),
+            trick_winners = tuple(self._trick_winners) if not invalid else (),
+            invalid = invalid,
+            is_achieved = game_over.is_achieved if is_nap else None,
+            game_point = game_over.game_point if is_nap else None,
+        )
+        self.writer.write(record)
+        self.is_written = True
+        self.game.field.events.unsubscribe(self)
+
+class GameLogWriter:
+    """
+    ゲームのログを追記するクラス
+
+    Attributes:
+        path (Path): ログのファイルのパス
+        game_num (int): このインスタンスで書き込んだゲームの数
+
+    Note:
+        ファイルは追記のみ行う
+            新しいファイルであれば、先頭にマジックナンバーとバージョンを書き込む
+            各ゲームは、記録の長さを先頭に持つので、読み込み時に読み飛ばすことができる
+
+        with 文で利用するか、最後に close を呼ぶ
+    """
+    def __init__(self, path: str | Path):
+        """
+        Args:
+            path (str | Path): ログのファイルのパス
+        """
+        self.path = Path(path)
+        self.game_num = 0
+        self._file = open(self.path, "ab")
+        if self._file.tell() == 0:
+            self._file.write(_FILE_HEADER.pack(LOG_MAGIC, LOG_VERSION))
+
+    def __enter__(self) -> "GameLogWriter":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def attach(self, game: Game) -> GameRecorder:
+        """
+        ゲームのイベントを購読し、終了したら書き込む
+
+        Args:
+            game (Game): 記録するゲーム (カードを配り終えた状態)
+
+        Returns:
+            GameRecorder: 1 ゲーム分の記録
+        """
+        return GameRecorder(game, self)
+
+    def write(self, record: GameRecord) -> None:
+        """
+        1 ゲーム分のログを書き込む
+
+        Args:
+            record (GameRecord): ゲームのログ
+        """
+        self._file.write(encode_record(record))
+        self.game_num += 1
+
+    def flush(self) -> None:
+        """
+        書き込んだログをファイルに反映する
+
+        Note:
+            書き込みはバッファリングしているので、書き込み中に読み込む場合に利用する
+        """
+        self._file.flush()
+
+    def close(self) -> None:
+        """
+        ファイルを閉じる
+        """
+        self._file.close()
+
+class GameLogReader:
+    """
+    ゲームのログをメモリマップで読み込むクラス
+
+    Attributes:
+        path (Path): ログのファイルのパス
+
+    Note:
+        ファイルはメモリマップで開き、テキストの解析は行わない
+            各ゲームの位置は、記録の長さを辿って初めて必要になった時に作成する
+            ゲームのログは、参照した時に GameRecord に変換する
+
+        with 文で利用するか、最後に close を呼ぶ
+    """
+    def __init__(self, path: str | Path):
+        """
+        Args:
+            path (str | Path): ログのファイルのパス
+
+        Raises:
+            ValueError: ログのファイルではない場合 (空のファイルを含む)
+        """
+        self.path = Path(path)
+        self._file = open(self.path, "rb")
+        try:
+            self._buffer = mmap.mmap(self._file.fileno(), 0, access = mmap.ACCESS_READ)
+        except (ValueError, OSError) as e:
+            # 空のファイル (書き込みをまだ反映していないファイル) は、メモリマップで開けない
+            self._file.close()
+            raise ValueError(f"ゲームのログではない: {self.path}") from e
+        self._offsets = None
+
+        if len(self._buffer) < _FILE_HEADER.size:
+            self.close()
+            raise ValueError(f"ゲームのログではない: {self.path}")
+        magic, version = _FILE_HEADER.unpack_from(self._buffer, 0)
+        if magic != LOG_MAGIC or version != LOG_VERSION:
+            self.close()
+            raise ValueError(f"ゲームのログではない: {self.path}")
+
+    def __enter__(self) -> "GameLogReader":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        """
+        記録されているゲームの数
+        """
+        return len(self.offsets)
+
+    def __getitem__(self, index: int) -> GameRecord:
+        """
+        ゲームのログを取得する
+
+        Args:
+            index (int): 記録した順番
+        """
+        return decode_record(self._buffer, self.offsets[index])
+
+    def __iter__(self) -> Iterator[GameRecord]:
+        """
+        ゲームのログを記録した順に取り出す
+        """
+        for offset in self.offsets:
+            yield decode_record(self._buffer, offset)
+
+    @property
+    def offsets(self) -> list[int]:
+        """
+        各ゲームの記録の先頭の位置
+        """
+        if self._offsets is None:
+            offsets = []
+            offset = _FILE_HEADER.size
+            size = len(self._buffer)
+            unpack_length = struct.Struct("<H").unpack_from
+            while offset + 2 <= size:
+                end = offset + 2 + unpack_length(self._buffer, offset)[0]
+                if end > size:
+                    # 書き込みの途中で終了した記録は読み飛ばす
+                    break
+                offsets.append(offset)
+                offset = end
+            self._offsets = offsets
+        return self._offsets
+
+    def close(self) -> None:
+        """
+        ファイルを閉じる
+        """
+        self._buffer.close()
+        self._file.close()
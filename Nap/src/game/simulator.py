@@ -0,0 +1,359 @@
+from collections.abc import Iterable, Sequence
+import random
+from typing import NamedTuple
+
+from ..utils import (
+    Suit,
+)
+from ..utils.card import STRONG_JOKER_ID
+from ..utils.playout import random_playout
+from ..player import Player
+
+from .game import (
+    Game,
+    SimpleNapGame,
+    EasyNapGame,
+    NapGame,
+)
+from .game_log import (
+    GameLogWriter,
+)
+
+# 軽量な経路で再現するルールを決めるメソッド
+#   ゲームクラスがこれらを上書きしていれば、ゲームのクラスで実行する
+_LEAN_RULE_METHODS = (
+    "set_deck",
+    "shuffle",
+    "deal",
+    "_set_trump",
+    "get_start_player_id",
+    "set_track",
+    "decide_winner_in_track",
+    "add_point",
+    "decide_winner_in_game",
+    "play",
+)
+# EasyNapGame._set_trump と同じ並び
+_LEAN_TRUMPS = (Suit.spade, Suit.heart, Suit.diamond, Suit.club)
+# ジョーカーのない 52 枚のカードのマスク
+_SIMPLE_DECK_MASK = (1 << STRONG_JOKER_ID) - 1
+
+class GameResult(NamedTuple):
+    """
+    ヘッドレスで実行したゲームの結果
+
+    Attributes:
+        game_name (str): ゲームのクラス名
+        players (tuple[str, ...]): プレイヤーの名前 (着席順)
+        points (tuple[int, ...]): 各プレイヤーが獲得したトリック数 (着席順)
+        winner (str | None): ゲームの勝者
+            Nap のようにディクレアラーの成否で決まるゲームでは None
+        trump (Suit | None): 切り札
+        declarer (str | None): ディクレアラー
+        declaration (str | None): 有効となった宣言
+        is_achieved (bool | None): ディクレアラーが宣言を達成できたかどうか
+        game_point (int | None): ディクレアラーが獲得した点数
+        invalid (bool): 全員がパスをして、ゲームが無効になったかどうか
+        seed (int | None): ゲームの乱数のシード
+        deal_order (tuple[int, ...] | None): 指定した山札の並び
+            シャッフルした場合は None
+    """
+    game_name: str
+    players: tuple[str, ...]
+    points: tuple[int, ...]
+    winner: str | None = None
+    trump: Suit | None = None
+    declarer: str | None = None
+    declaration: str | None = None
+    is_achieved: bool | None = None
+    game_point: int | None = None
+    invalid: bool = False
+    seed: int | None = None
+    deal_order: tuple[int, ...] | None = None
+
+class Simulator:
+    """
+    ゲームを表示なしで高速に実行するクラス
+
+    Attributes:
+        game_class (type[Game]): 実行するゲームのクラス
+        rng (random.Random): 各ゲームのシードを作成する乱数生成器
+        log_writer (GameLogWriter | None): 各ゲームのログを書き込む先
+        lean_rule (type[Game] | None): 軽量な経路で再現するルールのゲームクラス
+            SimpleNapGame か EasyNapGame (軽量な経路を利用しない場合は None)
+        player_names (tuple[str, ...] | None): 軽量な経路で利用するプレイヤーの名前 (着席順)
+
+    Note:
+        CPU の戦略の評価のために、大量のゲームを実行することを想定
+            1. フィールドの表示、メッセージの作成、時間の停止は行わない
+            2. 全てのプレイヤーを CPU として扱う
+            3. 結果は GameResult として返す
+
+        各ゲームにはシードが割り当てられ、GameResult に記録される
+            replay で同じゲームを再現できる
+
+        軽量な経路 (play_lean)
+            Game, Field, Player, Card を作らずに、手札をマスクのまま random_playout で進める
+            以下の全てを満たす場合に利用する
+                1. lean が True で、log_writer がない (ログにはゲームのイベントが必要)
+                2. SimpleNapGame か EasyNapGame のルールで、ビッドがない
+                    _LEAN_RULE_METHODS のメソッドを上書きしていない (VS シリーズの配り方などは対象外)
+                3. 全てのプレイヤーが Player.play_card でランダムにカードを出す
+            乱数の使い方がゲームのクラスと異なるので、同じシードでも同じゲームにはならない
+                結果の分布は同じで、同じ経路の中では replay で再現できる
+            1 コアで SimpleNapGame は約 3.5 万、EasyNapGame は約 2.7 万ゲーム/秒 (benchmark/simulate.py)
+                ゲームのクラスで実行する場合は、約 5 千 ~ 9 千ゲーム/秒
+                NapGame はビッドがあるので、ゲームのクラスで実行する (約 4.4 千ゲーム/秒)
+    """
+    def __init__(self,
+                 game_class: type[Game],
+                 seed: int | None = None,
+                 log_writer: GameLogWriter | None = None,
+                 lean: bool = True):
+        """
+        Args:
+            game_class (type[Game]): 実行するゲームのクラス
+            seed (int | None): 各ゲームのシードを作成するためのシード
+            log_writer (GameLogWriter | None): 各ゲームのログを書き込む先
+                指定がなければ、ログは作成しない
+            lean (bool): 可能であれば、軽量な経路で実行するかどうか
+        """
+        self.game_class = game_class
+        self.rng = random.Random(seed)
+        self.log_writer = log_writer
+
+        self.lean_rule = None
+        self.player_names = None
+        if lean and log_writer is None:
+            self.lean_rule = self.find_lean_rule(game_class)
+        if self.lean_rule is not None:
+            players = self.make_game(seed = 0).field.players
+            if all(type(player).play_card is Player.play_card for player in players):
+                self.player_names = tuple(player.name for player in players)
+            else:
+                self.lean_rule = None
+
+    @staticmethod
+    def find_lean_rule(game_class: type[Game]) -> type[Game] | None:
+        """
+        軽量な経路で再現できるルールを探す
+
+        Args:
+            game_class (type[Game]): 実行するゲームのクラス
+
+        Returns:
+            type[Game] | None: 同じルールのゲームクラス (SimpleNapGame か EasyNapGame)
+                再現できない場合は None
+        """
+        if issubclass(game_class, NapGame):
+            return None
+
+        for rule in (EasyNapGame, SimpleNapGame):
+            if issubclass(game_class, rule):
+                if all(getattr(game_class, name) is getattr(rule, name) for name in _LEAN_RULE_METHODS):
+                    return rule
+                return None
+
+        return None
+
+    def __iter__(self):
+        return self
+
+    def __next__(self) -> GameResult:
+        """
+        1 ゲーム分を実行する
+        """
+        return self.play()
+
+    def make_game(self, seed: int | None = None, deal_order: Sequence[int] | None = None) -> Game:
+        """
+        ヘッドレスのゲームを準備する
+
+        Args:
+            seed (int | None): ゲームの乱数のシード
+            deal_order (Sequence[int] | None): 山札の並び
+
+        Returns:
+            Game: 全てのプレイヤーが CPU となったゲーム
+        """
+        game = self.game_class(is_headless = True, seed = seed, deal_order = deal_order)
+        for player in game.field.players:
+            player.cpu = True
+
+        return game
+
+    def play(self, seed: int | None = None, deal_order: Sequence[int] | None = None) -> GameResult:
+        """
+        1 ゲーム分を実行する
+
+        Args:
+            seed (int | None): ゲームの乱数のシード
+                指定がなければ、新しく作成する
+            deal_order (Sequence[int] | None): 山札の並び
+                指定がなければ、シャッフルする
+
+        Returns:
+            GameResult: ゲームの結果
+        """
+        if seed is None:
+            seed = self.rng.getrandbits(63)
+        if deal_order is not None:
+            deal_order = tuple(int(card_id) for card_id in deal_order)
+
+        if self.lean_rule is not None:
+            return self.play_lean(seed, deal_order)
+
+        game = self.make_game(seed, deal_order)
+        recorder = self.log_writer.attach(game) if self.log_writer is not None else None
+
+        if isinstance(game, NapGame):
+            for _ in game.bid_manager:
+                pass
+
+            if game.bid_manager.invalid:
+                if recorder is not None:
+                    recorder.finish()
+                return self.make_result(game, invalid = True)
+
+            game.close_bid()
+
+        game.play()
+
+        return self.make_result(game)
+
+    def play_lean(self, seed: int, deal_order: tuple[int, ...] | None = None) -> GameResult:
+        """
+        1 ゲーム分を、軽量な経路で実行する
+
+        Args:
+            seed (int): ゲームの乱数のシード
+            deal_order (tuple[int, ...] | None): 山札の並び
+                指定がなければ、配る分のカードだけを引く
+
+        Returns:
+            GameResult: ゲームの結果
+
+        Raises:
+            ValueError: 山札の並びが、ジョーカーのない 52 枚のカードの並べ替えでない場合
+
+        Note:
+            配り方は Game.deal と同じ (山札の末尾から、着席順に手札の枚数ずつ配る)
+            SimpleNapGame は常に席 0 が先行するが、台札のルールがないので
+                誰から出しても結果の分布は変わらず、勝者が先行する random_playout で進める
+        """
+        rng = random.Random(seed)
+        rand = rng.random
+        seat_num = len(self.player_names)
+        hand_num = self.game_class.hand_num
+
+        if deal_order is None:
+            # 配る分だけ、Fisher-Yates で先頭から引く (random.sample より速い)
+            card_ids = list(range(STRONG_JOKER_ID))
+            for i in range(seat_num * hand_num):
+                j = i + int(rand() * (STRONG_JOKER_ID - i))
+                card_ids[i], card_ids[j] = card_ids[j], card_ids[i]
+        else:
+            mask = 0
+            for card_id in deal_order:
+                mask |= 1 << card_id
+            if len(deal_order) != STRONG_JOKER_ID or mask != _SIMPLE_DECK_MASK:
+                raise ValueError("デッキのカードと一致しません")
+            card_ids = deal_order[::-1]
+
+        hands = []
+        for seat in range(seat_num):
+            mask = 0
+            for card_id in card_ids[seat * hand_num:(seat + 1) * hand_num]:
+                mask |= 1 << card_id
+            hands.append(mask)
+
+        if self.lean_rule is EasyNapGame:
+            trump = _LEAN_TRUMPS[int(rand() * len(_LEAN_TRUMPS))]
+            points = random_playout(hands, [], int(rand() * seat_num), int(trump), True, rng)
+        else:
+            trump = Suit.spade
+            points = random_playout(hands, [], 0, int(trump), False, rng)
+
+        # 同点の場合は、着席順が早い方が勝者 (SimpleNapGame.decide_winner_in_game)
+        winner = points.index(max(points))
+        return GameResult(
+            game_name = self.game_class.__name__,
+            players = self.player_names,
+            points = tuple(points),
+            winner = self.player_names[winner],
+            trump = trump,
+            seed = seed,
+            deal_order = deal_order,
+        )
+
+    def replay(self, result: GameResult) -> GameResult:
+        """
+        結果と同じゲームを再度実行する
+
+        Args:
+            result (GameResult): 再現するゲームの結果
+
+        Returns:
+            GameResult: ゲームの結果
+        """
+        return self.play(seed = result.seed, deal_order = result.deal_order)
+
+    def run(self, game_num: int) -> list[GameResult]:
+        """
+        複数のゲームを実行する
+
+        Args:
+            game_num (int): 実行するゲームの数
+
+        Returns:
+            list[GameResult]: 各ゲームの結果
+        """
+        return [self.play() for _ in range(game_num)]
+
+    def run_deals(self, deals: Iterable[Sequence[int]]) -> list[GameResult]:
+        """
+        あらかじめ作成した配り方で、複数のゲームを実行する
+
+        Args:
+            deals (Iterable[Sequence[int]]): 各ゲームの山札の並び
+                Dealer.deal_batch で作成した行列など
+
+        Returns:
+            list[GameResult]: 各ゲームの結果
+        """
+        return [self.play(deal_order = deal_order) for deal_order in deals]
+
+    def make_result(self, game: Game, invalid: bool = False) -> GameResult:
+        """
+        ゲームの状態から結果を作成する
+
+        Args:
+            game (Game): 終了したゲーム
+            invalid (bool): ゲームが無効になったかどうか
+
+        Returns:
+            GameResult: ゲームの結果
+        """
+        players = game.field.players
+        result = GameResult(
+            game_name = self.game_class.__name__,
+            players = tuple(p.name for p in players),
+            points = tuple(p.point for p in players),
+            trump = game.field.trump,
+            invalid = invalid,
+            seed = game.seed,
+            deal_order = game.deal_order,
+        )
+
+        if invalid:
+            return result
+
+        if isinstance(game, NapGame):
+            return result._replace(
+                declarer = game.declarer.name,
+                declaration = str(game.best_declaration),
+                is_achieved = game.is_achieved,
+                game_point = game.game_point,
+            )
+
+        return result._replace(winner = game.winner.name)
@@ -0,0 +1,395 @@
+from collections.abc import Sequence
+
+from ..utils import (
+    SUIT_MASKS,
+    CARD_ID_NUM,
+    CARD_SUIT_INDEX_TABLE,
+    STRENGTH_TABLE,
+)
+
+# カードの id ごとに、同じスートでそのカードより強いカードのマスク
+_ABOVE_MASKS: tuple[int, ...] = tuple(
+    SUIT_MASKS[CARD_SUIT_INDEX_TABLE[card_id]] & ~((2 << card_id) - 1) for card_id in range(CARD_ID_NUM))
+
+class DoubleDummySolver:
+    """
+    全員の手札が見えている (double dummy) 場合の、最善の獲得トリック数を求めるクラス
+
+    Attributes:
+        use_lead (bool): 台札のルール (スートの請求と台札の強さ) を利用するかどうか
+        table (dict[tuple, tuple[int, int]]): 置換表
+            (席ごとの手札のマスク..., 先行の席, 切り札, チーム, 数える席) ごとに、獲得トリック数の (下限, 上限) を保存する
+        node_num (int): 探索したトラックの始めの局面の数
+
+    Note:
+        2 つのチームのゼロサムゲームとして探索する
+            チーム (team) の席は獲得トリック数を最大化し、それ以外の席は最小化する
+            Nap では、ディクレアラーとそれ以外
+            ミゼール (misere) では、チームはチーム以外の獲得トリック数を最大化する
+
+        ルールはエンジンと同じ
+            台札のスートを持っていれば、そのスートを出す
+            勝者は STRENGTH_TABLE で決め、勝者が次のトラックを始める
+            trump_from_lead の場合、最初の台札のスートが切り札となる (NapGame.play)
+
+        探索の工夫
+            1. alpha-beta 法
+            2. トラックの始めの局面の置換表 (手札のマスクをキーとする)
+            3. 手の並び替え (台札は強い順、それ以外は勝てる最も弱いカード、負けるなら弱い順)
+            4. 同じスートで、生きているカードの中で隣り合う自分のカードは同じ手とする
+                他のプレイヤーの手札にも場にもないカードは、強さの比較に関係しない
+            5. 最後のトラックは探索せずに、直前のトラックの終わりで直接求める
+
+        置換表は solve をまたいで使い回すので、同じ配り方の局面は 2 回目から探索しない
+            evaluate_moves のように、同じ配り方を何度も探索する場合に効く
+            大量の配り方を解く場合は、max_table_size を超えた時に空にする
+    """
+    def __init__(self, use_lead: bool = True, max_table_size: int = 1_000_000):
+        """
+        Args:
+            use_lead (bool): 台札のルールを利用するかどうか
+            max_table_size (int): 置換表の局面の数の上限
+        """
+        self.use_lead = use_lead
+        self.max_table_size = max_table_size
+        self.table = {}
+        self.node_num = 0
+
+    def clear(self) -> None:
+        """
+        置換表を空にする
+        """
+        self.table = {}
+
+    def solve(self,
+              hands: Sequence[int],
+              leader: int,
+              trump: int = 0,
+              team: Sequence[int] | None = None,
+              trump_from_lead: bool = False,
+              misere: bool = False) -> int:
+        """
+        トラックの始めの局面から、チームの最善の獲得トリック数を求める
+
+        Args:
+            hands (Sequence[int]): 席ごとの手札のマスク (枚数は全員同じ)
+            leader (int): 最初のトラックを始める席
+            trump (int): 切り札のスートの番号 (なしは 0)
+            team (Sequence[int] | None): 獲得トリック数を最大化する席
+                指定がなければ、leader のみ
+            trump_from_lead (bool): 最初の台札のスートを切り札とするかどうか
+            misere (bool): チームが、チーム以外の獲得トリック数を最大化するかどうか (ミゼール)
+
+        Returns:
+            int: チームの獲得トリック数
+                misere の場合は、チーム以外の獲得トリック数
+        """
+        return self.solve_trick(hands, [], leader, trump, team, trump_from_lead, misere)
+
+    def solve_trick(self,
+                    hands: Sequence[int],
+                    trick: Sequence[tuple[int, int]],
+                    seat: int,
+                    trump: int = 0,
+                    team: Sequence[int] | None = None,
+                    trump_from_lead: bool = False,
+                    misere: bool = False) -> int:
+        """
+        トラックの途中の局面から、チームの最善の獲得トリック数を求める
+
+        Args:
+            hands (Sequence[int]): 席ごとの手札のマスク
+            trick (Sequence[tuple[int, int]]): 現在のトラックで出されたカード (席の番号, カードの id)
+            seat (int): 次にカードを出す席
+            trump (int): 切り札のスートの番号
+            team (Sequence[int] | None): 獲得トリック数を最大化する席
+                指定がなければ、seat のみ
+            trump_from_lead (bool): 次の台札のスートを切り札とするかどうか
+            misere (bool): チームが、チーム以外の獲得トリック数を最大化するかどうか
+
+        Returns:
+            int: チームの獲得トリック数 (現在のトラックを含む)
+                misere の場合は、チーム以外の獲得トリック数
+        """
+        if len(self.table) > self.max_table_size:
+            self.clear()
+
+        team_mask = self._team_mask(seat if team is None else team)
+        score_mask = team_mask ^ ((1 << len(hands)) - 1) if misere else team_mask
+        hands = list(hands)
+        beta = hands[seat].bit_count() + 1
+        if len(trick) == len(hands):
+            # トラックの終わり
+            lead = CARD_SUIT_INDEX_TABLE[trick[0][1]] if self.use_lead else 0
+            strengths = STRENGTH_TABLE[trump][lead]
+            winner = max(trick, key = lambda play: strengths[play[1]])[0]
+            won = (score_mask >> winner) & 1
+            if not hands[winner]:
+                return won
+            return won + self._search(hands, winner, 0, 0, trump, 0, 0, 0,
+                                      team_mask, score_mask, -1, hands[winner].bit_count() + 1)
+
+        if not trick:
+            trump = -1 if trump_from_lead else trump
+            return self._search(hands, seat, 0, 0, trump, 0, 0, 0, team_mask, score_mask, -1, beta)
+
+        lead = CARD_SUIT_INDEX_TABLE[trick[0][1]] if self.use_lead else 0
+        strengths = STRENGTH_TABLE[trump][lead]
+        best_seat, best_id = max(trick, key = lambda play: strengths[play[1]])
+
+        alive = 0
+        for mask in hands:
+            alive |= mask
+        for _, card_id in trick:
+            alive |= 1 << card_id
+
+        return self._search(hands, seat, len(trick), lead, trump, strengths[best_id], best_seat,
+                            alive, team_mask, score_mask, -1, beta)
+
+    def evaluate_moves(self,
+                       hands: Sequence[int],
+                       trick: Sequence[tuple[int, int]],
+                       seat: int,
+                       trump: int = 0,
+                       team: Sequence[int] | None = None,
+                       trump_from_lead: bool = False,
+                       misere: bool = False) -> dict[int, int]:
+        """
+        出せるカードごとに、その後の最善の獲得トリック数を求める
+
+        Args:
+            hands (Sequence[int]): 席ごとの手札のマスク
+            trick (Sequence[tuple[int, int]]): 現在のトラックで出されたカード
+            seat (int): カードを出す席
+            trump (int): 切り札のスートの番号
+            team (Sequence[int] | None): 獲得トリック数を最大化する席
+                指定がなければ、seat のみ
+            trump_from_lead (bool): 次の台札のスートを切り札とするかどうか
+            misere (bool): チームが、チーム以外の獲得トリック数を最大化するかどうか
+
+        Returns:
+            dict[int, int]: 出せるカードの id ごとの、チームの獲得トリック数 (misere の場合は、チーム以外)
+
+        Note:
+            CPU のプレイの採点に利用する
+                出したカードの値が、最大の値 (チームが最大化する場合) より小さければ悪手
+        """
+        team = (seat,) if team is None else team
+        lead = CARD_SUIT_INDEX_TABLE[trick[0][1]] if trick and self.use_lead else 0
+        hand = hands[seat]
+        moves = hand & SUIT_MASKS[lead] or hand
+
+        values = {}
+        while moves:
+            low = moves & -moves
+            moves ^= low
+            card_id = low.bit_length() - 1
+
+            next_hands = list(hands)
+            next_hands[seat] = hand ^ low
+            next_trump = trump
+            if trump_from_lead and not trick:
+                next_trump = CARD_SUIT_INDEX_TABLE[card_id]
+
+            values[card_id] = self.solve_trick(next_hands,
+                                               list(trick) + [(seat, card_id)],
+                                               (seat + 1) % len(hands),
+                                               next_trump,
+                                               team,
+                                               trump_from_lead and bool(trick),
+                                               misere)
+        return values
+
+    @staticmethod
+    def _team_mask(team: int | Sequence[int]) -> int:
+        """
+        チームの席をマスクにする
+        """
+        if isinstance(team, int):
+            return 1 << team
+        mask = 0
+        for seat in team:
+            mask |= 1 << seat
+        return mask
+
+    def _search(self,
+                hands: list[int],
+                seat: int,
+                played: int,
+                lead: int,
+                trump: int,
+                best_strength: int,
+                best_seat: int,
+                alive: int,
+                team_mask: int,
+                score_mask: int,
+                alpha: int,
+                beta: int) -> int:
+        """
+        alpha-beta 法で探索する
+
+        Args:
+            hands (list[int]): 席ごとの手札のマスク (探索中に書き換えて戻す)
+            seat (int): 次にカードを出す席
+            played (int): 現在のトラックで出されたカードの枚数
+            lead (int): 台札のスートの番号 (台札のルールを利用しない場合は 0)
+            trump (int): 切り札のスートの番号 (-1 は、次の台札で決まる)
+            best_strength (int): 現在のトラックで最も強いカードの強さ
+            best_seat (int): 現在のトラックで最も強いカードを出した席
+            alive (int): 現在のトラックの始めに、誰かの手札にあったカードのマスク
+            team_mask (int): チームの席のマスク
+            score_mask (int): 獲得トリック数を数える席のマスク
+            alpha (int): 下限
+            beta (int): 上限
+
+        Returns:
+            int: score_mask の席の獲得トリック数 (現在のトラックを含む)
+                alpha 以下、beta 以上の場合は、それぞれの方向の限界値
+        """
+        seat_num = len(hands)
+        hand = hands[seat]
+        remaining = hand.bit_count()
+
+        # トラックの始めの局面は、置換表を引く
+        if played == 0:
+            if remaining <= alpha:
+                return remaining
+            if beta <= 0:
+                return 0
+            if remaining == 1:
+                return self._last_trick(hands, seat, trump, score_mask)
+
+            self.node_num += 1
+            key = (*hands, seat, trump, team_mask, score_mask)
+            lower, upper = self.table.get(key, (0, remaining))
+            if lower >= beta or lower == upper:
+                return lower
+            if upper <= alpha:
+                return upper
+            alpha = max(alpha, lower)
+            beta = min(beta, upper)
+            alpha_orig, beta_orig = alpha, beta
+
+            alive = 0
+            for mask in hands:
+                alive |= mask
+
+            legal = hand
+        else:
+            legal = hand & SUIT_MASKS[lead] or hand
+            strengths = STRENGTH_TABLE[trump][lead]
+
+        # 同じスートで、生きているカードの中で隣り合う自分のカードは、最も強いカードのみ残す
+        moves = []
+        losers = []
+        rest = legal
+        while rest:
+            low = rest & -rest
+            rest ^= low
+            card_id = low.bit_length() - 1
+            above = alive & _ABOVE_MASKS[card_id]
+            if above & -above & legal:
+                continue
+            if played == 0:
+                # 台札は、そのスートで最も強いカードを先に、その後は強い順
+                (losers if above else moves).append(card_id)
+            elif strengths[card_id] > best_strength:
+                # 勝てるカードは弱い順、その後に負けるカードを弱い順
+                moves.append(card_id)
+            else:
+                losers.append(card_id)
+
+        if played == 0:
+            moves.reverse()
+            losers.reverse()
+            moves += losers
+        elif (team_mask >> seat) & 1 == (team_mask >> best_seat) & 1:
+            # 味方が勝っていれば、負けるカードを先に
+            moves = losers + moves
+        else:
+            moves += losers
+
+        is_max = (team_mask >> seat) & 1
+        best = -1 if is_max else seat_num * 16
+        next_seat = (seat + 1) % seat_num
+
+        for card_id in moves:
+            hands[seat] = hand ^ (1 << card_id)
+
+            if played == 0:
+                suit = CARD_SUIT_INDEX_TABLE[card_id]
+                next_lead = suit if self.use_lead else 0
+                next_trump = suit if trump == -1 else trump
+                next_strength = STRENGTH_TABLE[next_trump][next_lead][card_id]
+                next_best_seat = seat
+            else:
+                next_lead, next_trump = lead, trump
+                strength = strengths[card_id]
+                if strength > best_strength:
+                    next_strength, next_best_seat = strength, seat
+                else:
+                    next_strength, next_best_seat = best_strength, best_seat
+
+            if played + 1 == seat_num:
+                # トラックの終わり
+                won = (score_mask >> next_best_seat) & 1
+                if remaining == 2:
+                    # 残りは最後のトラックのみ
+                    value = won + self._last_trick(hands, next_best_seat, next_trump, score_mask)
+                else:
+                    value = won + self._search(hands, next_best_seat, 0, 0, next_trump, 0, 0, 0,
+                                               team_mask, score_mask, alpha - won, beta - won)
+            else:
+                value = self._search(hands, next_seat, played + 1, next_lead, next_trump,
+                                     next_strength, next_best_seat, alive, team_mask, score_mask, alpha, beta)
+            hands[seat] = hand
+
+            if is_max:
+                if value > best:
+                    best = value
+                if best > alpha:
+                    alpha = best
+            else:
+                if value < best:
+                    best = value
+                if best < beta:
+                    beta = best
+            if alpha >= beta:
+                break
+
+        if played == 0:
+            if best <= alpha_orig:
+                upper = best
+            elif best >= beta_orig:
+                lower = best
+            else:
+                lower = upper = best
+            self.table[key] = (lower, upper)
+
+        return best
+
+    def _last_trick(self, hands: list[int], seat: int, trump: int, score_mask: int) -> int:
+        """
+        全員の手札が 1 枚の時に、最後のトラックの結果を求める
+
+        Args:
+            hands (list[int]): 席ごとの手札のマスク
+            seat (int): 最後のトラックを始める席
+            trump (int): 切り札のスートの番号 (-1 は、台札で決まる)
+            score_mask (int): 獲得トリック数を数える席のマスク
+
+        Returns:
+            int: score_mask の席がトラックをとれば 1
+        """
+        lead_id = hands[seat].bit_length() - 1
+        suit = CARD_SUIT_INDEX_TABLE[lead_id]
+        strengths = STRENGTH_TABLE[suit if trump == -1 else trump][suit if self.use_lead else 0]
+
+        best_strength, best_seat = -1, seat
+        for other_seat, mask in enumerate(hands):
+            strength = strengths[mask.bit_length() - 1]
+            if strength > best_strength:
+                best_strength, best_seat = strength, other_seat
+
+        return (score_mask >> best_seat) & 1
+
@@ -0,0 +1,242 @@
+from collections import Counter
+import os
+import random
+
+from .game import Game
+from .simulator import (
+    GameResult,
+    Simulator,
+)
+
+class TournamentStats:
+    """
+    複数のゲームの結果の集計
+
+    Attributes:
+        game_num (int): 集計したゲームの数
+        invalid_num (int): 無効になったゲームの数
+        wins (Counter[str]): プレイヤーごとの勝利数
+        points (Counter[str]): プレイヤーごとの獲得トリック数の合計
+        game_points (Counter[str]): プレイヤーごとのゲームの点数の合計 (Nap のみ)
+        declarations (Counter[tuple[str, str, bool]]): 宣言の結果の数
+            (ディクレアラー, 宣言, 達成できたかどうか) ごとに数える
+
+    Note:
+        Nap のように勝者が決まらないゲームでは、以下を勝利とする
+            ディクレアラーが宣言を達成した場合、ディクレアラーの勝利
+            達成できなかった場合、ディクレアラー以外のプレイヤーの勝利
+
+        集計は足し合わせることができるので、ワーカーごとの集計をまとめて利用する
+    """
+    def __init__(self):
+        self.game_num = 0
+        self.invalid_num = 0
+        self.wins = Counter()
+        self.points = Counter()
+        self.game_points = Counter()
+        self.declarations = Counter()
+
+    def __add__(self, other: "TournamentStats") -> "TournamentStats":
+        """
+        集計を足し合わせる
+
+        Args:
+            other (TournamentStats): 足し合わせる集計
+
+        Returns:
+            TournamentStats: 足し合わせた集計
+
+        Note:
+            Counter の + は 0 以下の値を削除するので、update で足し合わせる
+                (負けの多いプレイヤーのゲームの点数が消えないようにする)
+        """
+        stats = TournamentStats()
+        stats.game_num = self.game_num + other.game_num
+        stats.invalid_num = self.invalid_num + other.invalid_num
+        for name in ("wins", "points", "game_points", "declarations"):
+            counter = Counter(getattr(self, name))
+            counter.update(getattr(other, name))
+            setattr(stats, name, counter)
+        return stats
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, TournamentStats):
+            return NotImplemented
+        return vars(self) == vars(other)
+
+    def __repr__(self) -> str:
+        return f"TournamentStats(game_num={self.game_num}, invalid_num={self.invalid_num}, wins={dict(self.wins)})"
+
+    def add(self, result: GameResult) -> None:
+        """
+        1 ゲーム分の結果を集計に加える
+
+        Args:
+            result (GameResult): ゲームの結果
+        """
+        self.game_num += 1
+        if result.invalid:
+            self.invalid_num += 1
+            return
+
+        for name, point in zip(result.players, result.points):
+            self.points[name] += point
+
+        if result.declarer is None:
+            self.wins[result.winner] += 1
+            return
+
+        self.declarations[(result.declarer, result.declaration, result.is_achieved)] += 1
+        self.game_points[result.declarer] += result.game_point
+        if result.is_achieved:
+            self.wins[result.declarer] += 1
+        else:
+            for name in result.players:
+                if name != result.declarer:
+                    self.wins[name] += 1
+
+    @property
+    def valid_num(self) -> int:
+        """
+        有効なゲームの数
+        """
+        return self.game_num - self.invalid_num
+
+    def win_rate(self, name: str) -> float:
+        """
+        プレイヤーの勝率
+
+        Args:
+            name (str): プレイヤーの名前
+
+        Returns:
+            float: 有効なゲームにおける勝率
+        """
+        return self.wins[name] / self.valid_num if self.valid_num else 0.0
+
+    def mean_point(self, name: str) -> float:
+        """
+        プレイヤーの 1 ゲームあたりの獲得トリック数
+
+        Args:
+            name (str): プレイヤーの名前
+
+        Returns:
+            float: 有効なゲームにおける平均の獲得トリック数
+        """
+        return self.points[name] / self.valid_num if self.valid_num else 0.0
+
+    def achievement_rate(self, name: str) -> float:
+        """
+        プレイヤーがディクレアラーとなった時に、宣言を達成できた割合
+
+        Args:
+            name (str): プレイヤーの名前
+
+        Returns:
+            float: 宣言の達成率
+        """
+        achieved_num = sum(n for (declarer, _, is_achieved), n in self.declarations.items()
+                           if declarer == name and is_achieved)
+        declared_num = sum(n for (declarer, _, _), n in self.declarations.items() if declarer == name)
+        return achieved_num / declared_num if declared_num else 0.0
+
+def play_chunk(game_class: type[Game], seeds: list[int]) -> TournamentStats:
+    """
+    ワーカーで実行する 1 単位分のゲームを実行して集計する
+
+    Args:
+        game_class (type[Game]): 実行するゲームのクラス
+        seeds (list[int]): 各ゲームのシード
+
+    Returns:
+        TournamentStats: 集計
+
+    Note:
+        プロセス間でやりとりするのは、シードと集計のみ
+    """
+    simulator = Simulator(game_class)
+    stats = TournamentStats()
+    for seed in seeds:
+        stats.add(simulator.play(seed = seed))
+
+    return stats
+
+class Tournament:
+    """
+    対戦を大量に実行し、結果を集計するクラス
+
+    Attributes:
+        game_class (type[Game]): 実行するゲームのクラス
+            VS series の対戦など
+        chunk_size (int): 1 単位で実行するゲームの数
+        max_workers (int): 利用するプロセスの数
+        rng (random.Random): 各ゲームのシードを作成する乱数生成器
+
+    Note:
+        ゲームは、シードのまとまり (chunk) を単位として ProcessPoolExecutor で並列に実行する
+            各ゲームのシードは先に作成するので、プロセスの数に関わらず結果は同じになる
+            プロセス間でやりとりするのは、シードと集計のみなので、コア数に応じて処理量が増える
+
+        max_workers が 1 の場合は、プロセスを作成せずに実行する
+    """
+    def __init__(self,
+                 game_class: type[Game],
+                 seed: int | None = None,
+                 chunk_size: int = 500,
+                 max_workers: int | None = None):
+        """
+        Args:
+            game_class (type[Game]): 実行するゲームのクラス
+            seed (int | None): 各ゲームのシードを作成するためのシード
+            chunk_size (int): 1 単位で実行するゲームの数
+            max_workers (int | None): 利用するプロセスの数
+                指定がなければ、CPU のコア数
+        """
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size は 1 以上: {chunk_size}")
+
+        self.game_class = game_class
+        self.chunk_size = chunk_size
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.rng = random.Random(seed)
+
+    def make_chunks(self, game_num: int) -> list[list[int]]:
+        """
+        各ゲームのシードを作成し、実行する単位に分ける
+
+        Args:
+            game_num (int): 実行するゲームの数
+
+        Returns:
+            list[list[int]]: 実行する単位ごとのシード
+        """
+        seeds = [self.rng.getrandbits(63) for _ in range(game_num)]
+        return [seeds[i:i + self.chunk_size] for i in range(0, game_num, self.chunk_size)]
+
+    def run(self, game_num: int) -> TournamentStats:
+        """
+        複数のゲームを実行して集計する
+
+        Args:
+            game_num (int): 実行するゲームの数
+
+        Returns:
+            TournamentStats: 全てのゲームの集計
+        """
+        chunks = self.make_chunks(game_num)
+        stats = TournamentStats()
+
+        if self.max_workers == 1 or len(chunks) <= 1:
+            for seeds in chunks:
+                stats += play_chunk(self.game_class, seeds)
+            return stats
+
+        # プロセスを利用する時に初めて import する
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers = min(self.max_workers, len(chunks))) as executor:
+            for chunk_stats in executor.map(play_chunk, [self.game_class] * len(chunks), chunks):
+                stats += chunk_stats
+
+        return stats
@@ -3,6 +3,7 @@ import time
 from ..utils import (
     Card,
     Suit,
+    CardPlayed,
 )
 
 from ..field import (
@@ -25,13 +26,19 @@ class Track:
         1. トラックの処理の実行
         2. そのトラックにおける勝者の決定
     """
-    def __init__(self, field: Field, start_player_id: int, time_lag: int = 0):
+    def __init__(self, 
+                 field: Field, 
+                 start_player_id: int, 
+                 time_lag: int = 0, 
+                 is_headless: bool = False):
         """Constructor.
 
         Attributes:
             field (Field): フィールド
             start_player_id (int): 最初にプレイをするプレイヤーの番号
             time_lag (int): トラック内のひとつのプレイの間に時間を停止させる時間 [s]
+            is_headless (bool): 表示を行わないかどうか
+                True の場合、メッセージの作成と時間の停止を行わない
 
         Note:
             初めに出したカードのスートを台札とする
@@ -39,6 +46,7 @@ class Track:
         self.field = field
         self.start_player_id = start_player_id
         self.time_lag = time_lag
+        self.is_headless = is_headless
 
         self.play_cnt = 0
         self.lead_suit = None
@@ -54,7 +62,8 @@ class Track:
             処理の流れ
                 1. プレイを行うプレイヤーを決定
                 2. カードを提出、切り札の決定
-                3. play_cnt をインクルーメントする
+                3. 購読者がいれば、CardPlayed を発生させる
+                4. play_cnt をインクルーメントする
         """
         if self.play_cnt >= len(self.field.players):
             """
@@ -68,11 +77,14 @@ class Track:
         card = self.play(player)
 
         self.field.put_card(player.name, card)
-        self.field.message = f"{player.name} が {card} を出した"
+        if self.field.events:
+            self.field.events.emit(CardPlayed(player.name, card, self.play_cnt))
 
         # closing
         self.play_cnt += 1
-        time.sleep(self.time_lag)
+        if not self.is_headless:
+            self.field.message = f"{player.name} が {card} を出した"
+            time.sleep(self.time_lag)
         return self.field
     
     def play(self, player: Player) -> Card:
@@ -88,7 +100,7 @@ class Track:
         Note:
             台札の情報をプレイヤーに教える
         """
-        card = player.play_card(lead_suit=self.field.lead)
+        card = player.play_card(lead_suit=self.field.lead, field=self.field)
             
         return card
     
@@ -107,12 +119,17 @@ class SimpleTrack(Track):
         field (Field): フィールド
         start_player_id (int): 最初にプレイをするプレイヤーの番号
         time_lag (int): トラック内のひとつのプレイの間に時間を停止させる時間 [s]
+        is_headless (bool): 表示を行わないかどうか
 
     Note:
         切り札のスートは固定する
     """
-    def __init__(self, field: Field, start_player_id: int, time_lag: int = 0):
-        super().__init__(field, start_player_id, time_lag)
+    def __init__(self, 
+                 field: Field, 
+                 start_player_id: int, 
+                 time_lag: int = 0, 
+                 is_headless: bool = False):
+        super().__init__(field, start_player_id, time_lag, is_headless)
 
     def play(self, player: Player) -> Card:
         """
@@ -124,7 +141,7 @@ class SimpleTrack(Track):
         Note:
             プレイヤー達のプレイに、台札は影響しない
         """
-        card = player.play_card()
+        card = player.play_card(field=self.field)
 
         return card
 
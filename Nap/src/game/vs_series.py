@@ -1,8 +1,8 @@
-import random
+from collections.abc import Sequence
 
 from ..utils import (
     Suit,
-    Card,
+    get_card_id,
 )
 
 from ..player import (
@@ -16,6 +16,8 @@ from .game import (
     EasyNapGame,
     NapGame,
 )
+from .advisor import BidAdvisor
+from .equity import EquityTable
 
 class VSBase:
     """
@@ -62,9 +64,12 @@ class SimpleNapVSTakeshi(VSTakeshi, SimpleNapGame):
 8. トリックの先行は、常にたけし
 9. ジョーカーなしの 52 枚のカード
 """
-    def __init__(self, player_how_to_choose: str = "input"):
+    def __init__(self, player_how_to_choose: str = "input", is_headless: bool = False, seed: int | None = None, deal_order: Sequence[int] | None = None):
         super().__init__(player_how_to_choose = player_how_to_choose,
-                         first_message = Takeshi.talk(theme = "introduction"))
+                         first_message = Takeshi.talk(theme = "introduction"),
+                         is_headless = is_headless,
+                         seed = seed,
+                         deal_order = deal_order)
 
     def deal(self) -> None:
         """Deal cards.
@@ -72,11 +77,11 @@ class SimpleNapVSTakeshi(VSTakeshi, SimpleNapGame):
         カードを各プレイヤーに配る
         たけしには、クラブのカードを渡す
         """
-        takeshi_hand = [Card(num = n, suit = Suit.club) for n in range(1, 1 + self.hand_num)]
+        takeshi_hand_ids = [get_card_id(n, Suit.club) for n in range(1, 1 + self.hand_num)]
 
         for player in self.field.players:
             if player.name == "たけし": 
-                takeshi_hand = self.field.deck.pull_out(takeshi_hand)
+                takeshi_hand = self.field.deck.pull_out_ids(takeshi_hand_ids)
                 player.take_hand(takeshi_hand)
             else:
                 player.take_hand(self.field.deck.deal(self.hand_num))
@@ -98,9 +103,12 @@ class EasyNapVSTakeshi(VSTakeshi, EasyNapGame):
 6. 最初のトリックの先行は、ランダム / その後は前のトリックの勝者
 7. ジョーカーなしの 52 枚のカード
 """
-    def __init__(self, player_how_to_choose: str = "input", first_message: str = None):
+    def __init__(self, player_how_to_choose: str = "input", first_message: str = None, is_headless: bool = False, seed: int | None = None, deal_order: Sequence[int] | None = None):
         super().__init__(player_how_to_choose = player_how_to_choose,
-                         first_message = Takeshi.talk(theme = "introduction"))
+                         first_message = Takeshi.talk(theme = "introduction"),
+                         is_headless = is_headless,
+                         seed = seed,
+                         deal_order = deal_order)
 
     def deal(self) -> None:
         """Deal cards.
@@ -109,11 +117,11 @@ class EasyNapVSTakeshi(VSTakeshi, EasyNapGame):
         たけしには、クラブのカードを多く渡す
         """
         club_card_num = 3
-        takeshi_hand_club = [Card(num = n, suit = Suit.club) for n in range(1, 1 + club_card_num)]
+        takeshi_hand_club_ids = [get_card_id(n, Suit.club) for n in range(1, 1 + club_card_num)]
 
         for player in self.field.players:
             if player.name == "たけし": 
-                takeshi_hand = self.field.deck.pull_out(takeshi_hand_club)
+                takeshi_hand = self.field.deck.pull_out_ids(takeshi_hand_club_ids)
                 takeshi_hand += self.field.deck.deal(self.hand_num - club_card_num)
                 player.take_hand(takeshi_hand)
             else:
@@ -127,7 +135,7 @@ class EasyNapVSTakeshi(VSTakeshi, EasyNapGame):
             切り札は、クラブ以外でランダム
 
         """
-        self.field.trump = [Suit.spade, Suit.heart, Suit.diamond][random.randint(0, 2)]
+        self.field.trump = [Suit.spade, Suit.heart, Suit.diamond][self.rng.randint(0, 2)]
 
 class VSShizuka(VSBase):
     """
@@ -163,19 +171,12 @@ class EasyNapVSShizuka(VSShizuka, EasyNapGame):
 6. 最初のトリックの先行は、ランダム / その後は前のトリックの勝者
 7. ジョーカーなしの 52 枚のカード
 """
-    def __init__(self, player_how_to_choose: str = "input", first_message: str = "私も混ぜてもらえる？"):
+    def __init__(self, player_how_to_choose: str = "input", first_message: str = "私も混ぜてもらえる？", is_headless: bool = False, seed: int | None = None, deal_order: Sequence[int] | None = None):
         super().__init__(player_how_to_choose = player_how_to_choose,
-                         first_message = first_message)
-
-    def _set_trump(self):
-        """
-        切り札を設定する
-
-        Note:
-            切り札は、ランダム
-
-        """
-        self.field.trump = [Suit.spade, Suit.heart, Suit.diamond, Suit.club][random.randint(0, 3)]
+                         first_message = first_message,
+                         is_headless = is_headless,
+                         seed = seed,
+                         deal_order = deal_order)
 
 class NapVSShizuka(VSShizuka, NapGame):
     """
@@ -196,6 +197,31 @@ class NapVSShizuka(VSShizuka, NapGame):
 -> c. 最初のトリックの先行は、デクレアラー / その後は前のトリックの勝者
 6. ジョーカーなしの 52 枚のカード
 """
-    def __init__(self, player_how_to_choose: str = "input", first_message: str = "次はNapで勝負しましょう"):
+    # CPU の宣言は、手札を解いた評価から選ぶ (評価のキャッシュは全てのゲームで共有する)
+    #   build_equity_table で作成した表があれば、最初のゲームの準備で読み込み、表から評価する (速くなる)
+    bid_advisor = BidAdvisor()
+    _is_equity_table_loaded = False
+
+    def __init__(self, player_how_to_choose: str = "input", first_message: str = "次はNapで勝負しましょう", is_headless: bool = False, seed: int | None = None, deal_order: Sequence[int] | None = None, bid_advisor: BidAdvisor | None = None):
+        if bid_advisor is None:
+            self._load_equity_table()
         super().__init__(player_how_to_choose = player_how_to_choose,
-                         first_message = first_message)
+                         first_message = first_message,
+                         is_headless = is_headless,
+                         seed = seed,
+                         deal_order = deal_order,
+                         bid_advisor = bid_advisor)
+
+    @classmethod
+    def _load_equity_table(cls) -> None:
+        """
+        事前に作成した表があれば、クラスのアドバイザーに設定する
+
+        Note:
+            読み込むのは、最初の 1 回のみ (import の時にはファイルを探さない)
+        """
+        if cls._is_equity_table_loaded:
+            return
+        cls._is_equity_table_loaded = True
+        if cls.bid_advisor is not None and cls.bid_advisor.equity_table is None:
+            cls.bid_advisor.set_equity_table(EquityTable.find(player_num = 3, hand_num = 5))
@@ -5,4 +5,6 @@ from .player import Player
 from .charactor import (
     Takeshi,
     Shizuka,
-)
\ No newline at end of file
+)
+
+from .monte_carlo import MonteCarloPlayer
@@ -0,0 +1,339 @@
+import atexit
+import random
+import time
+from typing import NamedTuple
+
+from ..utils import (
+    Suit,
+    Card,
+    Bitboard,
+    SUIT_INDEX,
+    CARD_SUIT_INDEX_TABLE,
+    iter_card_ids,
+)
+from ..utils.playout import random_playout
+
+from .player import Player
+
+# ロールアウトを実行するプロセスのプール (max_workers ごとに 1 つだけ作成して使い回す)
+#   インタプリタの終了時に、shutdown_executors で終了させる
+_executors = {}
+
+class RolloutState(NamedTuple):
+    """
+    ロールアウトに必要な、プレイヤーから見えている情報
+
+    Attributes:
+        seat (int): 自分の席の番号
+        hand (int): 自分の手札のマスク
+        hand_nums (tuple[int, ...]): 席ごとの手札の枚数
+        unseen (tuple[int, ...]): まだ見えていないカードの id
+            他のプレイヤーの手札、ウィドー、山札の残り
+        trick (tuple[tuple[int, int], ...]): 現在のトラックで出されたカード (席の番号, カードの id)
+        trump (int): 切り札のスートの番号 (なしは 0)
+        use_lead (bool): 台札のルールを利用するかどうか
+        trump_from_lead (bool): 次に出す台札のスートが切り札となるかどうか
+        team (tuple[int, ...]): 獲得トリック数を数える席の番号 (自分のチーム)
+
+    Note:
+        整数とタプルのみなので、そのままワーカーのプロセスに渡せる
+    """
+    seat: int
+    hand: int
+    hand_nums: tuple[int, ...]
+    unseen: tuple[int, ...]
+    trick: tuple[tuple[int, int], ...]
+    trump: int
+    use_lead: bool
+    trump_from_lead: bool
+    team: tuple[int, ...]
+
+def sample_hands(state: RolloutState, rng: random.Random) -> list[int]:
+    """
+    見えていないカードを、他のプレイヤーの手札として配り直す (determinization)
+
+    Args:
+        state (RolloutState): プレイヤーから見えている情報
+        rng (random.Random): 乱数生成器
+
+    Returns:
+        list[int]: 席ごとの手札のマスク
+    """
+    unseen = list(state.unseen)
+    rng.shuffle(unseen)
+
+    hands = []
+    position = 0
+    for seat, hand_num in enumerate(state.hand_nums):
+        if seat == state.seat:
+            hands.append(state.hand)
+            continue
+
+        mask = 0
+        for card_id in unseen[position:position + hand_num]:
+            mask |= 1 << card_id
+        hands.append(mask)
+        position += hand_num
+
+    return hands
+
+def rollout_moves(state: RolloutState,
+                  moves: list[int],
+                  round_num: int,
+                  seed: int | None,
+                  time_budget: float) -> tuple[list[int], int]:
+    """
+    出せるカードごとに、ランダムなプレイアウトを繰り返して獲得トリック数を合計する
+
+    Args:
+        state (RolloutState): プレイヤーから見えている情報
+        moves (list[int]): 出せるカードの id
+        round_num (int): 繰り返す回数の上限
+        seed (int | None): 乱数のシード
+        time_budget (float): 利用できる時間 [s]
+
+    Returns:
+        tuple[list[int], int]: 出せるカードごとの獲得トリック数の合計, 繰り返した回数
+
+    Note:
+        1 回ごとに他のプレイヤーの手札を配り直し、同じ配り方で全ての出せるカードを試す
+        時間を超えた場合は、その回で打ち切る (最低 1 回は行う)
+        ワーカーのプロセスでも実行するので、モジュールの関数とする
+    """
+    rng = random.Random(seed)
+    deadline = time.perf_counter() + time_budget
+    totals = [0] * len(moves)
+    seat_num = len(state.hand_nums)
+    next_seat = (state.seat + 1) % seat_num
+
+    done_num = 0
+    while done_num < round_num:
+        hands = sample_hands(state, rng)
+        for move_cnt, card_id in enumerate(moves):
+            trump = state.trump
+            if state.trump_from_lead and not state.trick:
+                trump = CARD_SUIT_INDEX_TABLE[card_id]
+
+            hands[state.seat] = state.hand ^ (1 << card_id)
+            points = random_playout(hands,
+                                    state.trick + ((state.seat, card_id),),
+                                    next_seat,
+                                    trump,
+                                    state.use_lead,
+                                    rng,
+                                    trump_from_lead = state.trump_from_lead and bool(state.trick))
+            totals[move_cnt] += sum(points[seat] for seat in state.team)
+
+        done_num += 1
+        if time.perf_counter() >= deadline:
+            break
+
+    return totals, done_num
+
+def _get_executor(max_workers: int):
+    """
+    ロールアウトを実行するプロセスのプールを取得する
+
+    Args:
+        max_workers (int): プロセスの数
+
+    Note:
+        プールを作成する時に初めて import する
+    """
+    if max_workers not in _executors:
+        from concurrent.futures import ProcessPoolExecutor
+        _executors[max_workers] = ProcessPoolExecutor(max_workers = max_workers)
+    return _executors[max_workers]
+
+@atexit.register
+def shutdown_executors() -> None:
+    """
+    ロールアウトを実行するプロセスのプールを全て終了させる
+
+    Note:
+        インタプリタの終了時に呼ばれる
+        途中で呼んでもよい (次に必要になった時に、プールを作成し直す)
+    """
+    while _executors:
+        _, executor = _executors.popitem()
+        executor.shutdown(wait = True, cancel_futures = True)
+
+class MonteCarloPlayer(Player):
+    """
+    モンテカルロ法でカードを選ぶ CPU のプレイヤー
+
+    Attributes:
+        rollout_num (int): 1 回の選択で、出せるカードごとに行うプレイアウトの回数の上限
+        time_budget (float): 1 回の選択に利用できる時間 [s]
+        max_workers (int): ロールアウトに利用するプロセスの数
+            1 の場合、プロセスを作成せずに実行する
+
+    Note:
+        カードの選び方
+            1. 見えていないカード (自分の手札、捨て札、場のカード以外) を他のプレイヤーに配り直す
+            2. 出せるカードごとに、全員がランダムに出すプレイアウトを最後まで行う
+            3. 1, 2 を繰り返し、自分のチームの獲得トリック数の合計が最も多いカードを出す
+        自分のチームは、ディクレアラーがいればディクレアラーとそれ以外、いなければ自分のみ
+
+        時間を超えた場合は、それまでの結果で選ぶので、回数が上限に届かないことがある
+            その場合、同じシードでも結果が変わる可能性がある
+        field が渡されない場合、宣言を行う場合は、Player と同じくランダムに選ぶ
+
+        並列化は指定した場合のみ行う (max_workers の既定は 1)
+            プロセスの作成やカードの受け渡しの分だけ遅くなるので、rollout_num が小さい場合は 1 の方が速い
+            Tournament などで、既にゲームをプロセスごとに並列に実行している場合も 1 とする
+            2 以上の場合、プロセスのプールは max_workers ごとに全てのプレイヤーで共有し、
+                インタプリタの終了時 (または shutdown_executors を呼んだ時) に終了させる
+    """
+    def __init__(self,
+                 name: str = "Monte",
+                 cpu: bool = True,
+                 how_to_choose: str = "input",
+                 rng: random.Random | None = None,
+                 rollout_num: int = 200,
+                 time_budget: float = 0.2,
+                 max_workers: int = 1):
+        """
+        Args:
+            name (str): プレイヤーの名前
+            cpu (bool): CPU かどうか
+            how_to_choose (str): CPU でない場合のカードの選択方法
+            rng (random.Random | None): 乱数生成器
+            rollout_num (int): 出せるカードごとに行うプレイアウトの回数の上限
+            time_budget (float): 1 回の選択に利用できる時間 [s]
+            max_workers (int): ロールアウトに利用するプロセスの数
+        """
+        super().__init__(name = name, cpu = cpu, how_to_choose = how_to_choose, rng = rng)
+        if rollout_num < 1:
+            raise ValueError(f"rollout_num は 1 以上: {rollout_num}")
+        if max_workers < 1:
+            raise ValueError(f"max_workers は 1 以上: {max_workers}")
+
+        self.rollout_num = rollout_num
+        self.time_budget = time_budget
+        self.max_workers = max_workers
+
+    def __repr__(self):
+        return f"MonteCarloPlayer(name={self.name})"
+
+    def play_card(self,
+                  is_random: bool = False,
+                  lead_suit: Suit = None,
+                  field = None) -> Card:
+        """Play card.
+        カードを出す
+
+        Args:
+            is_random (bool): ランダムにカードを出すかどうか
+            lead_suit (Suit): 台札のスート
+            field (Field): フィールド
+
+        Returns:
+            Card: カード
+        """
+        if is_random or not self.cpu or field is None:
+            return super().play_card(is_random = is_random, lead_suit = lead_suit, field = field)
+
+        legal_ids = self.hand_board.legal_moves(lead_suit).card_ids()
+        if len(legal_ids) == 1:
+            return self.pop_card_id(legal_ids[0])
+
+        return self.pop_card_id(self.search(field, legal_ids))
+
+    def make_state(self, field) -> RolloutState | None:
+        """
+        フィールドから、自分に見えている情報を取り出す
+
+        Args:
+            field (Field): フィールド
+
+        Returns:
+            RolloutState | None: 見えている情報
+                見えていないカードが、他のプレイヤーの手札の枚数に足りない場合は None
+        """
+        names = [player.name for player in field.players]
+        seat = names.index(self.name)
+        trick = tuple((names.index(name), card.card_id) for name, card in field.cards.items())
+        hand_nums = tuple(len(player.cards) for player in field.players)
+
+        # デッキの初期状態のカード
+        deck_mask = Bitboard.from_cards(type(field.deck).model_fields["cards"].default_factory()).mask
+        seen_mask = self.hand_board.mask | field.trash_board.mask | Bitboard.from_ids(card_id for _, card_id in trick).mask
+        unseen = tuple(iter_card_ids(deck_mask & ~seen_mask))
+        if len(unseen) < sum(hand_nums) - hand_nums[seat]:
+            return None
+
+        if field.declarer in names:
+            declarer_seat = names.index(field.declarer)
+            team = (seat,) if seat == declarer_seat else tuple(s for s in range(len(names)) if s != declarer_seat)
+        else:
+            team = (seat,)
+
+        return RolloutState(seat = seat,
+                            hand = self.hand_board.mask,
+                            hand_nums = hand_nums,
+                            unseen = unseen,
+                            trick = trick,
+                            trump = SUIT_INDEX[field.trump],
+                            use_lead = field.is_use_lead,
+                            trump_from_lead = field.trump is None and field.declarer in names,
+                            team = team)
+
+    def search(self, field, legal_ids: list[int]) -> int:
+        """
+        出せるカードの中から、プレイアウトの結果が最もよいカードを選ぶ
+
+        Args:
+            field (Field): フィールド
+            legal_ids (list[int]): 出せるカードの id
+
+        Returns:
+            int: 選んだカードの id
+        """
+        state = self.make_state(field)
+        if state is None:
+            return legal_ids[self.rng.randrange(len(legal_ids))]
+
+        if self.max_workers == 1:
+            totals, _ = rollout_moves(state, legal_ids, self.rollout_num, self.rng.getrandbits(63), self.time_budget)
+        else:
+            totals = self._rollout_parallel(state, legal_ids)
+            if totals is None:
+                totals, _ = rollout_moves(state, legal_ids, 1, self.rng.getrandbits(63), 0)
+
+        return max(zip(totals, legal_ids), key = lambda x: x[0])[1]
+
+    def _rollout_parallel(self, state: RolloutState, legal_ids: list[int]) -> list[int] | None:
+        """
+        ロールアウトをプロセスに分けて実行する
+
+        Args:
+            state (RolloutState): 見えている情報
+            legal_ids (list[int]): 出せるカードの id
+
+        Returns:
+            list[int] | None: 出せるカードごとの獲得トリック数の合計
+                間に合ったワーカーがなければ None
+
+        Note:
+            各ワーカーも time_budget で打ち切るので、待つのは time_budget と少しだけ
+            間に合わなかったワーカーの結果は利用しない
+        """
+        from concurrent.futures import wait
+
+        executor = _get_executor(self.max_workers)
+        round_num = -(-self.rollout_num // self.max_workers)
+        futures = [executor.submit(rollout_moves, state, legal_ids, round_num, self.rng.getrandbits(63), self.time_budget)
+                   for _ in range(self.max_workers)]
+        done, not_done = wait(futures, timeout = self.time_budget * 1.5)
+        for future in not_done:
+            future.cancel()
+        if not done:
+            return None
+
+        totals = [0] * len(legal_ids)
+        for future in done:
+            for move_cnt, total in enumerate(future.result()[0]):
+                totals[move_cnt] += total
+
+        return totals
@@ -4,6 +4,7 @@ from typing import Literal
 from ..utils import (
     Suit,
     Card,
+    Bitboard,
     Logger,
 )
 
@@ -23,6 +24,10 @@ class Player:
 
         point (int): プレイヤーが所持してる点数
         cards (list[Card]): プレイヤーのハンド
+        hand_board (Bitboard): プレイヤーのハンドのマスク
+            スートの判定や出せるカードの計算に利用する
+        rng (random.Random): CPU の選択に利用する乱数生成器
+            ゲームに参加すると、ゲームの乱数生成器が渡される
 
     Note:
         プレイヤーは、ナポレオン、副官、連合軍のいずれかである
@@ -38,7 +43,8 @@ class Player:
     def __init__(self, 
                  name: str = "Unknown", 
                  cpu: bool = False, 
-                 how_to_choose: str = "input"):
+                 how_to_choose: str = "input",
+                 rng: random.Random | None = None):
         """Constructor.
         
         Attributes:
@@ -47,6 +53,8 @@ class Player:
             how_to_choose (str): プレイヤークラスの choose_card メソッドの挙動の方法
                 input: input method を利用
                 set: 変数を格納することでカードを選択する
+            rng (random.Random | None): CPU の選択に利用する乱数生成器
+                指定がなければ、random モジュールの乱数を利用する
         """
         self.name = name
         self.cpu = cpu
@@ -60,6 +68,8 @@ class Player:
 
         self.point = 0
         self.cards = []
+        self.hand_board = Bitboard()
+        self.rng = random if rng is None else rng
         self._choose_card_id = None
         self._choose_declare_id = None
 
@@ -111,6 +121,7 @@ class Player:
             cards (list): List of cards.
         """
         self.cards = sorted(cards)
+        self.hand_board = Bitboard.from_cards(self.cards)
         
     def show_hand(self, 
                   hint: str = "no", 
@@ -177,7 +188,7 @@ class Player:
         if lead_suit is None:
             # リードがなければ、何も表示しない
             cards_can_submit = self.cards
-        elif lead_suit not in [c.suit for c in self.cards]:
+        elif not self.hand_board.has_suit(lead_suit):
             print("どのカードでも出せます。")
             cards_can_submit = self.cards
         else:
@@ -261,6 +272,7 @@ class Player:
             self.choose_card_id = None
 
         card = self.cards.pop(card_id)
+        self.hand_board.remove(card)
 
         return card
 
@@ -290,15 +302,41 @@ class Player:
 
         return declare
 
+    def pop_card_id(self, card_id: int) -> Card:
+        """
+        手札から、id のカードを取り出す
+
+        Args:
+            card_id (int): 取り出すカードの id
+
+        Returns:
+            Card: 取り出したカード
+
+        Raises:
+            ValueError: 手札に id のカードがない場合
+        """
+        for position, card in enumerate(self.cards):
+            if card.card_id == card_id:
+                break
+        else:
+            raise ValueError(f"手札にないカード: {card_id}")
+        card = self.cards.pop(position)
+        self.hand_board.remove(card)
+
+        return card
+
     def play_card(self, 
                   is_random: bool = False, 
-                  lead_suit: Suit = None) -> Card:
+                  lead_suit: Suit = None,
+                  field = None) -> Card:
         """Play card.
         カードを出す
         
         Args:
-            field (Field): フィールド
             is_random (bool): ランダムにカードを出すかどうか
+            lead_suit (Suit): 台札のスート
+            field (Field): フィールド
+                このクラスでは利用しない (MonteCarloPlayer などが、場の情報から選ぶために利用する)
             
         Returns:
             Card: カード
@@ -306,17 +344,12 @@ class Player:
         Note:
             ランダム or CPU ならば、ランダムにカードを選択する
                 lead_suit がない、もしくは手札に lead_suit がなければ、ランダムに選択する
+                出せるカードは、hand_board から計算する
         """
 
         if is_random or self.cpu:
-            
-            if lead_suit is None or lead_suit not in [c.suit for c in self.cards]:
-                cards = self.cards
-            else:
-                cards = [c for c in self.cards if c.suit == lead_suit]
-
-            card_id = random.randrange(len(cards))
-            card = self.cards.pop(card_id)
+            legal_ids = self.hand_board.legal_moves(lead_suit).card_ids()
+            card = self.pop_card_id(legal_ids[self.rng.randrange(len(legal_ids))])
 
         else:
             card = self.choose_card(lead_suit)
@@ -342,7 +375,7 @@ class Player:
         """
 
         if is_random or self.cpu:
-            declear = random.choice(declarable_list)
+            declear = self.rng.choice(declarable_list)
 
         else:
             declear = self.choose_declare(declarable_list)
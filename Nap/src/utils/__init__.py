@@ -1,6 +1,28 @@
 from .card import (
     Card,
     Suit,
+    get_card_id,
+    CARD_ID_NUM,
+    SUIT_INDEX,
+    CARD_SUIT_INDEX_TABLE,
+    SUIT_POWER_TABLE,
+    SUIT_POWER_UNIT,
+    STRENGTH_TABLE,
+)
+
+from .bitboard import (
+    Bitboard,
+    SUIT_MASKS,
+    legal_mask,
+    iter_card_ids,
+)
+
+from .canonical import (
+    LRUCache,
+    suit_permutation,
+    permute_suits,
+    canonical_hands,
+    canonical_hand,
 )
 
 from .deck import (
@@ -8,5 +30,31 @@ from .deck import (
     SimpleDeck,
 )
 
+from .event import (
+    CardPlayed,
+    TrickWon,
+    BidMade,
+    GameOver,
+    GameEvent,
+    EventStream,
+    EventBuffer,
+)
+
 from .base import BasePicture
-from .logger import Logger
\ No newline at end of file
+from .logger import Logger
+
+def __getattr__(name: str):
+    """
+    numpy を利用するクラスは、参照した時に初めて import する
+
+    Args:
+        name (str): 属性の名前
+    """
+    if name == "Dealer":
+        from .dealer import Dealer
+        return Dealer
+    if name == "trick_winners":
+        from .trick import trick_winners
+        return trick_winners
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,222 @@
+from collections.abc import Iterable, Iterator
+
+from .card import (
+    Suit,
+    Card,
+    SUIT_CARD_NUM,
+    STRONG_JOKER_ID,
+    WEAK_JOKER_ID,
+    CARD_ID_NUM,
+)
+
+# スートごとのマスク
+#   Suit の値で参照できるように、先頭はジョーカーなどのスートのないカードのためのダミー
+_ONE_SUIT_MASK = (1 << SUIT_CARD_NUM) - 1
+SUIT_MASKS: tuple[int, ...] = (0,) + tuple(
+    _ONE_SUIT_MASK << ((int(suit) - 1) * SUIT_CARD_NUM) for suit in sorted(Suit))
+JOKER_MASK = (1 << STRONG_JOKER_ID) | (1 << WEAK_JOKER_ID)
+FULL_MASK = (1 << CARD_ID_NUM) - 1
+
+def iter_card_ids(mask: int) -> Iterator[int]:
+    """
+    マスクに含まれるカードの id を小さい順に取り出す
+
+    Args:
+        mask (int): カードのマスク
+
+    Yields:
+        int: カードの id
+    """
+    while mask:
+        lowest = mask & -mask
+        yield lowest.bit_length() - 1
+        mask ^= lowest
+
+def legal_mask(hand: int, lead_suit: Suit | None) -> int:
+    """
+    出すことができるカードのマスクを計算する
+
+    Args:
+        hand (int): 手札のマスク
+        lead_suit (Suit | None): 台札のスート
+
+    Returns:
+        int: 出すことができるカードのマスク
+
+    Note:
+        台札のスートを持っていれば、そのスートのカードのみ出せる
+        持っていなければ、どのカードでも出せる
+    """
+    if lead_suit is None:
+        return hand
+
+    follow = hand & SUIT_MASKS[lead_suit]
+    return follow if follow else hand
+
+class Bitboard:
+    """
+    カードの集合を 64 bit のマスクで管理するクラス
+
+    Attributes:
+        mask (int): カードの id の位置のビットが立ったマスク
+
+    Note:
+        手札や山札の判定をリストの走査ではなく、整数の演算で行うために利用する
+            1. スートを持っているかどうか
+            2. 出すことができるカード
+            3. カードの追加と削除
+            4. 枚数
+    """
+    __slots__ = ("mask",)
+
+    def __init__(self, mask: int = 0):
+        """
+        Args:
+            mask (int): カードのマスク
+        """
+        self.mask = mask
+
+    @classmethod
+    def from_cards(cls, cards: Iterable[Card]) -> "Bitboard":
+        """
+        カードから作成する
+
+        Args:
+            cards (Iterable[Card]): カード
+
+        Returns:
+            Bitboard: カードの集合
+        """
+        mask = 0
+        for card in cards:
+            mask |= 1 << card.card_id
+        return cls(mask)
+
+    @classmethod
+    def from_ids(cls, card_ids: Iterable[int]) -> "Bitboard":
+        """
+        カードの id から作成する
+
+        Args:
+            card_ids (Iterable[int]): カードの id
+
+        Returns:
+            Bitboard: カードの集合
+        """
+        mask = 0
+        for card_id in card_ids:
+            mask |= 1 << card_id
+        return cls(mask)
+
+    def __len__(self) -> int:
+        """
+        カードの枚数
+        """
+        return self.mask.bit_count()
+
+    def __bool__(self) -> bool:
+        return self.mask != 0
+
+    def __int__(self) -> int:
+        return self.mask
+
+    def __contains__(self, card: Card | int) -> bool:
+        """
+        カードを含んでいるかどうか
+
+        Args:
+            card (Card | int): カード、もしくはカードの id
+        """
+        card_id = card if isinstance(card, int) else card.card_id
+        return (self.mask >> card_id) & 1 == 1
+
+    def __iter__(self) -> Iterator[int]:
+        """
+        カードの id を小さい順に取り出す
+        """
+        return iter_card_ids(self.mask)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, Bitboard):
+            return self.mask == other.mask
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"Bitboard(mask={self.mask:#x})"
+
+    def add(self, card: Card | int) -> None:
+        """
+        カードを追加する
+
+        Args:
+            card (Card | int): カード、もしくはカードの id
+        """
+        card_id = card if isinstance(card, int) else card.card_id
+        self.mask |= 1 << card_id
+
+    def remove(self, card: Card | int) -> None:
+        """
+        カードを削除する
+
+        Args:
+            card (Card | int): カード、もしくはカードの id
+
+        Raises:
+            ValueError: カードが含まれていない場合
+        """
+        card_id = card if isinstance(card, int) else card.card_id
+        bit = 1 << card_id
+        if not self.mask & bit:
+            raise ValueError("削除するカードがありません")
+        self.mask ^= bit
+
+    def has_suit(self, suit: Suit) -> bool:
+        """
+        スートのカードを持っているかどうか
+
+        Args:
+            suit (Suit): スート
+        """
+        return self.mask & SUIT_MASKS[suit] != 0
+
+    def suit(self, suit: Suit) -> "Bitboard":
+        """
+        スートのカードのみを取り出す
+
+        Args:
+            suit (Suit): スート
+
+        Returns:
+            Bitboard: スートのカードの集合
+        """
+        return Bitboard(self.mask & SUIT_MASKS[suit])
+
+    def legal_moves(self, lead_suit: Suit | None = None) -> "Bitboard":
+        """
+        出すことができるカード
+
+        Args:
+            lead_suit (Suit | None): 台札のスート
+
+        Returns:
+            Bitboard: 出すことができるカードの集合
+        """
+        return Bitboard(legal_mask(self.mask, lead_suit))
+
+    def card_ids(self) -> list[int]:
+        """
+        カードの id の一覧
+
+        Returns:
+            list[int]: カードの id (小さい順)
+        """
+        return list(iter_card_ids(self.mask))
+
+    def cards(self) -> list[Card]:
+        """
+        カードの一覧
+
+        Returns:
+            list[Card]: 共有されているカードのインスタンス (id の小さい順)
+        """
+        return [Card.from_id(card_id) for card_id in iter_card_ids(self.mask)]
@@ -0,0 +1,179 @@
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Sequence
+from typing import Any
+
+from .card import (
+    Suit,
+    SUIT_CARD_NUM,
+)
+from .bitboard import (
+    JOKER_MASK,
+)
+
+# スートの番号 (Suit の値の順)
+_SUIT_INDEXES: tuple[int, ...] = tuple(int(suit) for suit in sorted(Suit))
+_ONE_SUIT_MASK = (1 << SUIT_CARD_NUM) - 1
+
+def suit_permutation(hands: Sequence[int]) -> tuple[int, ...]:
+    """
+    手札を標準形にするための、スートの並びを求める
+
+    Args:
+        hands (Sequence[int]): 席ごとの手札のマスク
+
+    Returns:
+        tuple[int, ...]: 標準形のスートごとの、元のスートの番号
+            i 番目 (0 始まり) は、標準形でスートの番号 i + 1 となるスート
+
+    Note:
+        スートごとに (席ごとのそのスートのマスク) を並べ、大きい順に並べる
+        同じ並びのスートは入れ替えても同じ手札なので、どちらを先にしてもよい
+    """
+    return tuple(sorted(_SUIT_INDEXES,
+                        key = lambda suit: tuple((hand >> ((suit - 1) * SUIT_CARD_NUM)) & _ONE_SUIT_MASK for hand in hands),
+                        reverse = True))
+
+def permute_suits(hand: int, permutation: Sequence[int]) -> int:
+    """
+    手札のスートを並べ替える
+
+    Args:
+        hand (int): 手札のマスク
+        permutation (Sequence[int]): 新しいスートごとの、元のスートの番号 (suit_permutation の結果)
+
+    Returns:
+        int: スートを並べ替えた手札のマスク
+            スートのないカード (ジョーカー) はそのまま
+    """
+    new_hand = hand & JOKER_MASK
+    for new_suit, suit in enumerate(permutation):
+        new_hand |= ((hand >> ((suit - 1) * SUIT_CARD_NUM)) & _ONE_SUIT_MASK) << (new_suit * SUIT_CARD_NUM)
+    return new_hand
+
+def canonical_hands(hands: Sequence[int]) -> tuple[int, ...]:
+    """
+    スートの入れ替えで同じになる手札の組を、同じ値 (標準形) にする
+
+    Args:
+        hands (Sequence[int]): 席ごとの手札のマスク
+
+    Returns:
+        tuple[int, ...]: 標準形の席ごとの手札のマスク
+
+    Note:
+        切り札が決まっていない間は、スートを入れ替えても結果は変わらない
+            Nap のビッド、最初の台札を出す前の局面など
+        全ての席で同じ入れ替えを行うので、席の間の関係は保たれる
+    """
+    permutation = suit_permutation(hands)
+    return tuple(permute_suits(hand, permutation) for hand in hands)
+
+def canonical_hand(hand: int) -> int:
+    """
+    1 つの手札の標準形を求める
+
+    Args:
+        hand (int): 手札のマスク
+
+    Returns:
+        int: 標準形の手札のマスク
+    """
+    return permute_suits(hand, suit_permutation((hand,)))
+
+class LRUCache:
+    """
+    上限のあるキャッシュ (最も長く参照されていないものから削除する)
+
+    Attributes:
+        max_size (int): 保存する値の数の上限
+        hit_num (int): キャッシュにあった回数
+        miss_num (int): キャッシュになかった回数
+
+    Note:
+        canonical_hand などの標準形をキーにすると、スートの入れ替えで同じになる手札で値を共有できる
+    """
+    def __init__(self, max_size: int = 65536):
+        """
+        Args:
+            max_size (int): 保存する値の数の上限
+        """
+        if max_size < 1:
+            raise ValueError(f"max_size は 1 以上: {max_size}")
+
+        self.max_size = max_size
+        self.hit_num = 0
+        self.miss_num = 0
+        self._data = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._data
+
+    def __repr__(self) -> str:
+        return f"LRUCache(size={len(self._data)}, max_size={self.max_size}, hit_num={self.hit_num}, miss_num={self.miss_num})"
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        値を取得する
+
+        Args:
+            key (Hashable): キー
+            default (Any): キャッシュになかった場合の値
+
+        Returns:
+            Any: 値
+        """
+        if key in self._data:
+            self._data.move_to_end(key)
+            self.hit_num += 1
+            return self._data[key]
+
+        self.miss_num += 1
+        return default
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """
+        値を保存する
+
+        Args:
+            key (Hashable): キー
+            value (Any): 値
+
+        Note:
+            上限を超えたら、最も長く参照されていない値を削除する
+        """
+        self._data[key] = value
+        self._data.move_to_end(key)
+        if len(self._data) > self.max_size:
+            self._data.popitem(last = False)
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """
+        値を取得し、なければ計算して保存する
+
+        Args:
+            key (Hashable): キー
+            compute (Callable[[], Any]): 値を計算する関数
+
+        Returns:
+            Any: 値
+        """
+        if key in self._data:
+            self._data.move_to_end(key)
+            self.hit_num += 1
+            return self._data[key]
+
+        self.miss_num += 1
+        value = compute()
+        self.put(key, value)
+        return value
+
+    def clear(self) -> None:
+        """
+        キャッシュを空にする
+        """
+        self._data.clear()
+        self.hit_num = 0
+        self.miss_num = 0
@@ -1,11 +1,20 @@
 from enum import IntEnum
 from pathlib import Path
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from .base import BasePicture
 
 BASE_DIR = Path(__file__).parents[2]
 
+# カード id の設定
+#   スートごとに 13 枚ずつ、弱い順 (2, 3, ..., K, A) に並べる
+#   club: 0 ~ 12, diamond: 13 ~ 25, heart: 26 ~ 38, spade: 39 ~ 51
+#   強いジョーカー: 52, 弱いジョーカー: 53
+SUIT_CARD_NUM = 13
+STRONG_JOKER_ID = 52
+WEAK_JOKER_ID = 53
+CARD_ID_NUM = 54
+
 class Suit(IntEnum):
     """
     スートクラス
@@ -75,6 +84,79 @@ class Suit(IntEnum):
         else:
             raise ValueError("スートが不正です")
 
+def get_card_id(num: int, suit: Suit | None, joker: int = 0) -> int:
+    """
+    カードの id を計算する
+
+    Args:
+        num (int): カードの数字
+        suit (Suit | None): カードのスート
+        joker (int): ジョーカーかどうか
+
+    Returns:
+        int: カードの id (0 ~ 53)
+    """
+    if joker == 1:
+        return STRONG_JOKER_ID
+    elif joker == 2:
+        return WEAK_JOKER_ID
+
+    power = 14 if num == 1 else num
+    return (int(suit) - 1) * SUIT_CARD_NUM + (power - 2)
+
+# id から情報を引くための表
+CARD_NUM_TABLE: tuple[int, ...] = tuple(
+    [n % SUIT_CARD_NUM + 2 if n % SUIT_CARD_NUM != 12 else 1 for n in range(STRONG_JOKER_ID)] + [16, 15])
+CARD_POWER_TABLE: tuple[int, ...] = tuple(
+    [n % SUIT_CARD_NUM + 2 for n in range(STRONG_JOKER_ID)] + [16, 15])
+CARD_SUIT_TABLE: tuple[Suit | None, ...] = tuple(
+    [Suit(n // SUIT_CARD_NUM + 1) for n in range(STRONG_JOKER_ID)] + [None, None])
+CARD_JOKER_TABLE: tuple[int, ...] = tuple([0] * STRONG_JOKER_ID + [1, 2])
+
+# スートの番号 (切り札、台札、ジョーカーのスートの「なし」は 0)
+SUIT_INDEX: dict[Suit | None, int] = {None: 0, **{suit: int(suit) for suit in Suit}}
+CARD_SUIT_INDEX_TABLE: tuple[int, ...] = tuple(SUIT_INDEX[suit] for suit in CARD_SUIT_TABLE)
+
+def _suit_power(suit_index: int, trump_index: int, lead_index: int) -> int:
+    """
+    スートの強さを計算する
+
+    Args:
+        suit_index (int): スートの番号
+        trump_index (int): 切り札のスートの番号
+        lead_index (int): 台札のスートの番号
+
+    Returns:
+        int: スートの強さ
+            trump (6) > 台札 (5) > spade (4) > heart (3) > diamond (2) > club (1) > ジョーカー (0)
+    """
+    if suit_index == 0:
+        return 0
+    elif suit_index == trump_index:
+        return 6
+    elif suit_index == lead_index:
+        return 5
+    else:
+        return suit_index
+
+# [切り札][台札][スート] のスートの強さ
+SUIT_POWER_TABLE: tuple[tuple[tuple[int, ...], ...], ...] = tuple(
+    tuple(
+        tuple(_suit_power(suit_index, trump_index, lead_index) for suit_index in range(len(Suit) + 1))
+        for lead_index in range(len(Suit) + 1))
+    for trump_index in range(len(Suit) + 1))
+
+# [切り札][台札][カードの id] のカードの強さ
+#   強さは、スートの強さ * SUIT_POWER_UNIT + 数字の強さ (A は 14)
+#   divmod(強さ, SUIT_POWER_UNIT) で (スートの強さ, 数字の強さ) に戻せる
+SUIT_POWER_UNIT = 32
+STRENGTH_TABLE: tuple[tuple[tuple[int, ...], ...], ...] = tuple(
+    tuple(
+        tuple(suit_powers[suit_index] * SUIT_POWER_UNIT + power
+              for suit_index, power in zip(CARD_SUIT_INDEX_TABLE, CARD_POWER_TABLE))
+        for suit_powers in lead_table)
+    for lead_table in SUIT_POWER_TABLE)
+
 class Card(BaseModel, BasePicture):
     """
     カードクラス
@@ -86,6 +168,8 @@ class Card(BaseModel, BasePicture):
         suit (Suit): カードのスート
         joer (int): ジョーカーかどうか
             0, 1, 2
+        card_id (int): カードの id
+            0 ~ 53
         image_url (str): カードの画像のURL
         image_path (Path): カードの画像のパス
 
@@ -95,10 +179,16 @@ class Card(BaseModel, BasePicture):
         2. ジョーカー / joker
             a. 強いジョーカー : 1枚
             b. 弱いジョーカー : 1枚
+
+        カードは変更できない
+            同じカードは、from_id で同じインスタンスを共有できる
     """
+    model_config = ConfigDict(frozen = True)
+
     num: int = Field(default = 2, ge = 1, le = 16)
     suit: Suit | None = Suit.club
     joker: int = Field(default = 0, ge = 0, le = 2)
+    card_id: int = Field(default = 0, ge = 0, lt = CARD_ID_NUM)
     image_url: str | None = None
     image_path: Path | None = None
 
@@ -129,9 +219,42 @@ class Card(BaseModel, BasePicture):
             num = 15
             suit = None
         
-        super().__init__(num = num, suit = suit, joker = joker)
-        self._set_url()
-        self._set_image_path()
+        super().__init__(num = num, 
+                         suit = suit, 
+                         joker = joker,
+                         card_id = get_card_id(num, suit, joker),
+                         image_url = self._make_url(num, suit, joker),
+                         image_path = self._make_image_path(num, suit, joker))
+
+    @classmethod
+    def from_id(cls, card_id: int) -> "Card":
+        """
+        id からカードを取得する
+
+        Args:
+            card_id (int): カードの id
+
+        Returns:
+            Card: 共有されているカードのインスタンス
+        """
+        return _CARDS[card_id]
+
+    # __eq__ は数字のみを比較するので、ハッシュできないようにする
+    #   数字でハッシュすると、スートの違うカードが set や dict で 1 つになってしまう
+    #   カードを set や dict のキーにする場合は、card_id を利用する
+    __hash__ = None
+
+    def __copy__(self) -> "Card":
+        """
+        カードは変更できないので、自身を返す
+        """
+        return self
+
+    def __deepcopy__(self, memo: dict = None) -> "Card":
+        """
+        カードは変更できないので、自身を返す
+        """
+        return self
 
     def __eq__(self, other) -> bool:
         """Equal.
@@ -177,32 +300,47 @@ class Card(BaseModel, BasePicture):
         elif self.joker == 2:
             return "Joker (weak)"
         
-    def _set_url(self):
+    @staticmethod
+    def _make_url(num: int, suit: Suit | None, joker: int) -> str:
         """
-        カードの画像のURLを設定する
+        カードの画像のURLを作成する
         
-        Attributes:
-            image_url (str): カードの画像のURL
+        Args:
+            num (int): カードの数字
+            suit (Suit | None): カードのスート
+            joker (int): ジョーカーかどうか
+
+        Returns:
+            str: カードの画像のURL
         """
 
-        if self.joker == 1:
-            self.image_url = "https://chicodeza.com/wordpress/wp-content/uploads/torannpu-illust53.png"            
-        elif self.joker == 2:
-            self.image_url = "https://chicodeza.com/wordpress/wp-content/uploads/torannpu-illust54.png"            
-        elif self.suit == Suit.spade:
-            self.image_url = f"https://chicodeza.com/wordpress/wp-content/uploads/torannpu-illust{self.num}.png"
-        elif self.suit == Suit.club:
-            self.image_url = f"https://chicodeza.com/wordpress/wp-content/uploads/torannpu-illust{self.num + 13}.png"
-        elif self.suit == Suit.diamond:
-            self.image_url = f"https://chicodeza.com/wordpress/wp-content/uploads/torannpu-illust{self.num + (13 * 2)}.png"
-        elif self.suit == Suit.heart:
-            self.image_url = f"https://chicodeza.com/wordpress/wp-content/uploads/torannpu-illust{self.num + (13 * 3)}.png"
+        if joker == 1:
+            return "https://chicodeza.com/wordpress/wp-content/uploads/torannpu-illust53.png"            
+        elif joker == 2:
+            return "https://chicodeza.com/wordpress/wp-content/uploads/torannpu-illust54.png"            
+        elif suit == Suit.spade:
+            return f"https://chicodeza.com/wordpress/wp-content/uploads/torannpu-illust{num}.png"
+        elif suit == Suit.club:
+            return f"https://chicodeza.com/wordpress/wp-content/uploads/torannpu-illust{num + 13}.png"
+        elif suit == Suit.diamond:
+            return f"https://chicodeza.com/wordpress/wp-content/uploads/torannpu-illust{num + (13 * 2)}.png"
+        elif suit == Suit.heart:
+            return f"https://chicodeza.com/wordpress/wp-content/uploads/torannpu-illust{num + (13 * 3)}.png"
         else:
             raise ValueError("カードの種類が不正です")
         
-    def _set_image_path(self):
+    @staticmethod
+    def _make_image_path(num: int, suit: Suit | None, joker: int) -> Path:
         """
-        画像のパスを設定する
+        画像のパスを作成する
+
+        Args:
+            num (int): カードの数字
+            suit (Suit | None): カードのスート
+            joker (int): ジョーカーかどうか
+
+        Returns:
+            Path: カードの画像のパス
 
         Note:
             Nap/index.html から参照できるパスを
@@ -210,29 +348,25 @@ class Card(BaseModel, BasePicture):
         # base_path = BASE_DIR / "asset/image/cards/png"
         base_path = Path("./asset/image/cards/png")
 
-        if self.joker == 1:
-            card_name = "black_joker.png"
-            self.image_path = base_path / card_name
-            return
-        elif self.joker == 2:
-            card_name = "red_joker.png"
-            self.image_path = base_path / card_name
-            return
+        if joker == 1:
+            return base_path / "black_joker.png"
+        elif joker == 2:
+            return base_path / "red_joker.png"
 
-        if self.num == 1:
+        if num == 1:
             card_name = "ace"
-        elif self.num == 11:
+        elif num == 11:
             card_name = "jack"
-        elif self.num == 12:
+        elif num == 12:
             card_name = "queen"
-        elif self.num == 13:
+        elif num == 13:
             card_name = "king"
         else:
-            card_name = str(self.num)
+            card_name = str(num)
 
-        card_name += f"_of_{self.suit.name}s.png"
+        card_name += f"_of_{suit.name}s.png"
 
-        self.image_path = base_path / card_name
+        return base_path / card_name
         
     def is_joker(self) -> bool:
         """
@@ -258,4 +392,8 @@ class Card(BaseModel, BasePicture):
         else:
             num = self.num
 
-        return num
\ No newline at end of file
+        return num
+
+# id ごとに共有するカードのインスタンス
+_CARDS: tuple[Card, ...] = tuple(
+    Card(CARD_NUM_TABLE[n], CARD_SUIT_TABLE[n], CARD_JOKER_TABLE[n]) for n in range(CARD_ID_NUM))
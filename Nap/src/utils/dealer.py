@@ -0,0 +1,63 @@
+import numpy as np
+
+from .deck import Deck
+
+class Dealer:
+    """
+    複数のゲームの配り方をまとめて作成するクラス
+
+    Attributes:
+        card_ids (np.ndarray): デッキのカードの id
+        rng (np.random.Generator): 乱数生成器
+
+    Note:
+        配り方は、各行がデッキの並びとなる行列として作成する
+            行列の各行は Deck.arrange で、そのままデッキに並べることができる
+            Deck.deal と同じく、行の末尾から配られる
+
+        シードを指定すれば、同じ配り方を再現できる
+    """
+    def __init__(self,
+                 deck_class: type[Deck] = Deck,
+                 seed: int | np.random.Generator | None = None):
+        """
+        Args:
+            deck_class (type[Deck]): 配り方を作成するデッキのクラス
+                Deck か SimpleDeck
+            seed (int | np.random.Generator | None): シード、もしくは乱数生成器
+        """
+        # デッキの初期状態のカード
+        cards = deck_class.model_fields["cards"].default_factory()
+        self.card_ids = np.array([card.card_id for card in cards], dtype = np.int8)
+        self.rng = np.random.default_rng(seed)
+
+    def __len__(self) -> int:
+        """
+        デッキの枚数
+        """
+        return len(self.card_ids)
+
+    def permutations(self, num: int) -> np.ndarray:
+        """
+        デッキの並べ方を作成する
+
+        Args:
+            num (int): 作成する数
+
+        Returns:
+            np.ndarray: (num, デッキの枚数) の並べ方の行列
+                各行は、デッキ内の位置の並び
+        """
+        return self.rng.random((num, len(self.card_ids))).argsort(axis = 1).astype(np.int8)
+
+    def deal_batch(self, num: int) -> np.ndarray:
+        """
+        複数のゲームの配り方をまとめて作成する
+
+        Args:
+            num (int): 作成するゲームの数
+
+        Returns:
+            np.ndarray: (num, デッキの枚数) のカードの id の行列
+        """
+        return self.card_ids[self.permutations(num)]
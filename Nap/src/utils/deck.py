@@ -1,10 +1,15 @@
+from collections.abc import Iterable
 import random
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, PrivateAttr
 
 from .base import BasePicture
+from .bitboard import Bitboard
 from .card import (
     Suit,
     Card,
+    get_card_id,
+    STRONG_JOKER_ID,
+    WEAK_JOKER_ID,
 )
 
 from .logger import Logger
@@ -12,6 +17,14 @@ from .logger import Logger
 logger = Logger()
 print = logger.log_print
 
+# デッキの雛形
+#   共有されているカードのインスタンスを並べた、変更できないタプル
+#   各デッキは、これをリストにコピーして利用する
+SIMPLE_DECK_TEMPLATE: tuple[Card, ...] = tuple(
+    Card.from_id(get_card_id(num, suit)) for num in range(1, 14) for suit in Suit)
+DECK_TEMPLATE: tuple[Card, ...] = SIMPLE_DECK_TEMPLATE + (
+    Card.from_id(STRONG_JOKER_ID), Card.from_id(WEAK_JOKER_ID))
+
 class Deck(BaseModel, BasePicture):
     """
     デッキを管理するクラス    
@@ -21,12 +34,25 @@ class Deck(BaseModel, BasePicture):
 
     Note:
         デッキは、数字とスートを持つ52枚のカードとジョーカー2枚からなる、計54枚のカードからなる
+
+        カードの位置は card_id をキーとした索引 (_positions) で管理する
+            索引は必要になった時に作成し、shuffle で破棄する
+            cards が直接変更された場合も、参照時に位置を確認して作り直す
+
+        cards は、インスタンスごとに DECK_TEMPLATE をコピーして作成する
+            カードは共有されているインスタンスなので、参照のコピーのみで済む
     """
-    cards: list[Card] = [Card(num, suit) for num in range(1, 14) for suit in Suit] + [Card(joker=1), Card(joker=2)]
+    cards: list[Card] = Field(default_factory = lambda: list(DECK_TEMPLATE))
+    _positions: dict[int, int] | None = PrivateAttr(default = None)
 
-    def __init__(self):
+    def __init__(self, display: bool = True):
+        """
+        Args:
+            display (bool): 使用するカードの枚数を表示するかどうか
+        """
         super().__init__()
-        print(f"{len(self.cards)} 枚のカードを使用します\n")
+        if display:
+            print(f"{len(self.cards)} 枚のカードを使用します\n")
 
     def __len__(self) -> int:
         """
@@ -46,11 +72,47 @@ class Deck(BaseModel, BasePicture):
         """
         return str([str(c) for c in self.cards])
 
-    def shuffle(self) -> None:
+    @property
+    def board(self) -> Bitboard:
+        """
+        デッキに残っているカードのマスク
+
+        Returns:
+            Bitboard: デッキに残っているカードの集合
+        """
+        return Bitboard.from_cards(self.cards)
+
+    def shuffle(self, rng: random.Random | None = None) -> None:
         """
         デッキをシャッフルする
+
+        Args:
+            rng (random.Random | None): シャッフルに利用する乱数生成器
+                指定がなければ、random モジュールの乱数を利用する
+        """
+        (random if rng is None else rng).shuffle(self.cards)
+        self._positions = None
+
+    def arrange(self, card_ids: Iterable[int]) -> None:
         """
-        random.shuffle(self.cards)
+        デッキを指定した順番に並べる
+
+        Args:
+            card_ids (Iterable[int]): 並べた後のカードの id (末尾から配られる)
+
+        Raises:
+            ValueError: デッキのカードの並べ替えになっていない場合
+                その場合、デッキは変更されない
+
+        Note:
+            Dealer でまとめて作成した配り方を再現するために利用する
+        """
+        card_ids = [int(card_id) for card_id in card_ids]
+        if len(card_ids) != len(self.cards) or Bitboard.from_ids(card_ids) != self.board:
+            raise ValueError("デッキのカードと一致しません")
+
+        self.cards = [Card.from_id(card_id) for card_id in card_ids]
+        self._positions = None
         
     def deal(self, num: int = 10):
         """
@@ -87,20 +149,96 @@ class Deck(BaseModel, BasePicture):
                 Card Class は少々、特殊な大小関係の計算をする
                 そのため、remove method を正直に使えない
                 
-                そのための対応として、target_id を取得し,
-                del 構文で削除する
+                そのための対応として、card_id の索引から位置を取得し、
+                末尾のカードと入れ替えて削除する (デッキの順番は保存されない)
         """
-        deleted_cards = []
-        for target_card in targets:
-            if str(target_card) not in [str(c) for c in self.cards]:
+        self.pull_out_ids([card.card_id for card in targets])
+
+        return list(targets)
+
+    def pull_out_ids(self, card_ids: Iterable[int]) -> list[Card]:
+        """
+        特定のカードを id を指定してまとめて引き抜く
+
+        Args:
+            card_ids (Iterable[int]): 対象のカードの id
+
+        Returns:
+            list[Card]: 山札から削除したカード
+
+        Raises:
+            ValueError: 対象のカードがデッキにない場合
+                その場合、デッキは変更されない
+        """
+        card_ids = list(card_ids)
+        if len(set(card_ids)) != len(card_ids):
+            raise ValueError("削除するカードがありません")
+
+        for card_id in card_ids:
+            if self._find(card_id) is None:
                 raise ValueError("削除するカードがありません")
 
-            target_id = [str(c) for c in self.cards].index(str(target_card))
-            del self.cards[target_id]
-            deleted_cards.append(target_card)
+        deleted_cards = []
+        for card_id in card_ids:
+            position = self._positions[card_id]
+            deleted_cards.append(self.cards[position])
+
+            # 末尾のカードで穴を埋める
+            last_card = self.cards.pop()
+            if position < len(self.cards):
+                self.cards[position] = last_card
+                self._positions[last_card.card_id] = position
+            del self._positions[card_id]
 
         return deleted_cards
 
+    def _build_positions(self) -> None:
+        """
+        card_id からデッキ内の位置を引く索引を作成する
+        """
+        self._positions = {card.card_id: position for position, card in enumerate(self.cards)}
+
+    def _find(self, card_id: int) -> int | None:
+        """
+        カードのデッキ内の位置を取得する
+
+        Args:
+            card_id (int): カードの id
+
+        Returns:
+            int | None: カードの位置
+                デッキになければ None
+
+        Note:
+            deal などで索引が古くなっている可能性があるので、位置のカードを確認する
+            一致しなければ、索引を作り直して再度確認する
+        """
+        is_new_positions = self._positions is None
+        if is_new_positions:
+            self._build_positions()
+
+        position = self._positions.get(card_id)
+        if self._is_at(card_id, position):
+            return position
+
+        if is_new_positions:
+            return None
+
+        self._build_positions()
+        position = self._positions.get(card_id)
+        return position if self._is_at(card_id, position) else None
+
+    def _is_at(self, card_id: int, position: int | None) -> bool:
+        """
+        カードが指定した位置にあるかどうか
+
+        Args:
+            card_id (int): カードの id
+            position (int | None): デッキ内の位置
+        """
+        return position is not None and position < len(self.cards) \
+            and self.cards[position].card_id == card_id
+
 class SimpleDeck(Deck):
     """
     ジョーカーのないシンプルカードプール
@@ -111,4 +249,4 @@ class SimpleDeck(Deck):
     Note:
         Simple Deck は、数字とスートを持つ52枚のカードからなる
     """
-    cards: list[Card] = [Card(num, suit) for num in range(1, 14) for suit in Suit]
\ No newline at end of file
+    cards: list[Card] = Field(default_factory = lambda: list(SIMPLE_DECK_TEMPLATE))
\ No newline at end of file
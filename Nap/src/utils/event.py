@@ -0,0 +1,146 @@
+from collections.abc import Callable, Iterator
+from typing import NamedTuple
+
+from .card import Card
+
+class CardPlayed(NamedTuple):
+    """
+    プレイヤーがカードを出した
+
+    Attributes:
+        player (str): カードを出したプレイヤーの名前
+        card (Card): 出したカード
+        play_cnt (int): トラックの中で何番目に出したか (0 始まり)
+    """
+    player: str
+    card: Card
+    play_cnt: int
+
+class TrickWon(NamedTuple):
+    """
+    トラックの勝者が決まった
+
+    Attributes:
+        player (str): トラックの勝者の名前
+        track_cnt (int): トラックの番号 (0 始まり)
+        cards (tuple[tuple[str, Card], ...]): 場に出されたカード (出した順)
+    """
+    player: str
+    track_cnt: int
+    cards: tuple[tuple[str, Card], ...]
+
+class BidMade(NamedTuple):
+    """
+    プレイヤーが宣言した
+
+    Attributes:
+        player (str): 宣言したプレイヤーの名前
+        declaration (str): 宣言 (パスを含む)
+    """
+    player: str
+    declaration: str
+
+class GameOver(NamedTuple):
+    """
+    ゲームが終了した
+
+    Attributes:
+        winner (str | None): ゲームの勝者
+            Nap のようにディクレアラーの成否で決まるゲームでは None
+        points (tuple[tuple[str, int], ...]): 各プレイヤーの獲得トリック数 (着席順)
+        declarer (str | None): ディクレアラー
+        declaration (str | None): 有効となった宣言
+        is_achieved (bool | None): ディクレアラーが宣言を達成できたかどうか
+        game_point (int | None): ディクレアラーが獲得した点数
+    """
+    winner: str | None
+    points: tuple[tuple[str, int], ...]
+    declarer: str | None = None
+    declaration: str | None = None
+    is_achieved: bool | None = None
+    game_point: int | None = None
+
+GameEvent = CardPlayed | TrickWon | BidMade | GameOver
+
+class EventStream:
+    """
+    ゲームのイベントを購読者に配信するクラス
+
+    Attributes:
+        subscribers (list[Callable[[GameEvent], None]]): 購読者
+
+    Note:
+        購読者がいない場合、偽となる
+            イベントを発生させる側は、購読者がいる時だけイベントを作成する
+            そのため、購読者のいないヘッドレスのゲームでは何も作成されない
+
+        フィールドの表示とは独立しているので、イベントごとにフィールドを文字列にする必要はない
+    """
+    def __init__(self):
+        self.subscribers = []
+
+    def __bool__(self) -> bool:
+        """
+        購読者がいるかどうか
+        """
+        return len(self.subscribers) != 0
+
+    def subscribe(self, callback: Callable[[GameEvent], None]) -> Callable[[GameEvent], None]:
+        """
+        イベントを購読する
+
+        Args:
+            callback (Callable[[GameEvent], None]): イベントを受け取る関数
+
+        Returns:
+            Callable[[GameEvent], None]: 登録した関数 (unsubscribe に利用する)
+        """
+        self.subscribers.append(callback)
+        return callback
+
+    def unsubscribe(self, callback: Callable[[GameEvent], None]) -> None:
+        """
+        イベントの購読をやめる
+
+        Args:
+            callback (Callable[[GameEvent], None]): 登録した関数
+        """
+        self.subscribers.remove(callback)
+
+    def emit(self, event: GameEvent) -> None:
+        """
+        イベントを全ての購読者に配信する
+
+        Args:
+            event (GameEvent): イベント
+
+        Note:
+            配信中に購読をやめる購読者 (GameRecorder など) がいても、全員に配信するように、
+            配信を始めた時点の購読者の一覧を利用する
+        """
+        for callback in list(self.subscribers):
+            callback(event)
+
+class EventBuffer:
+    """
+    イベントを溜めておき、ジェネレータとして取り出すための購読者
+
+    Attributes:
+        events (list[GameEvent]): まだ取り出していないイベント
+
+    Note:
+        stream.subscribe(buffer) のように、そのまま購読者として登録できる
+            ゲームを 1 ステップ進めるたびに、溜まったイベントを取り出して処理する
+    """
+    def __init__(self):
+        self.events = []
+
+    def __call__(self, event: GameEvent) -> None:
+        self.events.append(event)
+
+    def __iter__(self) -> Iterator[GameEvent]:
+        """
+        溜まったイベントを古い順に取り出す
+        """
+        events, self.events = self.events, []
+        yield from events
@@ -0,0 +1,123 @@
+import random
+from collections.abc import Sequence
+
+from .bitboard import (
+    SUIT_MASKS,
+)
+from .card import (
+    CARD_SUIT_INDEX_TABLE,
+    STRENGTH_TABLE,
+)
+
+def random_card_id(mask: int, rng: random.Random) -> int:
+    """
+    マスクに含まれるカードから、ランダムに 1 枚選ぶ
+
+    Args:
+        mask (int): カードのマスク (0 でないこと)
+        rng (random.Random): 乱数生成器
+
+    Returns:
+        int: 選んだカードの id
+
+    Note:
+        randrange より速いので、random() から何枚目かを決める (偏りは 2^-53 程度)
+    """
+    for _ in range(int(rng.random() * mask.bit_count())):
+        mask &= mask - 1
+    return (mask & -mask).bit_length() - 1
+
+def trick_winner(trick: Sequence[tuple[int, int]], trump: int, use_lead: bool) -> int:
+    """
+    1 トラック分の勝者を決める
+
+    Args:
+        trick (Sequence[tuple[int, int]]): (席の番号, カードの id) (出した順)
+        trump (int): 切り札のスートの番号 (なしは 0)
+        use_lead (bool): 台札を考慮するかどうか
+
+    Returns:
+        int: 勝者の席の番号
+    """
+    lead = CARD_SUIT_INDEX_TABLE[trick[0][1]] if use_lead else 0
+    strengths = STRENGTH_TABLE[trump][lead]
+    return max(trick, key = lambda play: strengths[play[1]])[0]
+
+def random_playout(hands: Sequence[int],
+                   trick: Sequence[tuple[int, int]],
+                   seat: int,
+                   trump: int,
+                   use_lead: bool,
+                   rng: random.Random,
+                   trump_from_lead: bool = False) -> list[int]:
+    """
+    全員がランダムに出せるカードを出して、ゲームを最後まで進める
+
+    Args:
+        hands (Sequence[int]): 席ごとの手札のマスク
+        trick (Sequence[tuple[int, int]]): 現在のトラックで出されたカード (席の番号, カードの id)
+        seat (int): 次にカードを出す席の番号
+        trump (int): 切り札のスートの番号 (なしは 0)
+        use_lead (bool): 台札のルール (スートの請求と台札の強さ) を利用するかどうか
+        rng (random.Random): 乱数生成器
+        trump_from_lead (bool): 次に出される台札のスートを切り札とするかどうか (Nap の最初のトラック)
+
+    Returns:
+        list[int]: 席ごとの獲得トリック数 (現在のトラックから数える)
+
+    Note:
+        Field や Player を作らずに、手札をマスクのまま進めるヘッドレスのエンジン
+            勝者は STRENGTH_TABLE から決める
+            トラックの勝者が次のトラックを始める
+        手札の枚数は、現在のトラックが終われば全員同じであること
+
+        Simulator や MonteCarloPlayer が大量に呼ぶので、関数の呼び出しを減らしている
+            カードの選択 (random_card_id) と勝者の決定 (trick_winner) は、ループの中で行う
+            勝者は、カードを出すたびに最も強いカードと比べて更新する
+    """
+    hands = list(hands)
+    seat_num = len(hands)
+    points = [0] * seat_num
+    random = rng.random
+
+    played = len(trick)
+    lead = CARD_SUIT_INDEX_TABLE[trick[0][1]] if trick and use_lead else 0
+    best_strength, best_seat = -1, seat
+    if trick:
+        strengths = STRENGTH_TABLE[trump][lead]
+        for trick_seat, card_id in trick:
+            if strengths[card_id] > best_strength:
+                best_strength, best_seat = strengths[card_id], trick_seat
+
+    while True:
+        while played < seat_num:
+            hand = hands[seat]
+            legal = hand & SUIT_MASKS[lead] or hand
+            for _ in range(int(random() * legal.bit_count())):
+                legal &= legal - 1
+            low = legal & -legal
+            hands[seat] = hand ^ low
+            card_id = low.bit_length() - 1
+
+            if not played:
+                suit = CARD_SUIT_INDEX_TABLE[card_id]
+                if trump_from_lead:
+                    trump = suit
+                    trump_from_lead = False
+                if use_lead:
+                    lead = suit
+                strengths = STRENGTH_TABLE[trump][lead]
+
+            if strengths[card_id] > best_strength:
+                best_strength, best_seat = strengths[card_id], seat
+            played += 1
+            seat = (seat + 1) % seat_num
+
+        points[best_seat] += 1
+        if not hands[best_seat]:
+            return points
+
+        seat = best_seat
+        played = 0
+        lead = 0
+        best_strength = -1
@@ -0,0 +1,52 @@
+import numpy as np
+
+from .card import (
+    CARD_ID_NUM,
+    CARD_SUIT_INDEX_TABLE,
+    STRENGTH_TABLE,
+)
+
+# [切り札][台札][カードの id] の強さ (card.STRENGTH_TABLE と同じ表)
+#   切り札、台札の 0 は「なし」を表す
+STRENGTH_ARRAY = np.array(STRENGTH_TABLE, dtype = np.int16)
+_CARD_SUITS = np.array(CARD_SUIT_INDEX_TABLE, dtype = np.intp)
+
+def trick_winners(card_ids,
+                  trump,
+                  lead = None,
+                  use_lead: bool = True) -> np.ndarray:
+    """
+    複数のトラックの勝者をまとめて決める
+
+    Args:
+        card_ids (array-like): (トラック数, プレイヤー数) の出されたカードの id (出した順)
+        trump (array-like | int): (トラック数,) の切り札のスート (なしは 0)
+        lead (array-like | int | None): (トラック数,) の台札のスート (なしは 0)
+            指定がなければ、最初に出されたカードのスート
+        use_lead (bool): 台札を利用するかどうか
+            False の場合、SimpleNapGame と同じく台札のルールはなし
+
+    Returns:
+        np.ndarray: (トラック数,) の勝者 (card_ids の列の番号)
+
+    Note:
+        SimpleNapGame, EasyNapGame の calculate_strongness と同じルールで判定する
+        カードは重複しないので、同じ強さのカードはない
+    """
+    card_ids = np.asarray(card_ids, dtype = np.intp)
+    if card_ids.ndim != 2:
+        raise ValueError(f"card_ids は (トラック数, プレイヤー数) の配列: {card_ids.shape}")
+    if card_ids.size and (card_ids.min() < 0 or card_ids.max() >= CARD_ID_NUM):
+        raise ValueError("カードの id が異常")
+
+    trick_num = card_ids.shape[0]
+    trump = np.broadcast_to(np.asarray(trump, dtype = np.intp), (trick_num,))
+    if not use_lead:
+        lead = np.zeros(trick_num, dtype = np.intp)
+    elif lead is None:
+        lead = _CARD_SUITS[card_ids[:, 0]]
+    else:
+        lead = np.broadcast_to(np.asarray(lead, dtype = np.intp), (trick_num,))
+
+    strength = STRENGTH_ARRAY[trump[:, None], lead[:, None], card_ids]
+    return strength.argmax(axis = 1)
@@ -23,6 +23,7 @@ from src.field import (
 from src.bid import (
     NapBid,
     NapDeclaration,
+    NAP_DECLARATION_RECORDS,
 )
 
 class TestNapDeclaration:
@@ -77,6 +78,32 @@ class TestNapDeclaration:
         assert declarable_list[4].name == "nap"
         assert declarable_list[5].name == "wellington"
 
+    @pytest.mark.parametrize(
+        "name, is_achieved, point",
+        [
+            ("two", True, 2),
+            ("two", False, -2),
+            ("nap", True, 10),
+            ("wellington", False, -12),
+            ("pass", True, 0),
+        ]
+    )
+    def test_get_point(self, name, is_achieved, point):
+        """
+        宣言の点数のテスト
+        """
+        assert NapDeclaration(name).get_point(is_achieved = is_achieved) == point
+
+    def test_table(self):
+        """
+        宣言の一覧の DataFrame のテスト
+        """
+        table = NapDeclaration.table
+        assert table is NapDeclaration.table
+        assert list(table["name"]) == [r.name for r in NAP_DECLARATION_RECORDS]
+        for record in NAP_DECLARATION_RECORDS:
+            assert NapDeclaration(record.name).d_value == record.d_value
+
 class TestNapBid:
     """
     NapBid class のテスト
@@ -0,0 +1,117 @@
+from pathlib import Path
+import random
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+FILE_DIR = Path(__file__).parent.absolute()
+PROJECT_DIR = FILE_DIR.parent.parent.absolute()
+sys.path.append(str(PROJECT_DIR))
+
+from src.utils import (
+    Suit,
+    Bitboard,
+    get_card_id,
+    permute_suits,
+)
+
+from src.bid import (
+    NapDeclaration,
+)
+
+from src.game import (
+    BidAdvisor,
+    NapVSShizuka,
+    Simulator,
+)
+
+class TestBidAdvisor:
+    """
+    BidAdvisor class のテスト
+    """
+    def test_strong_hand(self):
+        """
+        強い手札の評価のテスト
+
+        Note:
+            spade の A, K, Q, J, 10 は、台札を spade にすれば全てのトラックをとれる
+        """
+        hand = Bitboard.from_ids([get_card_id(n, Suit.spade) for n in [1, 13, 12, 11, 10]]).mask
+        advisor = BidAdvisor(sample_num = 4)
+        estimates = advisor.evaluate(hand)
+
+        assert estimates["nap"].success_rate == 1.0
+        assert estimates["wellington"].expected_point == 20
+        assert estimates["misere"].success_rate == 0.0
+        assert str(advisor.choose(hand, NapDeclaration("no_declare").get_declarable_list())) == "wellington"
+
+    def test_weak_hand(self):
+        """
+        弱い手札の評価のテスト
+
+        Note:
+            各スートの 2, 3 は、ミゼール以外では期待値が 0 以下になり、ミゼールを宣言する
+        """
+        hand = Bitboard.from_ids([get_card_id(2, Suit.club), get_card_id(3, Suit.club),
+                                  get_card_id(2, Suit.diamond), get_card_id(2, Suit.heart),
+                                  get_card_id(2, Suit.spade)]).mask
+        advisor = BidAdvisor(sample_num = 8)
+        estimates = advisor.evaluate(hand)
+
+        assert estimates["two"].expected_point <= 0
+        assert estimates["misere"].success_rate > 0.5
+        assert str(advisor.choose(hand, NapDeclaration("two").get_declarable_list())) == "misere"
+        assert str(advisor.choose(hand, NapDeclaration("misere").get_declarable_list())) == "pass"
+
+    def test_cache(self):
+        """
+        同じ手札の評価はキャッシュされ、手札の渡し方によらず同じになることのテスト
+        """
+        rng = random.Random(0)
+        card_ids = rng.sample(range(52), 5)
+        advisor = BidAdvisor(sample_num = 4)
+        estimates = advisor.evaluate(Bitboard.from_ids(card_ids).mask)
+
+        assert advisor.evaluate(Bitboard.from_ids(card_ids).cards()) is estimates
+        assert len(advisor.cache) == 1
+        assert BidAdvisor(sample_num = 4).evaluate(Bitboard.from_ids(card_ids).mask) == estimates
+
+    def test_suit_isomorphic(self):
+        """
+        スートを入れ替えた手札は、評価を共有することのテスト
+        """
+        hand = Bitboard.from_ids([get_card_id(1, Suit.spade), get_card_id(5, Suit.spade),
+                                  get_card_id(9, Suit.heart), get_card_id(3, Suit.club),
+                                  get_card_id(12, Suit.diamond)]).mask
+        advisor = BidAdvisor(sample_num = 4)
+        estimates = advisor.evaluate(hand)
+
+        assert advisor.evaluate(permute_suits(hand, [2, 4, 1, 3])) is estimates
+        assert len(advisor.cache) == 1
+        assert advisor.cache.hit_num == 1
+
+    def test_nap_vs_shizuka(self):
+        """
+        NapVSShizuka では、CPU がアドバイザーで宣言することのテスト
+        """
+        results = Simulator(NapVSShizuka, seed = 0).run(5)
+        assert len(results) == 5
+        assert isinstance(NapVSShizuka.bid_advisor, BidAdvisor)
+        assert NapVSShizuka.bid_advisor.cache
+        # 表は最初のゲームの準備で探す
+        assert NapVSShizuka._is_equity_table_loaded
+
+        advisor = BidAdvisor(sample_num = 4)
+        game = NapVSShizuka(is_headless = True, seed = 0, bid_advisor = advisor)
+        assert game.bid_manager.advisor is advisor
+
+    def test_set_equity_table(self):
+        """
+        プレイヤー数、手札の枚数が違う表は設定できないことのテスト
+        """
+        advisor = BidAdvisor(sample_num = 4)
+        with pytest.raises(ValueError):
+            advisor.set_equity_table(SimpleNamespace(player_num = 2, hand_num = 5))
+        advisor.set_equity_table(None)
+        assert advisor.equity_table is None
@@ -0,0 +1,120 @@
+from pathlib import Path
+from itertools import combinations
+from math import comb
+import pytest
+import sys
+
+FILE_DIR = Path(__file__).parent.absolute()
+PROJECT_DIR = FILE_DIR.parent.parent.absolute()
+sys.path.append(str(PROJECT_DIR))
+
+from src.utils import (
+    Suit,
+    Bitboard,
+    get_card_id,
+    permute_suits,
+    canonical_hand,
+)
+
+from src.game import (
+    BidAdvisor,
+    EquityTable,
+    build_equity_table,
+)
+from src.game.equity import (
+    FROM_LEAD_COLUMN,
+    colex_rank,
+    sample_trick_counts,
+)
+
+HANDS = [
+    Bitboard.from_ids([get_card_id(n, Suit.spade) for n in [1, 13, 12, 11, 10]]).mask,
+    Bitboard.from_ids([get_card_id(2, Suit.club), get_card_id(7, Suit.diamond), get_card_id(1, Suit.heart),
+                       get_card_id(9, Suit.heart), get_card_id(4, Suit.spade)]).mask,
+]
+
+@pytest.fixture(scope = "module")
+def table_path(tmp_path_factory):
+    """
+    HANDS のみの小さな表
+    """
+    path = tmp_path_factory.mktemp("equity") / "equity_p3_h5.bin"
+    return build_equity_table(path, player_num = 3, hand_num = 5, sample_num = 3, seed = 0, hands = HANDS)
+
+class TestColexRank:
+    """
+    colex_rank のテスト
+    """
+    def test_bijection(self):
+        """
+        同じ枚数の手札に、0 から順に重複なく番号がつくことのテスト
+        """
+        ranks = sorted(colex_rank(Bitboard.from_ids(card_ids).mask) for card_ids in combinations(range(52), 2))
+        assert ranks == list(range(comb(52, 2)))
+
+class TestEquityTable:
+    """
+    EquityTable class のテスト
+    """
+    def test_same_as_sampling(self, table_path):
+        """
+        表の回数が、同じシードで配り直して解いた回数と同じになることのテスト
+        """
+        with EquityTable(table_path) as table:
+            assert (table.player_num, table.hand_num, table.sample_num, table.row_num) == (3, 5, 3, 2)
+            for hand in HANDS:
+                canonical = canonical_hand(hand)
+                trick_cnts, misere_cnt = sample_trick_counts(canonical, 3, 5, 3, 0)
+                assert hand in table
+                assert table.trick_counts(canonical) == tuple(trick_cnts[FROM_LEAD_COLUMN])
+                for suit in Suit:
+                    assert table.trick_counts(canonical, suit) == tuple(trick_cnts[int(suit)])
+                assert table.misere_count(canonical) == misere_cnt
+
+    def test_suit_isomorphic(self, table_path):
+        """
+        スートを入れ替えた手札は、切り札も入れ替えて同じ回数になることのテスト
+        """
+        permutation = (3, 1, 4, 2)
+        with EquityTable(table_path) as table:
+            for hand in HANDS:
+                permuted = permute_suits(hand, permutation)
+                assert table.trick_counts(permuted) == table.trick_counts(hand)
+                for new_suit, suit in enumerate(permutation, 1):
+                    assert table.trick_counts(permuted, Suit(new_suit)) == table.trick_counts(hand, Suit(suit))
+
+    def test_strong_hand(self, table_path):
+        """
+        spade の A, K, Q, J, 10 は、切り札が spade か台札のスートであれば全てのトラックをとる
+        """
+        with EquityTable(table_path) as table:
+            assert table.expected_tricks(HANDS[0]) == 5
+            assert table.expected_tricks(HANDS[0], Suit.spade) == 5
+
+    def test_missing_hand(self, table_path):
+        """
+        表にない手札は KeyError となることのテスト
+        """
+        hand = Bitboard.from_ids([0, 1, 2, 3, 4]).mask
+        with EquityTable(table_path) as table:
+            assert hand not in table
+            with pytest.raises(KeyError):
+                table.trick_counts(hand)
+
+    def test_find(self, table_path, tmp_path):
+        """
+        保存先から表を探すことのテスト
+        """
+        table = EquityTable.find(3, 5, directory = table_path.parent)
+        assert table is not None
+        table.close()
+        assert EquityTable.find(3, 5, directory = tmp_path) is None
+
+    def test_advisor(self, table_path):
+        """
+        表を利用した BidAdvisor の評価が、表を利用しない評価と同じになることのテスト
+        """
+        with EquityTable(table_path) as table:
+            for hand in HANDS:
+                expected = BidAdvisor(sample_num = 3, seed = 0).evaluate(hand)
+                assert BidAdvisor(sample_num = 3, seed = 1, equity_table = table).evaluate(hand) == expected
@@ -0,0 +1,131 @@
+from pathlib import Path
+import pytest
+import sys
+
+FILE_DIR = Path(__file__).parent.absolute()
+PROJECT_DIR = FILE_DIR.parent.parent.absolute()
+sys.path.append(str(PROJECT_DIR))
+
+from src.utils import (
+    CardPlayed,
+    TrickWon,
+    BidMade,
+    GameOver,
+    EventStream,
+    EventBuffer,
+)
+
+from src.game import (
+    EasyNapGame,
+    NapVSShizuka,
+    Simulator,
+)
+
+class TestEventStream:
+    """
+    EventStream class のテスト
+    """
+    def test_subscribe(self):
+        """
+        購読と配信のテスト
+        """
+        stream = EventStream()
+        assert not stream
+
+        buffer = stream.subscribe(EventBuffer())
+        assert stream
+
+        event = BidMade("You", "two")
+        stream.emit(event)
+        assert list(buffer) == [event]
+        assert list(buffer) == []
+
+        stream.unsubscribe(buffer)
+        assert not stream
+        stream.emit(event)
+        assert list(buffer) == []
+
+    def test_unsubscribe_during_emit(self):
+        """
+        配信中に購読をやめても、他の購読者に配信されることのテスト
+        """
+        stream = EventStream()
+        received = []
+
+        def once(event):
+            received.append("once")
+            stream.unsubscribe(once)
+
+        def remove_buffer(event):
+            received.append("remove_buffer")
+            stream.unsubscribe(buffer_01)
+            stream.unsubscribe(remove_buffer)
+
+        stream.subscribe(once)
+        buffer_01 = stream.subscribe(EventBuffer())
+        stream.subscribe(remove_buffer)
+        buffer_02 = stream.subscribe(EventBuffer())
+
+        event = BidMade("You", "two")
+        stream.emit(event)
+        assert received == ["once", "remove_buffer"]
+        assert list(buffer_01) == [event]
+        assert list(buffer_02) == [event]
+
+        stream.emit(event)
+        assert received == ["once", "remove_buffer"]
+        assert list(buffer_01) == []
+        assert list(buffer_02) == [event]
+
+class TestGameEvent:
+    """
+    ゲームで発生するイベントのテスト
+    """
+    def test_easy_nap_game(self):
+        """
+        トリックテイキングのゲームのイベントのテスト
+        """
+        game = EasyNapGame(is_headless = True, seed = 0)
+        for player in game.field.players:
+            player.cpu = True
+        buffer = game.field.events.subscribe(EventBuffer())
+
+        game.play()
+        events = list(buffer)
+
+        card_played = [e for e in events if isinstance(e, CardPlayed)]
+        trick_won = [e for e in events if isinstance(e, TrickWon)]
+        assert len(card_played) == game.hand_num * len(game.field.players)
+        assert [e.track_cnt for e in trick_won] == list(range(game.hand_num))
+        assert [e.play_cnt for e in card_played[:2]] == [0, 1]
+        assert trick_won[0].cards == tuple((e.player, e.card) for e in card_played[:2])
+
+        assert events[-1] == GameOver(game.winner.name, tuple((p.name, p.point) for p in game.field.players))
+
+    def test_nap_game(self):
+        """
+        ビッドを行うゲームのイベントのテスト
+        """
+        simulator = Simulator(NapVSShizuka, seed = 0)
+        for _ in range(10):
+            game = simulator.make_game(seed = simulator.rng.getrandbits(63))
+            buffer = game.field.events.subscribe(EventBuffer())
+
+            for _ in game.bid_manager:
+                pass
+            bids = list(buffer)
+            assert all(isinstance(e, BidMade) for e in bids)
+            assert {e.player for e in bids} == {p.name for p in game.field.players}
+            if game.bid_manager.invalid:
+                assert all(e.declaration == "pass" for e in bids)
+                continue
+
+            game.close_bid()
+            game.play()
+            events = list(buffer)
+
+            game_over = events[-1]
+            assert isinstance(game_over, GameOver)
+            assert game_over.declarer == game.declarer.name
+            assert game_over.is_achieved == game.is_achieved
+            assert sum(isinstance(e, TrickWon) for e in events) == game.hand_num
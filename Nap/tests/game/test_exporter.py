@@ -0,0 +1,130 @@
+from pathlib import Path
+import numpy as np
+import pytest
+import sys
+
+FILE_DIR = Path(__file__).parent.absolute()
+PROJECT_DIR = FILE_DIR.parent.parent.absolute()
+sys.path.append(str(PROJECT_DIR))
+
+from src.game import (
+    SimpleNapGame,
+    EasyNapGame,
+    NapGame,
+    GameLogWriter,
+    GameLogReader,
+    ColumnarExporter,
+    Simulator,
+)
+from src.game.exporter import (
+    COLUMNS,
+    iter_npz_chunks,
+    load_npz_columns,
+)
+
+class TestColumnarExporter:
+    """
+    ColumnarExporter class のテスト
+    """
+    @pytest.mark.parametrize("game_class", [EasyNapGame, NapGame])
+    def test_export(self, game_class, tmp_path):
+        """
+        Simulator の結果をチャンクに分けて書き出すテスト
+        """
+        path = tmp_path / "columns"
+        with ColumnarExporter(path, chunk_size = 16) as exporter:
+            results = Simulator(game_class, seed = 0, log_writer = exporter).run(50)
+
+        chunks = list(iter_npz_chunks(path))
+        assert [len(chunk["seed"]) for chunk in chunks] == [16, 16, 16, 2]
+
+        columns = load_npz_columns(path)
+        assert set(columns) == set(COLUMNS)
+        player_num = len(results[0].players)
+        assert columns["hands"].shape == (50, player_num, game_class.hand_num)
+        assert columns["tricks"].shape == (50, player_num)
+
+        assert columns["seed"].tolist() == [result.seed for result in results]
+        assert columns["invalid"].tolist() == [result.invalid for result in results]
+        valid = ~columns["invalid"]
+        assert (columns["tricks"][valid].sum(axis = 1) == game_class.hand_num).all()
+        for row, result in enumerate(results):
+            if not result.invalid:
+                assert tuple(columns["tricks"][row]) == result.points
+                assert columns["trump"][row] == int(result.trump)
+
+        # 配られたカードは重複しない
+        hands = columns["hands"].reshape(50, -1)
+        assert all(len(set(hand.tolist())) == hand.size for hand in hands)
+
+    def test_export_log(self, tmp_path):
+        """
+        ゲームのログから書き出すテスト
+        """
+        log_path = tmp_path / "game.naplog"
+        with GameLogWriter(log_path) as writer:
+            Simulator(NapGame, seed = 1, log_writer = writer).run(20)
+
+        path = tmp_path / "columns"
+        with GameLogReader(log_path) as reader, ColumnarExporter(path) as exporter:
+            exporter.write_all(reader)
+            records = list(reader)
+
+        columns = load_npz_columns(path)
+        assert exporter.game_num == 20
+        for row, record in enumerate(records):
+            assert columns["hands"][row].tolist() == [list(hand) for hand in record.hands]
+            if record.declarer is None:
+                assert columns["declarer"][row] == -1
+            else:
+                assert columns["declarer"][row] == record.declarer
+                assert columns["is_achieved"][row] == int(record.is_achieved)
+                assert columns["game_point"][row] == record.game_point
+
+    def test_export_twice(self, tmp_path):
+        """
+        同じディレクトリに書き出すと、既存のチャンクの後に追加することのテスト
+        """
+        path = tmp_path / "columns"
+        with ColumnarExporter(path, chunk_size = 4) as exporter:
+            results_01 = Simulator(EasyNapGame, seed = 0, log_writer = exporter).run(6)
+        with ColumnarExporter(path, chunk_size = 4) as exporter:
+            results_02 = Simulator(EasyNapGame, seed = 1, log_writer = exporter).run(5)
+
+        assert sorted(part.name for part in path.glob("part-*.npz")) == [f"part-{i:05d}.npz" for i in range(4)]
+        assert [len(chunk["seed"]) for chunk in iter_npz_chunks(path)] == [4, 2, 4, 1]
+        columns = load_npz_columns(path)
+        assert columns["seed"].tolist() == [result.seed for result in results_01 + results_02]
+
+    def test_mixed_games(self, tmp_path):
+        """
+        プレイヤー数や手札の枚数が違うゲームは書き出せないことのテスト
+        """
+        with ColumnarExporter(tmp_path / "columns") as exporter:
+            Simulator(EasyNapGame, log_writer = exporter).play()
+            with pytest.raises(ValueError):
+                Simulator(SimpleNapGame, log_writer = exporter).play()
+
+    def test_export_parquet(self, tmp_path):
+        """
+        parquet として書き出すテスト
+        """
+        pq = pytest.importorskip("pyarrow.parquet")
+
+        path = tmp_path / "games.parquet"
+        with ColumnarExporter(path, chunk_size = 16, file_format = "parquet") as exporter:
+            results = Simulator(NapGame, seed = 0, log_writer = exporter).run(50)
+
+        parquet_file = pq.ParquetFile(path)
+        assert parquet_file.metadata.num_row_groups == 4
+        table = parquet_file.read()
+        assert table.column("seed").to_pylist() == [result.seed for result in results]
+        assert [tuple(tricks) for tricks in table.column("tricks").to_pylist()][0] == results[0].points
+        assert len(table.column("hands").to_pylist()[0]) == len(results[0].players)
+
+    def test_file_format(self, tmp_path):
+        """
+        対応していない形式のテスト
+        """
+        with pytest.raises(ValueError):
+            ColumnarExporter(tmp_path / "columns.csv", file_format = "csv")
@@ -0,0 +1,184 @@
+import gc
+from pathlib import Path
+import pytest
+import sys
+import warnings
+
+FILE_DIR = Path(__file__).parent.absolute()
+PROJECT_DIR = FILE_DIR.parent.parent.absolute()
+sys.path.append(str(PROJECT_DIR))
+
+from src.utils import (
+    Suit,
+    EventBuffer,
+)
+
+from src.game import (
+    EasyNapGame,
+    NapVSShizuka,
+    SimpleNapVSTakeshi,
+    GameRecord,
+    GameLogWriter,
+    GameLogReader,
+    Simulator,
+)
+from src.game.game_log import (
+    MAX_SEED,
+    encode_record,
+    decode_record,
+)
+
+class TestGameRecord:
+    """
+    GameRecord のバイト列への変換のテスト
+    """
+    def test_encode_decode(self):
+        """
+        バイト列にして戻すと、同じログになることのテスト
+        """
+        record = GameRecord(
+            game_name = "NapVSShizuka",
+            seed = 2 ** 63 - 1,
+            hands = ((0, 1, 2), (51, 50, 49), (13, 26, 39)),
+            trump = Suit.heart,
+            bids = ((1, "two"), (2, "pass"), (0, "pass")),
+            declarer = 1,
+            declaration = "two",
+            plays = ((1, 51), (2, 13), (0, 0)),
+            trick_winners = (1,),
+            is_achieved = False,
+            game_point = -2,
+        )
+        data = encode_record(record)
+
+        assert len(data) == 20 + 9 + 3 + 3 + 1
+        assert decode_record(data) == record
+        assert record.points == (0, 1, 0)
+
+    def test_invalid_game(self):
+        """
+        無効になったゲームのテスト
+        """
+        record = GameRecord("NapGame", None, ((0,), (1,)), None,
+                            ((0, "pass"), (1, "pass")), None, None, (), (), invalid = True)
+        assert decode_record(encode_record(record)) == record
+
+class TestGameLog:
+    """
+    GameLogWriter, GameLogReader class のテスト
+    """
+    @pytest.mark.parametrize("game_class", [EasyNapGame, SimpleNapVSTakeshi, NapVSShizuka])
+    def test_write_read(self, game_class, tmp_path):
+        """
+        Simulator の結果とログが一致することのテスト
+        """
+        path = tmp_path / "game.naplog"
+        with GameLogWriter(path) as writer:
+            results = Simulator(game_class, seed = 0, log_writer = writer).run(50)
+            assert writer.game_num == 50
+
+        with GameLogReader(path) as reader:
+            assert len(reader) == 50
+            for result, record in zip(results, reader):
+                assert record.game_name == game_class.__name__
+                assert record.seed == result.seed
+                assert record.invalid == result.invalid
+                if record.invalid:
+                    continue
+
+                assert record.points == result.points
+                assert record.trump == result.trump
+                assert len(record.plays) == game_class.hand_num * len(result.players)
+                if record.declarer is not None:
+                    assert result.players[record.declarer] == result.declarer
+                    assert record.is_achieved == result.is_achieved
+                    assert record.game_point == result.game_point
+
+            # シードから同じゲームを再現できる
+            record = reader[10]
+            replay_path = tmp_path / "replay.naplog"
+            with GameLogWriter(replay_path) as writer:
+                Simulator(game_class, log_writer = writer).play(seed = record.seed)
+            with GameLogReader(replay_path) as replay_reader:
+                assert replay_reader[0] == record
+
+    def test_events(self, tmp_path):
+        """
+        ログから再現したイベントが、ゲームで発生したイベントと一致することのテスト
+        """
+        path = tmp_path / "game.naplog"
+        simulator = Simulator(NapVSShizuka, seed = 1)
+        with GameLogWriter(path) as writer:
+            for _ in range(10):
+                game = simulator.make_game(seed = simulator.rng.getrandbits(63))
+                buffer = game.field.events.subscribe(EventBuffer())
+                recorder = writer.attach(game)
+                for _ in game.bid_manager:
+                    pass
+                if game.bid_manager.invalid:
+                    recorder.finish()
+                else:
+                    game.close_bid()
+                    game.play()
+                    assert recorder.is_written
+
+                names = [player.name for player in game.field.players]
+                events = list(buffer)
+                writer.flush()
+                with GameLogReader(path) as reader:
+                    assert list(reader[-1].events(names)) == events
+
+    def test_append(self, tmp_path):
+        """
+        既存のログへの追記と、書き込みの途中で終了した記録のテスト
+        """
+        path = tmp_path / "game.naplog"
+        for _ in range(2):
+            with GameLogWriter(path) as writer:
+                Simulator(EasyNapGame, log_writer = writer).run(3)
+
+        with open(path, "ab") as f:
+            f.write(b"\x40\x00\x01")
+
+        with GameLogReader(path) as reader:
+            assert len(reader) == 6
+
+    def test_not_log(self, tmp_path):
+        """
+        ログではないファイルのテスト
+        """
+        path = tmp_path / "game.txt"
+        path.write_bytes(b"not a game log")
+        with pytest.raises(ValueError):
+            GameLogReader(path)
+
+        # 空のファイルは、ファイルを閉じてからエラーとする
+        path = tmp_path / "empty.naplog"
+        path.write_bytes(b"")
+        with warnings.catch_warnings(record = True) as caught:
+            warnings.simplefilter("always")
+            with pytest.raises(ValueError):
+                GameLogReader(path)
+            gc.collect()
+        assert not [warning for warning in caught if issubclass(warning.category, ResourceWarning)]
+
+    def test_invalid_seed(self, tmp_path):
+        """
+        記録できないシードは、書き込む前にエラーとなることのテスト
+        """
+        path = tmp_path / "game.naplog"
+        with GameLogWriter(path) as writer:
+            for seed in [-1, 1 << 64]:
+                game = EasyNapGame(is_headless = True, seed = seed)
+                with pytest.raises(ValueError):
+                    writer.attach(game)
+            # 記録できる最大のシード
+            Simulator(EasyNapGame, log_writer = writer).play(seed = MAX_SEED)
+
+        with GameLogReader(path) as reader:
+            assert len(reader) == 1
+            assert reader[0].seed == MAX_SEED
+
+        record = GameRecord("EasyNapGame", -1, ((0,), (1,)), None, (), None, None, (), ())
+        with pytest.raises(ValueError):
+            encode_record(record)
@@ -0,0 +1,211 @@
+from pathlib import Path
+import pytest
+import sys
+
+FILE_DIR = Path(__file__).parent.absolute()
+PROJECT_DIR = FILE_DIR.parent.parent.absolute()
+sys.path.append(str(PROJECT_DIR))
+
+from src.game import (
+    GameLogWriter,
+    SimpleNapGame,
+    EasyNapGame,
+    NapGame,
+    SimpleNapVSTakeshi,
+    EasyNapVSTakeshi,
+    EasyNapVSShizuka,
+    NapVSShizuka,
+    GameResult,
+    Simulator,
+)
+from src.player import Player
+from src.utils import (
+    Suit,
+    SimpleDeck,
+    Dealer,
+    get_card_id,
+)
+
+class StubbornPlayer(Player):
+    """
+    常に最も小さい id のカードを出すプレイヤー
+    """
+    def play_card(self, is_random: bool = False, lead_suit: Suit = None, field = None):
+        legal_ids = self.hand_board.legal_moves(lead_suit).card_ids()
+        return self.pop_card_id(legal_ids[0])
+
+class StubbornGame(EasyNapGame):
+    """
+    ランダムにカードを出さないプレイヤーがいるゲーム
+    """
+    def _set_player(self, how_to_choose: str = "input") -> list[Player]:
+        return [StubbornPlayer("Boss", cpu = True), Player("You", cpu = False)]
+
+class TestHeadlessGame:
+    """
+    ヘッドレスのゲームのテスト
+    """
+    def test_no_output(self, capfd):
+        """
+        ヘッドレスのゲームは何も表示しないことのテスト
+
+        Args:
+            capfd (_pytest.capture.CaptureFixture): 標準出力を確認するためのツール
+        """
+        game = EasyNapGame(is_headless = True)
+        for player in game.field.players:
+            player.cpu = True
+        game.play()
+
+        captured = capfd.readouterr()
+        assert captured.out == ""
+        assert game.field.message_log == []
+
+class TestSimulator:
+    """
+    Simulator class のテスト
+    """
+    @pytest.mark.parametrize(
+        "game_class",
+        [
+            SimpleNapGame,
+            EasyNapGame,
+            SimpleNapVSTakeshi,
+            EasyNapVSTakeshi,
+            EasyNapVSShizuka,
+        ]
+    )
+    def test_play(self, game_class, capfd):
+        """
+        トリックテイキングのゲームの実行のテスト
+        """
+        simulator = Simulator(game_class)
+        result = simulator.play()
+
+        assert isinstance(result, GameResult)
+        assert result.game_name == game_class.__name__
+        assert sum(result.points) == game_class.hand_num
+        assert result.winner in result.players
+        assert not result.invalid
+
+        captured = capfd.readouterr()
+        assert captured.out == ""
+
+    @pytest.mark.parametrize("game_class", [NapGame, NapVSShizuka])
+    def test_play_with_bid(self, game_class):
+        """
+        ビッドを行うゲームの実行のテスト
+        """
+        simulator = Simulator(game_class)
+        for result in simulator.run(20):
+            if result.invalid:
+                assert result.declarer is None
+                continue
+
+            assert result.declarer in result.players
+            assert sum(result.points) == game_class.hand_num
+            assert isinstance(result.is_achieved, bool)
+            assert isinstance(result.game_point, int)
+
+    @pytest.mark.parametrize("game_class", [EasyNapGame, NapVSShizuka])
+    def test_replay(self, game_class):
+        """
+        シードからゲームを再現できることのテスト
+        """
+        simulator = Simulator(game_class, seed = 0)
+        results = simulator.run(10)
+
+        assert len({result.seed for result in results}) == 10
+        for result in results:
+            assert simulator.replay(result) == result
+
+        assert Simulator(game_class, seed = 0).run(10) == results
+
+    def test_run_deals(self):
+        """
+        あらかじめ作成した配り方でのゲームの実行のテスト
+        """
+        deals = Dealer(SimpleDeck, seed = 0).deal_batch(10)
+        simulator = Simulator(EasyNapVSShizuka)
+        results = simulator.run_deals(deals)
+
+        assert len(results) == 10
+        for deal, result in zip(deals, results):
+            assert result.deal_order == tuple(deal.tolist())
+            assert simulator.replay(result) == result
+
+    def test_run(self):
+        """
+        複数のゲームの実行のテスト
+        """
+        results = Simulator(SimpleNapGame).run(10)
+        assert len(results) == 10
+
+class TestLeanSimulator:
+    """
+    Simulator の軽量な経路のテスト
+    """
+    def test_lean_rule(self, tmp_path: Path):
+        """
+        軽量な経路を利用するゲームのテスト
+        """
+        assert Simulator(SimpleNapGame).lean_rule is SimpleNapGame
+        assert Simulator(EasyNapGame).lean_rule is EasyNapGame
+        simulator = Simulator(EasyNapVSShizuka)
+        assert simulator.lean_rule is EasyNapGame
+        assert simulator.player_names == ("しずか", "たけし", "You")
+
+        # ルールが異なる、ビッドがある、ランダムに出さないプレイヤーがいる場合は利用しない
+        for game_class in [SimpleNapVSTakeshi, EasyNapVSTakeshi, NapGame, NapVSShizuka, StubbornGame]:
+            assert Simulator(game_class).lean_rule is None, game_class
+
+        assert Simulator(EasyNapGame, lean = False).lean_rule is None
+        with GameLogWriter(tmp_path / "games.log") as writer:
+            assert Simulator(EasyNapGame, log_writer = writer).lean_rule is None
+
+    def test_deal(self):
+        """
+        ゲームのクラスと同じように配ることのテスト
+
+        Note:
+            最初のプレイヤーに、スペード (切り札) の A, K, Q を配れば、全てのトラックをとる
+        """
+        top_ids = [get_card_id(num, Suit.spade) for num in [12, 13, 1]]
+        deal_order = [card_id for card_id in range(52) if card_id not in top_ids] + top_ids
+
+        for lean in [True, False]:
+            simulator = Simulator(SimpleNapGame, seed = 0, lean = lean)
+            for result in simulator.run_deals([deal_order] * 5):
+                assert result.points == (3, 0)
+                assert result.winner == "Boss"
+                assert result.trump == Suit.spade
+
+            with pytest.raises(ValueError):
+                simulator.play(deal_order = deal_order[:-1])
+            with pytest.raises(ValueError):
+                simulator.play(deal_order = deal_order[:-1] + [52])
+
+    def test_distribution(self):
+        """
+        ゲームのクラスで実行した場合と、結果の分布が同じことのテスト
+        """
+        game_num = 2000
+        lean_results = Simulator(EasyNapVSShizuka, seed = 0).run(game_num)
+        engine_results = Simulator(EasyNapVSShizuka, seed = 0, lean = False).run(game_num)
+
+        for results in [lean_results, engine_results]:
+            for result in results:
+                assert sum(result.points) == EasyNapVSShizuka.hand_num
+                assert result.points[result.players.index(result.winner)] == max(result.points)
+
+        for seat, name in enumerate(lean_results[0].players):
+            lean_win_rate = sum(result.winner == name for result in lean_results) / game_num
+            engine_win_rate = sum(result.winner == name for result in engine_results) / game_num
+            assert abs(lean_win_rate - engine_win_rate) < 0.05
+
+            lean_mean = sum(result.points[seat] for result in lean_results) / game_num
+            engine_mean = sum(result.points[seat] for result in engine_results) / game_num
+            assert abs(lean_mean - engine_mean) < 0.1
+
+        lean_trumps = {result.trump for result in lean_results}
+        assert lean_trumps == {Suit.spade, Suit.heart, Suit.diamond, Suit.club}
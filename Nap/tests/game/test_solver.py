@@ -0,0 +1,203 @@
+from pathlib import Path
+import random
+import pytest
+import sys
+
+FILE_DIR = Path(__file__).parent.absolute()
+PROJECT_DIR = FILE_DIR.parent.parent.absolute()
+sys.path.append(str(PROJECT_DIR))
+
+from src.utils import (
+    Suit,
+    Bitboard,
+    SUIT_MASKS,
+    CARD_SUIT_INDEX_TABLE,
+    STRENGTH_TABLE,
+    get_card_id,
+)
+
+from src.game import (
+    DoubleDummySolver,
+)
+
+def minimax(hands, trick, seat, trump, team, use_lead, trump_from_lead, score = None):
+    """
+    全ての手を調べる、確認用の探索
+
+    Note:
+        エンジンのルールをそのまま書いたもの
+        score の席の獲得トリック数を、team の席が最大化する (指定がなければ team の席)
+    """
+    score = team if score is None else score
+    seat_num = len(hands)
+    if len(trick) == seat_num:
+        lead = CARD_SUIT_INDEX_TABLE[trick[0][1]] if use_lead else 0
+        strengths = STRENGTH_TABLE[trump][lead]
+        winner = max(trick, key = lambda play: strengths[play[1]])[0]
+        won = int(winner in score)
+        if not hands[winner]:
+            return won
+        return won + minimax(hands, [], winner, trump, team, use_lead, False, score)
+
+    lead = CARD_SUIT_INDEX_TABLE[trick[0][1]] if trick and use_lead else 0
+    hand = hands[seat]
+    values = []
+    for card_id in Bitboard(hand & SUIT_MASKS[lead] or hand):
+        next_hands = list(hands)
+        next_hands[seat] = hand ^ (1 << card_id)
+        next_trump = CARD_SUIT_INDEX_TABLE[card_id] if trump_from_lead and not trick else trump
+        # 切り札は最初の台札で決まるので、以降は台札から決めない
+        values.append(minimax(next_hands, trick + [(seat, card_id)], (seat + 1) % seat_num,
+                              next_trump, team, use_lead, False, score))
+
+    return max(values) if seat in team else min(values)
+
+def random_hands(rng, seat_num, hand_num, card_num = 52):
+    """
+    ランダムに手札を配る
+    """
+    card_ids = rng.sample(range(card_num), seat_num * hand_num)
+    return [Bitboard.from_ids(card_ids[i * hand_num:(i + 1) * hand_num]).mask for i in range(seat_num)]
+
+def random_trick(rng, hands, leader, trick_num, use_lead = True):
+    """
+    トラックの途中まで、ランダムに (ルールに従って) カードを出す
+
+    Returns:
+        tuple[list[int], list[tuple[int, int]], int]: 手札, 出されたカード, 次にカードを出す席
+    """
+    hands = list(hands)
+    trick = []
+    seat = leader
+    for _ in range(trick_num):
+        lead = CARD_SUIT_INDEX_TABLE[trick[0][1]] if trick and use_lead else 0
+        card_id = rng.choice(list(Bitboard(hands[seat] & SUIT_MASKS[lead] or hands[seat])))
+        hands[seat] ^= 1 << card_id
+        trick.append((seat, card_id))
+        seat = (seat + 1) % len(hands)
+    return hands, trick, seat
+
+class TestDoubleDummySolver:
+    """
+    DoubleDummySolver class のテスト
+    """
+    @pytest.mark.parametrize("seat_num, hand_num, card_num, use_lead, trump_from_lead", [
+        (2, 5, 52, True, False),
+        (3, 4, 52, True, True),
+        (3, 3, 54, True, False),
+        (2, 3, 52, False, False),
+    ])
+    def test_same_as_minimax(self, seat_num, hand_num, card_num, use_lead, trump_from_lead):
+        """
+        全ての手を調べた結果と同じになることのテスト
+        """
+        rng = random.Random(seat_num * 10 + hand_num)
+        solver = DoubleDummySolver(use_lead = use_lead)
+        for _ in range(30):
+            hands = random_hands(rng, seat_num, hand_num, card_num)
+            leader = rng.randrange(seat_num)
+            trump = 0 if trump_from_lead else rng.randrange(len(Suit) + 1)
+            team = (leader,) if seat_num == 2 else (0,)
+
+            expected = minimax(hands, [], leader, -1 if trump_from_lead else trump, team, use_lead, trump_from_lead)
+            assert solver.solve(hands, leader, trump, team, trump_from_lead) == expected
+
+    def test_misere(self):
+        """
+        ミゼール (チーム以外の獲得トリック数を最大化する) の結果が、全ての手を調べた結果と同じになることのテスト
+        """
+        rng = random.Random(1)
+        solver = DoubleDummySolver()
+        for _ in range(30):
+            hands = random_hands(rng, 3, 4)
+            expected = minimax(hands, [], 0, -1, (0,), True, True, score = (1, 2))
+            assert solver.solve(hands, 0, team = (0,), trump_from_lead = True, misere = True) == expected
+
+    def test_trump(self):
+        """
+        切り札の強さのテスト
+
+        Note:
+            heart の 2 は、切り札であれば spade の A に勝つ
+        """
+        hands = [Bitboard.from_ids([get_card_id(1, Suit.spade)]).mask,
+                 Bitboard.from_ids([get_card_id(2, Suit.heart)]).mask]
+        solver = DoubleDummySolver()
+        assert solver.solve(hands, 0, trump = int(Suit.heart)) == 0
+        assert solver.solve(hands, 0, trump = 0) == 1
+        assert solver.solve(hands, 0, trump_from_lead = True) == 1
+
+    def test_evaluate_moves(self):
+        """
+        出せるカードごとの評価のテスト
+
+        Note:
+            K♠ に対して A♠ を出せば 2 トラックともとれる、2♠ を出せば台札の 5♣ にも負ける
+        """
+        hands = [Bitboard.from_ids([get_card_id(5, Suit.club)]).mask,
+                 Bitboard.from_ids([get_card_id(1, Suit.spade), get_card_id(2, Suit.spade)]).mask]
+        trick = [(0, get_card_id(13, Suit.spade))]
+        values = DoubleDummySolver().evaluate_moves(hands, trick, 1, trump = int(Suit.heart))
+
+        assert values[get_card_id(1, Suit.spade)] == 2
+        assert values[get_card_id(2, Suit.spade)] == 0
+
+    @pytest.mark.parametrize("seat_num, hand_num, use_lead, misere", [
+        (2, 4, True, False),
+        (3, 4, True, False),
+        (3, 3, True, True),
+        (3, 3, False, False),
+    ])
+    def test_mid_trick_same_as_minimax(self, seat_num, hand_num, use_lead, misere):
+        """
+        トラックの途中の局面から、solve_trick と evaluate_moves が全ての手を調べた結果と同じになることのテスト
+        """
+        rng = random.Random(seat_num * 100 + hand_num * 10 + misere)
+        solver = DoubleDummySolver(use_lead = use_lead)
+        for _ in range(30):
+            leader = rng.randrange(seat_num)
+            hands, trick, seat = random_trick(rng, random_hands(rng, seat_num, hand_num, 54),
+                                              leader, rng.randrange(1, seat_num), use_lead)
+            trump = rng.randrange(len(Suit) + 1)
+            team = (seat,) if seat_num == 2 else tuple(rng.sample(range(seat_num), rng.randint(1, 2)))
+            score = tuple(i for i in range(seat_num) if i not in team) if misere else team
+
+            expected = minimax(hands, trick, seat, trump, team, use_lead, False, score)
+            assert solver.solve_trick(hands, trick, seat, trump, team, misere = misere) == expected
+
+            values = solver.evaluate_moves(hands, trick, seat, trump, team, misere = misere)
+            lead = CARD_SUIT_INDEX_TABLE[trick[0][1]] if use_lead else 0
+            assert set(values) == set(Bitboard(hands[seat] & SUIT_MASKS[lead] or hands[seat]))
+            for card_id, value in values.items():
+                next_hands = list(hands)
+                next_hands[seat] ^= 1 << card_id
+                assert value == minimax(next_hands, trick + [(seat, card_id)], (seat + 1) % seat_num,
+                                        trump, team, use_lead, False, score)
+            # 最善の手の値は、局面の値と同じ
+            best = max(values.values()) if seat in team else min(values.values())
+            assert best == expected
+
+    def test_evaluate_moves_with_trump_from_lead(self):
+        """
+        最初の台札で切り札が決まる場合の、出せるカードごとの評価のテスト
+        """
+        rng = random.Random(2)
+        solver = DoubleDummySolver()
+        for _ in range(20):
+            hands = random_hands(rng, 3, 4)
+            values = solver.evaluate_moves(hands, [], 0, team = (0,), trump_from_lead = True)
+            for card_id, value in values.items():
+                next_hands = list(hands)
+                next_hands[0] ^= 1 << card_id
+                assert value == minimax(next_hands, [(0, card_id)], 1, CARD_SUIT_INDEX_TABLE[card_id], (0,), True, False)
+            assert max(values.values()) == minimax(hands, [], 0, -1, (0,), True, True)
+
+    def test_max_table_size(self):
+        """
+        置換表が上限を超えたら空にされることのテスト
+        """
+        rng = random.Random(0)
+        solver = DoubleDummySolver(max_table_size = 10)
+        for _ in range(20):
+            solver.solve(random_hands(rng, 3, 5), 0, trump_from_lead = True)
+            assert len(solver.table) < 200
@@ -0,0 +1,100 @@
+from pathlib import Path
+import pytest
+import sys
+
+FILE_DIR = Path(__file__).parent.absolute()
+PROJECT_DIR = FILE_DIR.parent.parent.absolute()
+sys.path.append(str(PROJECT_DIR))
+
+from src.game import (
+    EasyNapVSShizuka,
+    NapVSShizuka,
+    GameResult,
+    TournamentStats,
+    Tournament,
+)
+
+class TestTournamentStats:
+    """
+    TournamentStats class のテスト
+    """
+    def test_add(self):
+        """
+        集計のテスト
+        """
+        stats = TournamentStats()
+        stats.add(GameResult("EasyNapGame", ("Boss", "You"), (3, 2), winner = "Boss"))
+        stats.add(GameResult("NapGame", ("Boss", "You"), (0, 0), invalid = True))
+        stats.add(GameResult("NapGame", ("Boss", "You"), (2, 3),
+                             declarer = "You", declaration = "three",
+                             is_achieved = True, game_point = 3))
+        stats.add(GameResult("NapGame", ("Boss", "You"), (4, 1),
+                             declarer = "You", declaration = "two",
+                             is_achieved = False, game_point = -2))
+
+        assert stats.game_num == 4
+        assert stats.valid_num == 3
+        assert stats.wins == {"Boss": 2, "You": 1}
+        assert stats.points == {"Boss": 9, "You": 6}
+        assert stats.game_points == {"You": 1}
+        assert stats.win_rate("Boss") == 2 / 3
+        assert stats.mean_point("You") == 2
+        assert stats.achievement_rate("You") == 0.5
+        assert stats.achievement_rate("Boss") == 0.0
+
+        # 足し合わせても、0 以下のゲームの点数は残る
+        lose_stats = TournamentStats()
+        lose_stats.add(GameResult("NapGame", ("Boss", "You"), (5, 0),
+                                  declarer = "You", declaration = "nap",
+                                  is_achieved = False, game_point = -10))
+        merged_stats = TournamentStats()
+        merged_stats += lose_stats
+        merged_stats += stats
+        assert merged_stats.game_points == {"You": -9}
+        assert merged_stats.points == {"Boss": 14, "You": 6}
+
+    def test_merge(self):
+        """
+        集計を足し合わせることのテスト
+        """
+        stats_01 = TournamentStats()
+        stats_01.add(GameResult("EasyNapGame", ("Boss", "You"), (3, 2), winner = "Boss"))
+        stats_02 = TournamentStats()
+        stats_02.add(GameResult("EasyNapGame", ("Boss", "You"), (1, 4), winner = "You"))
+
+        stats = stats_01 + stats_02
+        assert stats.game_num == 2
+        assert stats.wins == {"Boss": 1, "You": 1}
+        assert stats_01.game_num == 1
+
+class TestTournament:
+    """
+    Tournament class のテスト
+    """
+    def test_run(self):
+        """
+        プロセスの数に関わらず、同じ集計になることのテスト
+        """
+        stats_01 = Tournament(EasyNapVSShizuka, seed = 0, chunk_size = 25, max_workers = 1).run(100)
+        stats_02 = Tournament(EasyNapVSShizuka, seed = 0, chunk_size = 25, max_workers = 2).run(100)
+
+        assert stats_01.game_num == 100
+        assert sum(stats_01.wins.values()) == 100
+        assert sum(stats_01.points.values()) == 100 * EasyNapVSShizuka.hand_num
+        assert stats_01 == stats_02
+
+    def test_run_with_bid(self):
+        """
+        ビッドを行うゲームの集計のテスト
+        """
+        stats = Tournament(NapVSShizuka, seed = 0, chunk_size = 5, max_workers = 2).run(10)
+
+        assert stats.game_num == 10
+        assert sum(stats.declarations.values()) == stats.valid_num
+
+    def test_chunk_size(self):
+        """
+        chunk_size が異常な場合のテスト
+        """
+        with pytest.raises(ValueError):
+            Tournament(EasyNapVSShizuka, chunk_size = 0)
@@ -0,0 +1,141 @@
+import random
+import pytest
+
+from src.utils import (
+    Card,
+    Suit,
+    SimpleDeck,
+)
+from src.field import Field
+from src.player import (
+    Player,
+    MonteCarloPlayer,
+)
+from src.player import monte_carlo
+from src.game import (
+    EasyNapGame,
+    NapGame,
+    Simulator,
+)
+
+class EasyNapVSMonte(EasyNapGame):
+    """
+    MonteCarloPlayer とランダムな CPU の対戦
+    """
+    def _set_player(self, how_to_choose: str = "input") -> list[Player]:
+        return [MonteCarloPlayer("Monte", rollout_num = 20, time_budget = 1.0), Player("Boss", cpu = True)]
+
+class NapVSMonte(NapGame):
+    """
+    MonteCarloPlayer を含む Nap
+    """
+    def _set_player(self, how_to_choose: str = "input") -> list[Player]:
+        return [MonteCarloPlayer("Monte", rollout_num = 10, time_budget = 1.0), Player("A", cpu = True), Player("B", cpu = True)]
+
+def make_field(monte: MonteCarloPlayer) -> Field:
+    """
+    Other が K♠ を出した後のフィールドを準備する
+
+    Note:
+        Monte の手札は A♠, 2♠ (切り札は heart)
+    """
+    other = Player("Other", cpu = True)
+    field = Field(SimpleDeck(display = False), [other, monte])
+    field.trump = Suit.heart
+    field.is_use_lead = True
+
+    monte.take_hand([Card(1, Suit.spade), Card(2, Suit.spade)])
+    other.take_hand([Card(5, Suit.club)])
+    field.put_card("Other", Card(13, Suit.spade))
+    return field
+
+class TestMonteCarloPlayer:
+    """
+    MonteCarloPlayer class のテスト
+    """
+    def test_play_card(self):
+        """
+        勝てるカードを選ぶことのテスト
+        """
+        monte = MonteCarloPlayer(rollout_num = 50, rng = random.Random(0))
+        field = make_field(monte)
+
+        card = monte.play_card(lead_suit = field.lead, field = field)
+        assert card.card_id == Card(1, Suit.spade).card_id
+        assert [c.card_id for c in monte.cards] == [Card(2, Suit.spade).card_id]
+        assert len(monte.hand_board) == 1
+
+    def test_make_state(self):
+        """
+        見えている情報のテスト
+        """
+        monte = MonteCarloPlayer()
+        field = make_field(monte)
+        state = monte.make_state(field)
+
+        assert state.seat == 1
+        assert state.hand_nums == (1, 2)
+        assert len(state.unseen) == 52 - 3
+        assert state.trick == ((0, Card(13, Suit.spade).card_id),)
+        assert state.trump == int(Suit.heart)
+        assert state.team == (1,)
+
+    def test_without_field(self):
+        """
+        field がなければ、ランダムに選ぶことのテスト
+        """
+        monte = MonteCarloPlayer(rng = random.Random(0))
+        monte.take_hand([Card(1, Suit.spade), Card(2, Suit.club)])
+        card = monte.play_card()
+        assert card.card_id in [Card(1, Suit.spade).card_id, Card(2, Suit.club).card_id]
+
+    def test_parallel(self):
+        """
+        ワーカーのプロセスを利用しても、勝てるカードを選ぶことのテスト
+        """
+        monte = MonteCarloPlayer(rollout_num = 40, time_budget = 5.0, max_workers = 2, rng = random.Random(0))
+        field = make_field(monte)
+        card = monte.play_card(lead_suit = field.lead, field = field)
+        assert card.card_id == Card(1, Suit.spade).card_id
+
+    def test_shutdown_executors(self):
+        """
+        プロセスのプールを終了させ、次に必要になったら作成し直すことのテスト
+        """
+        monte = MonteCarloPlayer(rollout_num = 4, time_budget = 5.0, max_workers = 2, rng = random.Random(0))
+        field = make_field(monte)
+        monte.play_card(lead_suit = field.lead, field = field)
+        executor = monte_carlo._executors[2]
+        processes = list(executor._processes.values())
+        assert processes
+
+        monte_carlo.shutdown_executors()
+        assert monte_carlo._executors == {}
+        assert all(not process.is_alive() for process in processes)
+
+        monte = MonteCarloPlayer(rollout_num = 4, time_budget = 5.0, max_workers = 2, rng = random.Random(0))
+        field = make_field(monte)
+        card = monte.play_card(lead_suit = field.lead, field = field)
+        assert card.card_id == Card(1, Suit.spade).card_id
+        assert monte_carlo._executors[2] is not executor
+        monte_carlo.shutdown_executors()
+
+    @pytest.mark.parametrize("game_class", [EasyNapVSMonte, NapVSMonte])
+    def test_game(self, game_class):
+        """
+        ゲームを最後まで行えることのテスト
+        """
+        simulator = Simulator(game_class, seed = 0)
+        for result in simulator.run(5):
+            assert result.invalid or sum(result.points) == game_class.hand_num
+
+    def test_stronger_than_random(self):
+        """
+        ランダムな CPU より多くのトリックをとることのテスト
+        """
+        simulator = Simulator(EasyNapVSMonte, seed = 1)
+        points = [0, 0]
+        for result in simulator.run(40):
+            points = [p + q for p, q in zip(points, result.points)]
+
+        assert points[0] > points[1]
@@ -1,5 +1,9 @@
 import pytest
 
+from src.utils import (
+    Card,
+    Suit,
+)
 from src.player import (
     Player,
 )
@@ -28,4 +32,35 @@ class TestPlayer:
         """
         check_cards_can_submit メソッドのテスト
         """
-        cpu_player.check_cards_can_submit()
\ No newline at end of file
+        cpu_player.check_cards_can_submit()
+
+    def test_play_card_follow_suit(self, cpu_player: Player):
+        """
+        CPU が台札のスートに従ってカードを出すことのテスト
+        """
+        hand = [Card(n, Suit.club) for n in range(2, 6)] + [Card(9, Suit.heart)]
+        for _ in range(20):
+            cpu_player.take_hand(hand)
+            card = cpu_player.play_card(lead_suit = Suit.heart)
+            assert str(card) == "♥-9"
+            assert len(cpu_player.cards) == 4
+            assert len(cpu_player.hand_board) == 4
+
+    def test_pop_card_id(self, cpu_player: Player):
+        """
+        pop_card_id メソッドのテスト
+
+        Note:
+            手札にないカードは、他のカードを取り出さずにエラーとする
+        """
+        with pytest.raises(ValueError):
+            cpu_player.pop_card_id(Card(1, Suit.spade).card_id)
+
+        cpu_player.take_hand([Card(2, Suit.club), Card(9, Suit.heart)])
+        card = cpu_player.pop_card_id(Card(2, Suit.club).card_id)
+        assert str(card) == "♣-2"
+
+        with pytest.raises(ValueError):
+            cpu_player.pop_card_id(Card(1, Suit.spade).card_id)
+        assert [str(card) for card in cpu_player.cards] == ["♥-9"]
+        assert len(cpu_player.hand_board) == 1
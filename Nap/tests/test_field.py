@@ -17,7 +17,8 @@ from src.utils import (
 )
 
 from src.field import (
-    Field
+    Field,
+    FieldRenderer,
 )
 
 from src.player import (
@@ -222,6 +223,53 @@ class TestField:
 
         assert str(field_two_cpu_payers) == FIELD_STR_CASE_03
 
+    def test_str_incremental(self, field_two_cpu_payers: Field, monkeypatch: MonkeyPatch, hand_num: int = 3) -> None:
+        """
+        文字列を表示するメソッドを繰り返し実行した時のテスト
+
+        Args:
+            field_two_cpu_payers (Field): フィールのクラス
+            monkeypatch (MonkeyPatch): 区画の作成の回数を数えるためのツール
+            hand_num (int): 配る枚数
+
+        Note:
+            確認する状態
+                1. 状態が変わった時は、表示が更新されること
+                2. プレイヤーの区画は、手札が変わったプレイヤーのみ作り直すこと
+        """
+        field = field_two_cpu_payers
+        assert str(field) == FIELD_STR_CASE_01
+
+        field.deck.shuffle()
+        field.trump = Suit.spade
+        assert str(field) == FIELD_STR_CASE_02
+
+        cpu_hands = [
+            [Card(num = n, suit = Suit.heart) for n in range(1, 1 + hand_num)],
+            [Card(num = n, suit = Suit.heart) for n in range(4, 4 + hand_num)],
+        ]
+        my_hand = [Card(num = n, suit = Suit.spade) for n in range(4, 4 + hand_num)]
+        for player in field.players:
+            hand = cpu_hands.pop(0) if player.cpu else my_hand
+            player.take_hand(field.deck.pull_out(hand))
+        assert str(field) == FIELD_STR_CASE_03
+
+        made_players = []
+        make_player = FieldRenderer._make_player
+        def spy_make_player(renderer, player, declaration):
+            made_players.append(player)
+            return make_player(renderer, player, declaration)
+        monkeypatch.setattr(FieldRenderer, "_make_player", spy_make_player)
+
+        str(field)
+        assert made_players == []
+
+        player = field.players[0]
+        field.put_card(player.name, player.play_card())
+        field_str = str(field)
+        assert made_players == [player]
+        assert f"{player.name}: {field.cards[player.name]}" in field_str
+
     def test_str_with_takeshi(self, field_with_takeshi: Field) -> None:
         """
         文字列を表示するメソッドのテスト
@@ -265,6 +313,30 @@ class TestField:
                                                     player_name = str(player.name))
                 assert str(field_with_takeshi) == expected
 
+    def test_lead(self, field_two_cpu_payers: Field) -> None:
+        """
+        台札とスートの強さのテスト
+
+        Note:
+            台札は最初に出されたカードで決まり、clear で戻る
+        """
+        field = field_two_cpu_payers
+        field.trump = Suit.heart
+        assert field.lead is None
+
+        field.put_card("A", Card(5, Suit.club))
+        field.put_card("B", Card(1, Suit.spade))
+        assert field.lead == Suit.club
+        assert [field.suit_strength(suit) for suit in [Suit.heart, Suit.club, Suit.spade, Suit.diamond, None]] == [6, 5, 4, 2, 0]
+        assert field.strength_row()[Card(1, Suit.spade).card_id] < field.strength_row()[Card(2, Suit.club).card_id]
+        assert field.strength_row(use_lead = False)[Card(1, Suit.spade).card_id] > field.strength_row(use_lead = False)[Card(2, Suit.club).card_id]
+
+        field.clear()
+        assert field.lead is None
+
+        field.cards = {"B": Card(3, Suit.diamond)}
+        assert field.lead == Suit.diamond
+
     def test_image_outout(self, data_dir: str, players: Callable[[list[str]], list[Player]]) -> None:
         """
         画像を保存するメソッドのテスト
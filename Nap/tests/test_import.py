@@ -0,0 +1,41 @@
+from pathlib import Path
+import pytest
+import subprocess
+import sys
+
+FILE_DIR = Path(__file__).parent.absolute()
+PROJECT_DIR = FILE_DIR.parent.absolute()
+
+class TestImport:
+    """
+    パッケージの import のテスト
+    """
+    @pytest.mark.parametrize("module", ["src", "src.utils", "src.bid", "src.field", "src.game"])
+    def test_no_heavy_modules(self, module):
+        """
+        import した時に、重い依存パッケージを読み込まないことのテスト
+
+        Note:
+            既に読み込まれているパッケージの影響を受けないように、新しいプロセスで確認する
+        """
+        code = (
+            "import sys\n"
+            f"import {module}\n"
+            "print(','.join(m for m in ['pandas', 'PIL', 'numpy'] if m in sys.modules))\n"
+        )
+        completed = subprocess.run([sys.executable, "-c", code],
+                                   cwd = PROJECT_DIR, capture_output = True, text = True, check = True)
+        assert completed.stdout.strip() == ""
+
+    def test_lazy_dealer(self):
+        """
+        Dealer は参照した時に import されることのテスト
+        """
+        code = (
+            "import sys\n"
+            "import src.utils\n"
+            "assert 'numpy' not in sys.modules\n"
+            "from src.utils import Dealer\n"
+            "assert 'numpy' in sys.modules\n"
+        )
+        subprocess.run([sys.executable, "-c", code], cwd = PROJECT_DIR, check = True)
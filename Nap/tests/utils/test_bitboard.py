@@ -0,0 +1,87 @@
+from pathlib import Path
+import pytest
+import sys
+
+filedir = Path(__file__).parent.absolute()
+parentdir = filedir.parent.absolute()
+sys.path.append(str(parentdir))
+
+from src.utils import (
+    Bitboard,
+    Card,
+    Suit,
+)
+
+@pytest.fixture()
+def board() -> Bitboard:
+    """
+    ♠-A, ♠-2, ♥-K, ♣-5 を持つマスク
+    """
+    cards = [
+        Card(1, Suit.spade),
+        Card(2, Suit.spade),
+        Card(13, Suit.heart),
+        Card(5, Suit.club),
+    ]
+    return Bitboard.from_cards(cards)
+
+class TestBitboard:
+    """
+    Bitboard class のテスト
+    """
+    def test_len(self, board: Bitboard):
+        """
+        枚数のテスト
+        """
+        assert len(board) == 4
+        assert len(Bitboard()) == 0
+
+    def test_contains(self, board: Bitboard):
+        """
+        カードを含んでいるかどうかのテスト
+        """
+        assert Card(1, Suit.spade) in board
+        assert Card(1, Suit.spade).card_id in board
+        assert Card(1, Suit.heart) not in board
+
+    def test_has_suit(self, board: Bitboard):
+        """
+        スートを持っているかどうかのテスト
+        """
+        assert board.has_suit(Suit.spade)
+        assert board.has_suit(Suit.heart)
+        assert not board.has_suit(Suit.diamond)
+        assert board.has_suit(Suit.club)
+
+    def test_legal_moves(self, board: Bitboard):
+        """
+        出すことができるカードのテスト
+        """
+        spades = [str(c) for c in board.legal_moves(Suit.spade).cards()]
+        assert spades == ["♠-2", "♠-A"]
+
+        # 台札のスートがなければ、全てのカードを出せる
+        assert board.legal_moves(Suit.diamond) == board
+        assert board.legal_moves(None) == board
+
+    def test_add_remove(self, board: Bitboard):
+        """
+        カードの追加と削除のテスト
+        """
+        card = Card(7, Suit.diamond)
+        board.add(card)
+        assert card in board
+        assert len(board) == 5
+
+        board.remove(card)
+        assert card not in board
+
+        with pytest.raises(ValueError):
+            board.remove(card)
+
+    def test_iter(self, board: Bitboard):
+        """
+        id の順に取り出せることのテスト
+        """
+        assert list(board) == sorted(board.card_ids())
+        assert [Card.from_id(i) for i in board] == board.cards()
@@ -0,0 +1,93 @@
+from pathlib import Path
+import itertools
+import random
+import sys
+
+FILE_DIR = Path(__file__).parent.absolute()
+PROJECT_DIR = FILE_DIR.parent.parent.absolute()
+sys.path.append(str(PROJECT_DIR))
+
+from src.utils import (
+    Suit,
+    Bitboard,
+    LRUCache,
+    get_card_id,
+    permute_suits,
+    canonical_hands,
+    canonical_hand,
+)
+
+class TestCanonical:
+    """
+    手札の標準形のテスト
+    """
+    def test_suit_isomorphic(self):
+        """
+        スートを入れ替えた手札は、全て同じ標準形になることのテスト
+        """
+        rng = random.Random(0)
+        for _ in range(20):
+            hand = Bitboard.from_ids(rng.sample(range(52), 5)).mask
+            canonical = canonical_hand(hand)
+            for permutation in itertools.permutations([1, 2, 3, 4]):
+                permuted = permute_suits(hand, permutation)
+                assert len(Bitboard(permuted)) == 5
+                assert canonical_hand(permuted) == canonical
+
+    def test_different_hands(self):
+        """
+        スートの入れ替えで同じにならない手札は、違う標準形になることのテスト
+        """
+        hand_a = Bitboard.from_ids([get_card_id(1, Suit.spade), get_card_id(2, Suit.spade)]).mask
+        hand_b = Bitboard.from_ids([get_card_id(1, Suit.spade), get_card_id(2, Suit.heart)]).mask
+        assert canonical_hand(hand_a) != canonical_hand(hand_b)
+
+    def test_canonical_hands(self):
+        """
+        複数の席の手札は、同じ入れ替えで標準形になることのテスト
+        """
+        hands = (Bitboard.from_ids([get_card_id(1, Suit.club)]).mask,
+                 Bitboard.from_ids([get_card_id(2, Suit.club)]).mask)
+        swapped = (Bitboard.from_ids([get_card_id(1, Suit.heart)]).mask,
+                   Bitboard.from_ids([get_card_id(2, Suit.heart)]).mask)
+        other = (Bitboard.from_ids([get_card_id(1, Suit.club)]).mask,
+                 Bitboard.from_ids([get_card_id(2, Suit.heart)]).mask)
+
+        assert canonical_hands(hands) == canonical_hands(swapped)
+        assert canonical_hands(hands) != canonical_hands(other)
+
+    def test_joker(self):
+        """
+        ジョーカーはそのままであることのテスト
+        """
+        hand = Bitboard.from_ids([get_card_id(3, Suit.diamond), 52, 53]).mask
+        assert canonical_hand(hand) & Bitboard.from_ids([52, 53]).mask == Bitboard.from_ids([52, 53]).mask
+
+class TestLRUCache:
+    """
+    LRUCache class のテスト
+    """
+    def test_evict(self):
+        """
+        上限を超えたら、最も長く参照されていない値が削除されることのテスト
+        """
+        cache = LRUCache(max_size = 2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        assert cache.get("a") == 1
+        cache.put("c", 3)
+
+        assert "a" in cache
+        assert "b" not in cache
+        assert len(cache) == 2
+
+    def test_get_or_compute(self):
+        """
+        なければ計算し、あれば計算しないことのテスト
+        """
+        cache = LRUCache(max_size = 4)
+        calls = []
+        assert cache.get_or_compute("a", lambda: calls.append(1) or 10) == 10
+        assert cache.get_or_compute("a", lambda: calls.append(1) or 20) == 10
+        assert len(calls) == 1
+        assert (cache.hit_num, cache.miss_num) == (1, 1)
@@ -6,9 +6,14 @@ filedir = Path(__file__).parent.absolute()
 parentdir = filedir.parent.absolute()
 sys.path.append(str(parentdir))
 
+from pydantic import ValidationError
+
 from src.utils import (
     Card,
     Suit,
+    get_card_id,
+    SUIT_POWER_UNIT,
+    STRENGTH_TABLE,
 )
 
 class TestCard:
@@ -90,4 +95,73 @@ def test_card_is_joker():
 
 def test_card_path():
     card = Card(num=1, suit=Suit.heart)
-    assert card.image_path.exists()
\ No newline at end of file
+    assert card.image_path.exists()
+
+class TestCardId:
+    """
+    カードの id のテスト
+    """
+    def test_get_card_id(self):
+        """
+        カードの id の計算のテスト
+        """
+        assert get_card_id(2, Suit.club) == 0
+        assert get_card_id(1, Suit.club) == 12
+        assert get_card_id(2, Suit.diamond) == 13
+        assert get_card_id(1, Suit.spade) == 51
+        assert get_card_id(16, None, joker = 1) == 52
+        assert get_card_id(15, None, joker = 2) == 53
+
+    def test_from_id(self):
+        """
+        id から作成したカードが、コンストラクタで作成したカードと一致することのテスト
+        """
+        for num in range(1, 14):
+            for suit in Suit:
+                card = Card(num, suit)
+                card_from_id = Card.from_id(card.card_id)
+                assert str(card_from_id) == str(card)
+                assert card_from_id.image_url == card.image_url
+                assert card_from_id.image_path == card.image_path
+
+        assert str(Card.from_id(52)) == "Joker (strong)"
+        assert str(Card.from_id(53)) == "Joker (weak)"
+
+    def test_interned(self):
+        """
+        from_id で取得するカードが共有されていることのテスト
+        """
+        assert Card.from_id(51) is Card.from_id(51)
+
+    def test_frozen(self):
+        """
+        カードが変更できないことのテスト
+        """
+        card = Card.from_id(0)
+        with pytest.raises(ValidationError):
+            card.num = 3
+
+    def test_unhashable(self):
+        """
+        スートの違うカードが同じにならないように、カードはハッシュできないことのテスト
+        """
+        with pytest.raises(TypeError):
+            {Card(5, Suit.heart), Card(5, Suit.spade)}
+        assert len({card.card_id for card in [Card(5, Suit.heart), Card(5, Suit.spade)]}) == 2
+
+    def test_strength_table(self):
+        """
+        [切り札][台札][カードの id] の強さの表のテスト
+        """
+        assert len(STRENGTH_TABLE) == 5
+        assert all(len(row) == 54 for lead_table in STRENGTH_TABLE for row in lead_table)
+
+        row = STRENGTH_TABLE[int(Suit.heart)][int(Suit.club)]
+        assert divmod(row[Card(1, Suit.heart).card_id], SUIT_POWER_UNIT) == (6, 14)
+        assert divmod(row[Card(2, Suit.club).card_id], SUIT_POWER_UNIT) == (5, 2)
+        assert divmod(row[Card(13, Suit.spade).card_id], SUIT_POWER_UNIT) == (4, 13)
+        assert divmod(row[Card(10, Suit.diamond).card_id], SUIT_POWER_UNIT) == (2, 10)
+        assert max(row[52], row[53]) < min(row[:52])
+
+        # 切り札、台札なし
+        assert STRENGTH_TABLE[0][0][Card(1, Suit.spade).card_id] > STRENGTH_TABLE[0][0][Card(13, Suit.spade).card_id]
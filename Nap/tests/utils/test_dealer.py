@@ -0,0 +1,57 @@
+from pathlib import Path
+import pytest
+import sys
+
+FILE_DIR = Path(__file__).parent.absolute()
+PROJECT_DIR = FILE_DIR.parent.parent.absolute()
+sys.path.append(str(PROJECT_DIR))
+
+from src.utils import (
+    Deck,
+    SimpleDeck,
+    Dealer,
+)
+
+class TestDealer:
+    """
+    Dealer class のテスト
+    """
+    @pytest.mark.parametrize("deck_class, card_num", [(Deck, 54), (SimpleDeck, 52)])
+    def test_deal_batch(self, deck_class, card_num):
+        """
+        deal_batch のテスト
+
+        Note:
+            各行がデッキのカードの並べ替えになっていること
+        """
+        dealer = Dealer(deck_class, seed = 0)
+        deals = dealer.deal_batch(100)
+
+        assert len(dealer) == card_num
+        assert deals.shape == (100, card_num)
+
+        card_ids = sorted(card.card_id for card in deck_class(display = False).cards)
+        for deal in deals:
+            assert sorted(deal.tolist()) == card_ids
+
+    def test_seed(self):
+        """
+        同じシードであれば、同じ配り方になることのテスト
+        """
+        deals_01 = Dealer(seed = 1).deal_batch(10)
+        deals_02 = Dealer(seed = 1).deal_batch(10)
+        deals_03 = Dealer(seed = 2).deal_batch(10)
+
+        assert (deals_01 == deals_02).all()
+        assert not (deals_01 == deals_03).all()
+
+    def test_arrange(self):
+        """
+        配り方をデッキに並べることのテスト
+        """
+        deal = Dealer(seed = 3).deal_batch(1)[0]
+        deck = Deck(display = False)
+        deck.arrange(deal)
+
+        assert [card.card_id for card in deck.cards] == deal.tolist()
+        assert deck.deal(1)[0].card_id == deal[-1]
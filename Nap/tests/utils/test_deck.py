@@ -1,5 +1,6 @@
 from pathlib import Path
 import pytest
+import random
 import sys
 
 filedir = Path(__file__).parent.absolute()
@@ -10,6 +11,12 @@ from src.utils import (
     Card,
     Suit,
     Deck,
+    SimpleDeck,
+    get_card_id,
+)
+from src.utils.deck import (
+    DECK_TEMPLATE,
+    SIMPLE_DECK_TEMPLATE,
 )
 
 class TestDeck:
@@ -36,6 +43,50 @@ class TestDeck:
         """
         deck = Deck()
         deck.shuffle()
+
+    def test_shuffle_with_rng(self):
+        """
+        乱数生成器を指定した shuffle のテスト
+        """
+        deck_01 = Deck()
+        deck_02 = Deck()
+        deck_01.shuffle(rng = random.Random(0))
+        deck_02.shuffle(rng = random.Random(0))
+
+        card_ids_01 = [card.card_id for card in deck_01.cards]
+        card_ids_02 = [card.card_id for card in deck_02.cards]
+        assert card_ids_01 == card_ids_02
+        assert card_ids_01 != [card.card_id for card in DECK_TEMPLATE]
+
+    def test_arrange_invalid(self):
+        """
+        デッキにないカードを並べようとした場合のテスト
+        """
+        deck = SimpleDeck()
+        card_ids = [card.card_id for card in DECK_TEMPLATE]
+        with pytest.raises(ValueError):
+            deck.arrange(card_ids[2:])
+
+        assert [card.card_id for card in deck.cards] == [card.card_id for card in SIMPLE_DECK_TEMPLATE]
+
+    def test_independent_cards(self):
+        """
+        デッキごとにカードのリストが独立していることのテスト
+        """
+        deck_01 = Deck()
+        deck_02 = Deck()
+        assert deck_01.cards is not deck_02.cards
+
+        deck_01.shuffle()
+        deck_01.deal(10)
+        assert len(deck_02) == 54
+        assert [c.card_id for c in deck_02.cards] == [c.card_id for c in DECK_TEMPLATE]
+        assert len(DECK_TEMPLATE) == 54
+
+        simple_deck = SimpleDeck()
+        assert len(simple_deck) == 52
+        assert simple_deck.cards is not SimpleDeck().cards
+        assert list(SIMPLE_DECK_TEMPLATE) == simple_deck.cards
         
     def test_deal(self):
         """
@@ -55,7 +106,42 @@ class TestDeck:
 
         target = Card(num = 1, suit = Suit.spade)
         deck.pull_out([target])
-        assert str(deck) == str(['♥-A', '♦-A', '♣-A', '♠-2'])
+        # 末尾のカードと入れ替えて削除する
+        assert str(deck) == str(['♠-2', '♥-A', '♦-A', '♣-A'])
 
         with pytest.raises(ValueError):
-            deck.pull_out([target])
\ No newline at end of file
+            deck.pull_out([target])
+
+    def test_pull_out_ids(self):
+        """
+        pull_out_ids method のテスト
+        """
+        deck = Deck()
+        deck.shuffle()
+        targets = [get_card_id(n, Suit.club) for n in range(1, 4)]
+
+        cards = deck.pull_out_ids(targets)
+        assert [c.card_id for c in cards] == targets
+        assert len(deck) == 51
+        for card_id in targets:
+            assert card_id not in deck.board
+
+        # 存在しないカードを含む場合、デッキは変更されない
+        with pytest.raises(ValueError):
+            deck.pull_out_ids([get_card_id(5, Suit.club), targets[0]])
+        assert len(deck) == 51
+
+    def test_pull_out_after_deal(self):
+        """
+        deal で引いた後でも、索引からカードを引き抜けることのテスト
+        """
+        deck = Deck()
+        deck.pull_out_ids([0])
+        hand = deck.deal(3)
+
+        with pytest.raises(ValueError):
+            deck.pull_out(hand[:1])
+
+        rest = deck.pull_out_ids([c.card_id for c in deck.cards[:10]])
+        assert len(rest) == 10
+        assert len(deck) == 40
\ No newline at end of file
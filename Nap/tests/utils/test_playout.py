@@ -0,0 +1,84 @@
+from pathlib import Path
+import random
+import sys
+
+FILE_DIR = Path(__file__).parent.absolute()
+PROJECT_DIR = FILE_DIR.parent.parent.absolute()
+sys.path.append(str(PROJECT_DIR))
+
+from src.utils import (
+    Suit,
+    Bitboard,
+    get_card_id,
+)
+
+from src.utils.playout import (
+    random_card_id,
+    trick_winner,
+    random_playout,
+)
+
+class TestPlayout:
+    """
+    ビットマスクのプレイアウトのテスト
+    """
+    def test_random_card_id(self):
+        """
+        マスクに含まれるカードのみ選ばれることのテスト
+        """
+        rng = random.Random(0)
+        mask = Bitboard.from_ids([3, 17, 40, 52]).mask
+        chosen = {random_card_id(mask, rng) for _ in range(200)}
+        assert chosen == {3, 17, 40, 52}
+
+    def test_trick_winner(self):
+        """
+        トラックの勝者のテスト
+        """
+        trick = [(1, get_card_id(2, Suit.club)), (2, get_card_id(1, Suit.spade)), (0, get_card_id(3, Suit.club))]
+        assert trick_winner(trick, 0, use_lead = True) == 0
+        assert trick_winner(trick, 0, use_lead = False) == 2
+        assert trick_winner(trick, int(Suit.club), use_lead = True) == 0
+
+    def test_random_playout(self):
+        """
+        最後までプレイアウトできることのテスト
+
+        Note:
+            獲得トリック数の合計は、残りのトラックの数
+        """
+        rng = random.Random(1)
+        for _ in range(50):
+            card_ids = rng.sample(range(52), 12)
+            hands = [Bitboard.from_ids(card_ids[0:4]).mask,
+                     Bitboard.from_ids(card_ids[4:7]).mask,
+                     Bitboard.from_ids(card_ids[7:11]).mask]
+            trick = [(1, card_ids[11])]
+            points = random_playout(hands, trick, 2, int(Suit.heart), True, rng)
+            assert sum(points) == 4
+
+    def test_last_trick(self):
+        """
+        途中のトラックの勝者が、trick_winner と同じになることのテスト
+        """
+        rng = random.Random(2)
+        for _ in range(200):
+            card_ids = rng.sample(range(52), 3)
+            played = rng.randrange(3)
+            trump = rng.randrange(5)
+            use_lead = rng.random() < 0.5
+            trick = [(seat, card_ids[seat]) for seat in range(played)]
+            hands = [0 if seat < played else 1 << card_ids[seat] for seat in range(3)]
+
+            points = random_playout(hands, trick, played, trump, use_lead, rng)
+            winner = trick_winner([(seat, card_ids[seat]) for seat in range(3)], trump, use_lead)
+            assert points == [int(seat == winner) for seat in range(3)]
+
+    def test_trump_from_lead(self):
+        """
+        最初の台札のスートが切り札になることのテスト
+        """
+        hands = [Bitboard.from_ids([get_card_id(2, Suit.club)]).mask,
+                 Bitboard.from_ids([get_card_id(1, Suit.spade)]).mask]
+        points = random_playout(hands, [], 0, 0, True, random.Random(0), trump_from_lead = True)
+        assert points == [1, 0]
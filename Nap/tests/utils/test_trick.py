@@ -0,0 +1,83 @@
+from pathlib import Path
+import random
+import pytest
+import sys
+
+FILE_DIR = Path(__file__).parent.absolute()
+PROJECT_DIR = FILE_DIR.parent.parent.absolute()
+sys.path.append(str(PROJECT_DIR))
+
+from src.utils import (
+    Suit,
+    Card,
+    get_card_id,
+)
+
+from src.utils.trick import (
+    STRENGTH_ARRAY,
+    trick_winners,
+)
+
+from src.game import (
+    SimpleNapGame,
+    EasyNapGame,
+)
+
+class TestTrickWinners:
+    """
+    trick_winners のテスト
+    """
+    @pytest.mark.parametrize("game_class, use_lead", [(SimpleNapGame, False), (EasyNapGame, True)])
+    def test_same_as_game(self, game_class, use_lead):
+        """
+        decide_winner_in_track と同じ勝者になることのテスト
+
+        Note:
+            ランダムなトラックを作成して、1 つずつ比較する
+        """
+        game = game_class(is_headless = True, seed = 0)
+        players = game.field.players
+        rng = random.Random(0)
+
+        tricks, trumps = [], []
+        for _ in range(300):
+            tricks.append(rng.sample(range(52), len(players)))
+            trumps.append(rng.choice(list(Suit)))
+
+        winners = trick_winners(tricks, [int(trump) for trump in trumps], use_lead = use_lead)
+
+        for card_ids, trump, winner in zip(tricks, trumps, winners):
+            game.field.trump = trump
+            game.field.cards = {player.name: Card.from_id(card_id) for player, card_id in zip(players, card_ids)}
+            assert game.decide_winner_in_track() is players[winner]
+
+    def test_lead(self):
+        """
+        台札のルールのテスト
+        """
+        card_ids = [[
+            get_card_id(2, Suit.club),
+            get_card_id(1, Suit.spade),
+            get_card_id(3, Suit.club),
+        ]]
+        assert trick_winners(card_ids, 0).tolist() == [2]
+        assert trick_winners(card_ids, 0, lead = int(Suit.heart)).tolist() == [1]
+        assert trick_winners(card_ids, 0, use_lead = False).tolist() == [1]
+        assert trick_winners(card_ids, int(Suit.club)).tolist() == [2]
+
+    def test_joker(self):
+        """
+        ジョーカーは最も弱いことのテスト
+        """
+        card_ids = [[53, get_card_id(2, Suit.club)], [52, get_card_id(2, Suit.club)]]
+        assert trick_winners(card_ids, int(Suit.spade)).tolist() == [1, 1]
+        assert STRENGTH_ARRAY.shape == (5, 5, 54)
+
+    def test_invalid(self):
+        """
+        不正な入力のテスト
+        """
+        with pytest.raises(ValueError):
+            trick_winners([0, 1, 2], 0)
+        with pytest.raises(ValueError):
+            trick_winners([[0, 54]], 0)
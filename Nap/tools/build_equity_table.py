@@ -0,0 +1,48 @@
+"""
+標準形の手札ごとの獲得トリック数の表を作成する (オフラインで 1 回だけ実行する)
+
+Usage:
+    python tools/build_equity_table.py --players 3 --hand 5 --samples 16 --workers 8
+
+Note:
+    既定の保存先 (asset/equity) に作成すると、NapVSShizuka の CPU の宣言は表から評価される
+"""
+import argparse
+from pathlib import Path
+import sys
+import time
+
+PROJECT_DIR = Path(__file__).parents[1].absolute()
+sys.path.append(str(PROJECT_DIR))
+
+from src.game import build_equity_table
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description = "手札ごとの獲得トリック数の表の作成")
+    parser.add_argument("--players", type = int, default = 3, help = "プレイヤー数")
+    parser.add_argument("--hand", type = int, default = 5, help = "手札の枚数")
+    parser.add_argument("--samples", type = int, default = 16, help = "1 つの手札について、配り直す回数")
+    parser.add_argument("--seed", type = int, default = 0, help = "配り直しのシード")
+    parser.add_argument("--workers", type = int, default = 1, help = "利用するプロセスの数")
+    parser.add_argument("--output", default = None, help = "保存先 (指定がなければ asset/equity)")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+
+    def progress(done_num: int, total_num: int) -> None:
+        if done_num % 1000 == 0 or done_num == total_num:
+            elapsed = time.perf_counter() - start
+            print(f"\r{done_num}/{total_num} hands ({elapsed:.0f} s)", end = "", flush = True)
+
+    path = build_equity_table(args.output,
+                              player_num = args.players,
+                              hand_num = args.hand,
+                              sample_num = args.samples,
+                              seed = args.seed,
+                              max_workers = args.workers,
+                              progress = progress)
+    print()
+    print(f"saved {path} ({path.stat().st_size / 2 ** 20:.1f} MiB)")
+
+if __name__ == "__main__":
+    main()